@@ -0,0 +1,79 @@
+"""
+Benchmark: timestamp backtrack detection in backtrack_analysis.process_csv.
+
+Compares the vectorized detect_backtracks against the original iterrows scan
+on a synthetic full-day 16 Hz timestamp series (1,382,400 rows) that runs past
+midnight and has a few scattered backtracks. The original scan is run on a
+smaller slice and its full-day time is extrapolated linearly.
+
+Usage:
+    python scripts/bench_backtracks.py [--rows N] [--legacy-rows N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from data_processing.backtrack_analysis import detect_backtracks
+
+FULL_DAY_ROWS = 24 * 60 * 60 * 16
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+    # Start at 01:00 on pandas' time-only default date so the series wraps past midnight
+    day_start = pd.Timestamp("1900-01-01").value
+    ts_ns = day_start + (3_600_000_000_000 + np.arange(rows, dtype=np.int64) * 62_500_000) % (86_400 * 10**9)
+    jumps = rng.integers(1, rows, 20)
+    ts_ns[jumps] -= 5_000_000_000
+    return pd.DataFrame({"Timestamp": ts_ns.view("datetime64[ns]")})
+
+
+def legacy_backtracks(df):
+    """The original row-by-row scan."""
+    max_time = pd.Timestamp.min
+    backtracks = []
+    for idx, row in df.iterrows():
+        current_time = row['Timestamp'].time()
+        if current_time < max_time.time() and current_time.hour == 0:
+            backtracks.append((row['Timestamp'], max_time))
+        if row['Timestamp'] < max_time:
+            backtracks.append((row['Timestamp'], max_time))
+        max_time = row['Timestamp']
+    return backtracks
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=FULL_DAY_ROWS)
+    parser.add_argument("--legacy-rows", type=int, default=16 * 60 * 10,
+                        help="Rows for the original scan (extrapolated linearly to --rows)")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    small = df.iloc[:args.legacy_rows]
+
+    legacy_s, expected = timed(lambda: legacy_backtracks(small))
+    assert detect_backtracks(small['Timestamp']) == expected
+
+    vector_s, result = timed(lambda: detect_backtracks(df['Timestamp']))
+    legacy_full_s = legacy_s * args.rows / args.legacy_rows
+    print(f"{args.rows:,} rows, {len(result)} backtracks")
+    print(f"  vectorized {vector_s * 1000:8.1f} ms   "
+          f"iterrows >= {legacy_full_s:6.1f} s (extrapolated from {args.legacy_rows:,} rows)   "
+          f">= {legacy_full_s / vector_s:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: BEBE clip write time and size per ClipFormat.
+
+Writes one synthetic full-day 16 Hz clip (1,382,400 rows) with
+BEBEOutput._write_clip in each format and reports the write time,
+the read-back time and the file size.
+
+Usage:
+    python scripts/bench_bebe_clip_formats.py [--rows N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.output_settings import ClipFormat
+from output_types.bebe_output import BEBEOutput
+
+FULL_DAY_ROWS = 24 * 60 * 60 * 16
+
+
+def make_clip(rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Acc X [g]": rng.normal(0, 0.5, rows).round(3),
+        "Acc Y [g]": rng.normal(0, 0.5, rows).round(3),
+        "Acc Z [g]": rng.normal(-1, 0.5, rows).round(3),
+        "individual_id": 3,
+        "label": np.repeat(rng.integers(0, 6, rows // 160 + 1), 160)[:rows],
+    })
+
+
+def read_clip(path, clip_format):
+    if clip_format == ClipFormat.CSV:
+        return pd.read_csv(path, header=None)
+    if clip_format == ClipFormat.NPZ:
+        with np.load(path) as npz:
+            return {name: npz[name] for name in npz.files}
+    return np.load(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=FULL_DAY_ROWS)
+    args = parser.parse_args()
+
+    clip = make_clip(args.rows)
+    dtypes = BEBEOutput._clip_dtypes({"FEED": 5}, n_individuals=4)
+
+    print(f"{args.rows:,} rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        for clip_format in ClipFormat:
+            path = os.path.join(tmp, f"clip.{clip_format.value}")
+            start = time.perf_counter()
+            BEBEOutput._write_clip(clip, path, clip_format, dtypes)
+            write_s = time.perf_counter() - start
+            start = time.perf_counter()
+            read_clip(path, clip_format)
+            read_s = time.perf_counter() - start
+            print(f"  {clip_format.value:4s} write {write_s * 1000:8.1f} ms   read {read_s * 1000:8.1f} ms   "
+                  f"{os.path.getsize(path) / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
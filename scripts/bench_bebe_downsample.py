@@ -0,0 +1,99 @@
+"""
+Benchmark: BEBEOutput._downsample on a full day of 16 Hz data.
+
+Compares the vectorized downsampler against the original per-group pandas loop
+for AVERAGE, MIN and MAX on a synthetic 24 h 16 Hz frame (1,382,400 rows).
+The original loop is far too slow for a full day, so it is run on a smaller
+frame and its full-day time is extrapolated linearly (a lower bound: each
+group also scans a mask over the whole frame, so it grows quadratically).
+
+Usage:
+    python scripts/bench_bebe_downsample.py [--rows N] [--legacy-rows N] [--ratio N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.output_settings import DownsampleMethod
+from output_types.bebe_output import BEBEOutput
+
+FULL_DAY_ROWS = 24 * 60 * 60 * 16
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Timestamp": pd.date_range("2018-06-08", periods=rows, freq="62500us"),
+        "Acc X [g]": rng.normal(0, 0.5, rows).round(3),
+        "Acc Y [g]": rng.normal(0, 0.5, rows).round(3),
+        "Acc Z [g]": rng.normal(-1, 0.5, rows).round(3),
+        "label": np.repeat(rng.integers(0, 6, rows // 160 + 1), 160)[:rows],
+        "individual_id": 0,
+    })
+
+
+def legacy_downsample(df, method, ratio):
+    """The original per-group loop."""
+    acc_cols = ["Acc X [g]", "Acc Y [g]", "Acc Z [g]"]
+    n_groups = len(df) // ratio
+    trimmed = df.iloc[:n_groups * ratio].copy()
+    group_ids = np.arange(len(trimmed)) // ratio
+    rows = []
+    for g in range(n_groups):
+        group = trimmed[group_ids == g]
+        if method == DownsampleMethod.MIN:
+            acc_values = group[acc_cols].min()
+        elif method == DownsampleMethod.MAX:
+            acc_values = group[acc_cols].max()
+        else:
+            acc_values = group[acc_cols].mean()
+        label_mode = group["label"].mode()
+        rows.append({
+            "Acc X [g]": acc_values["Acc X [g]"],
+            "Acc Y [g]": acc_values["Acc Y [g]"],
+            "Acc Z [g]": acc_values["Acc Z [g]"],
+            "individual_id": group["individual_id"].iloc[0],
+            "label": label_mode.iloc[0] if not label_mode.empty else 0,
+        })
+    return pd.DataFrame(rows)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=FULL_DAY_ROWS)
+    parser.add_argument("--legacy-rows", type=int, default=16 * 60 * 10,
+                        help="Rows for the original loop (extrapolated linearly to --rows)")
+    parser.add_argument("--ratio", type=int, default=16)
+    args = parser.parse_args()
+
+    bebe = BEBEOutput()
+    df = make_frame(args.rows)
+    small = df.iloc[:args.legacy_rows]
+    scale = args.rows / args.legacy_rows
+
+    print(f"{args.rows:,} rows, ratio {args.ratio}")
+    for method in (DownsampleMethod.AVERAGE, DownsampleMethod.MIN, DownsampleMethod.MAX):
+        legacy_s, expected = timed(lambda: legacy_downsample(small, method, args.ratio))
+        pd.testing.assert_frame_equal(bebe._downsample(small, method, args.ratio), expected, check_exact=True)
+
+        vector_s, _ = timed(lambda: bebe._downsample(df, method, args.ratio))
+        legacy_full_s = legacy_s * scale
+        print(f"  {method.value:8s} vectorized {vector_s * 1000:8.1f} ms   "
+              f"loop >= {legacy_full_s:6.1f} s (extrapolated from {args.legacy_rows:,} rows)   "
+              f">= {legacy_full_s / vector_s:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
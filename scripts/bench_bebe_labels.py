@@ -0,0 +1,108 @@
+"""
+Benchmark: BEBE label assignment and buffered-period filtering.
+
+Runs BEBEOutput._assign_labels and BEBEOutput._filter_labeled_with_buffer
+with 500 labels on a synthetic full-day 16 Hz frame (1,382,400 rows) and
+compares them against the original loops, which built one full-length
+boolean mask per label (assignment) or per merged range (filtering).
+
+Usage:
+    python scripts/bench_bebe_labels.py [--rows N] [--labels N] [--buffer-minutes N]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.label import Label
+from output_types.bebe_output import BEBEOutput
+
+FULL_DAY_ROWS = 24 * 60 * 60 * 16
+BEHAVIORS = ["Walk", "Run", "Eat", "Rest", "Groom"]
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        "Timestamp": pd.date_range("2018-06-08", periods=rows, freq="62500us"),
+        "Acc X [g]": np.zeros(rows),
+    })
+
+
+def make_labels(count, rows):
+    rng = np.random.default_rng(0)
+    day_ms = rows * 1000 // 16
+    base = datetime(2018, 6, 8)
+    labels = []
+    for start_ms in np.sort(rng.integers(0, day_ms, count)):
+        start = base + timedelta(milliseconds=int(start_ms))
+        end = start + timedelta(milliseconds=int(rng.integers(1_000, 120_000)))
+        labels.append(Label(start, end, BEHAVIORS[int(rng.integers(0, len(BEHAVIORS)))]))
+    return labels
+
+
+def legacy_assign_labels(df, labels, behavior_to_label_idx):
+    """The original per-label mask loop."""
+    label_col = np.zeros(len(df), dtype=int)
+    row_timestamps = df["Timestamp"].values
+    for label in labels:
+        idx = behavior_to_label_idx.get(label.behavior, 0)
+        if idx == 0:
+            continue
+        mask = ((row_timestamps >= np.datetime64(label.start_time)) &
+                (row_timestamps <= np.datetime64(label.end_time)))
+        label_col[mask] = idx
+    return label_col
+
+
+def legacy_filter_rows(df, ranges):
+    """The original per-range mask loop (range building and merging are unchanged)."""
+    mask = pd.Series(False, index=df.index)
+    for start_dt, end_dt in ranges:
+        mask |= (df["Timestamp"] >= pd.Timestamp(start_dt)) & (df["Timestamp"] <= pd.Timestamp(end_dt))
+    return df[mask].reset_index(drop=True)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=FULL_DAY_ROWS)
+    parser.add_argument("--labels", type=int, default=500)
+    parser.add_argument("--buffer-minutes", type=int, default=0,
+                        help="Buffer for the filter benchmark (0 keeps the ranges from merging together)")
+    args = parser.parse_args()
+
+    bebe = BEBEOutput()
+    df = make_frame(args.rows)
+    labels = make_labels(args.labels, args.rows)
+    behavior_to_label_idx = {name: i + 1 for i, name in enumerate(BEHAVIORS)}
+    print(f"{args.rows:,} rows, {args.labels} labels")
+
+    legacy_s, expected = timed(lambda: legacy_assign_labels(df, labels, behavior_to_label_idx))
+    new_s, actual = timed(lambda: bebe._assign_labels(df, labels, behavior_to_label_idx))
+    np.testing.assert_array_equal(actual, expected)
+    print(f"  assign labels   searchsorted {new_s * 1000:8.1f} ms   loop {legacy_s * 1000:8.1f} ms   "
+          f"{legacy_s / new_s:5.1f}x")
+
+    ranges = []
+    merge = bebe._merge_datetime_ranges
+    bebe._merge_datetime_ranges = lambda r: ranges.append(merge(r)) or ranges[-1]
+    new_s, actual = timed(lambda: bebe._filter_labeled_with_buffer(df, labels, args.buffer_minutes, 0))
+    legacy_s, expected = timed(lambda: legacy_filter_rows(df, ranges[-1]))
+    pd.testing.assert_frame_equal(actual, expected)
+    print(f"  filter ({len(ranges[-1])} ranges) searchsorted {new_s * 1000:8.1f} ms   loop {legacy_s * 1000:8.1f} ms   "
+          f"{legacy_s / new_s:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
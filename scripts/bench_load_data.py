@@ -0,0 +1,95 @@
+"""
+Benchmark: VectronicMotionInput.load_data timestamp construction.
+
+Compares the numeric timestamp builder against the original string-concatenation
++ pd.to_datetime path on a synthetic full-day 16 Hz file (1,382,400 rows).
+
+Usage:
+    python scripts/bench_load_data.py [--rows N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from input_types.vectronic_motion import VectronicMotionInput
+
+FULL_DAY_ROWS = 24 * 60 * 60 * 16
+
+
+def write_day_file(path, rows, freq=16):
+    """Write a synthetic Vectronic Motion CSV with `rows` samples starting at midnight."""
+    idx = np.arange(rows)
+    seconds = idx // freq
+    ms = (idx % freq) * 1000 // freq
+    times = pd.Series(seconds).map(lambda s: f"{s // 3600 % 24:02d}:{s // 60 % 60:02d}:{s % 60:02d}")
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "UTC DateTime": times,
+        "Milliseconds": ms,
+        "Acc X [g]": rng.normal(0, 0.5, rows).round(3),
+        "Acc Y [g]": rng.normal(0, 0.5, rows).round(3),
+        "Acc Z [g]": rng.normal(-1, 0.5, rows).round(3),
+    })
+    with open(path, "w", newline="") as f:
+        f.write("DeviceID: 99999,Firmware: 2.9.17,Expected SensorRange: +/-4g,Date: 2018-06-08\n")
+        df.to_csv(f, index=False)
+
+
+def legacy_timestamps(raw_df, file_date):
+    """The original per-row string round-trip."""
+    ts = pd.to_datetime(
+        raw_df['UTC DateTime'].astype(str) + '.' + raw_df['Milliseconds'].astype(str).str.zfill(3),
+        format='%H:%M:%S.%f'
+    )
+    base = pd.Timestamp(file_date)
+    return base + (ts - ts.dt.normalize())
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=FULL_DAY_ROWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "2018-06-08.csv")
+        print(f"Writing {args.rows:,} rows to {path}...")
+        write_day_file(path, args.rows)
+
+        raw = pd.read_csv(path, skiprows=1)
+        file_date = date(2018, 6, 8)
+
+        legacy_s, legacy = best_of(args.repeat, lambda: legacy_timestamps(raw, file_date))
+        numeric_s, numeric = best_of(args.repeat, lambda: VectronicMotionInput.build_timestamps(
+            raw['UTC DateTime'], raw['Milliseconds'], file_date))
+        assert np.array_equal(legacy.to_numpy(), numeric), "timestamp mismatch"
+
+        loader = VectronicMotionInput(frequency=16)
+        full_s, _ = best_of(args.repeat, lambda: loader.load_data(path))
+
+        print(f"Timestamp construction (best of {args.repeat}):")
+        print(f"  string parse : {legacy_s * 1000:8.1f} ms")
+        print(f"  numeric      : {numeric_s * 1000:8.1f} ms  ({legacy_s / numeric_s:.1f}x faster)")
+        print(f"Full load_data : {full_s * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: opening a large project with ProjectService.load_project.
+
+Writes a synthetic project of 10,000 files with 20 labels each (200,000
+labels) and times:
+  - the original eager load, parsing every label with the original
+    fromisoformat -> strptime -> strptime chain,
+  - an eager load with the fast-path ISO parser,
+  - the lazy load ProjectService now uses, where each file's labels are
+    parsed on first access, plus that first access for one file.
+
+Usage:
+    python scripts/bench_project_load.py [--files N] [--labels-per-file N]
+"""
+import argparse
+import getpass
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.label import Label, _SENTINEL_DATE
+from models.project_config import ProjectConfig
+from services.project_service import ProjectService
+
+BEHAVIORS = ["Stalk", "Kill Phase 1", "Feed", "Walk"]
+
+
+def make_project_dict(num_files, labels_per_file, data_root):
+    entries = []
+    for i in range(num_files):
+        labels = []
+        for j in range(labels_per_file):
+            minute = j * 2
+            start = f"{5 + minute // 60:02d}:{minute % 60:02d}:{j % 60:02d}.{(i * 7919 + j) % 1000000:06d}"
+            end = f"{5 + minute // 60:02d}:{minute % 60:02d}:59"
+            labels.append({"start_time": start, "end_time": end, "behavior": BEHAVIORS[j % len(BEHAVIORS)]})
+        entries.append({"path": f"F{i // 100}_motion/{i}.csv", "id": f"{i:08x}", "labels": labels,
+                        "verified_by": [], "comments": {}})
+    users = [{"username": getpass.getuser(), "data_root": data_root}]
+    return {"proj_name": "Bench", "users": users, "entries": [{"name": "all", "entries": entries}]}
+
+
+def legacy_parse_time(value):
+    """The original Label._parse_time string handling."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        try:
+            return datetime.combine(_SENTINEL_DATE, datetime.strptime(value, "%H:%M:%S.%f").time())
+        except ValueError:
+            pass
+        return datetime.combine(_SENTINEL_DATE, datetime.strptime(value, "%H:%M:%S").time())
+    return Label._parse_time(value)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--labels-per-file", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "project.json")
+        with open(path, "w") as f:
+            json.dump(make_project_dict(args.files, args.labels_per_file, temp_dir), f, indent=4)
+
+        def eager_load():
+            with open(path) as f:
+                return ProjectConfig.from_dict(json.load(f))
+
+        with patch.object(Label, "_parse_time", staticmethod(legacy_parse_time)):
+            legacy_s, _ = timed(eager_load)
+        fast_s, _ = timed(eager_load)
+        lazy_s, service = timed(lambda: ProjectService(path))
+        first_file = service.get_entries()[0].entries[0]
+        access_s, _ = timed(lambda: first_file.labels)
+
+    print(f"{args.files:,} files, {args.files * args.labels_per_file:,} labels")
+    print(f"  eager, original parser {legacy_s * 1000:8.0f} ms")
+    print(f"  eager, fast parser     {fast_s * 1000:8.0f} ms")
+    print(f"  lazy load_project      {lazy_s * 1000:8.0f} ms   ({legacy_s / lazy_s:.1f}x)")
+    print(f"  first access, 1 file   {access_s * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,92 @@
+import argparse
+import json
 import os
 import re
+import sys
+from contextlib import nullcontext
+from datetime import time
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import multiprocessing
 from tqdm import tqdm
-import pickle
-import gc
 
-# Define the directory and threshold
-ROOT_DIR = r'D:\OSU\cougar_data'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_processing.file_profile import NS_PER_HOUR, profile_csv
+from input_types.backtracks import find_backtracks, find_midnight_rollovers
+from services.file_catalog import DEFAULT_CATALOG_PATH, FileCatalog
+
+# Report and result file names, written to the output directory
 BACKTRACK_REPORT_FILE = 'backtrack_report.txt'
 ERROR_REPORT_FILE = 'error_report.txt'
 INCOMPLETE_DAYS_FILE = 'incomplete_days.txt'
-PKL_FILE = 'backtrack_results.pkl'  # Pickle file to store intermediate results
-BATCH_SIZE = 100  # Number of files to process before saving intermediate results
+RESULTS_FILE = 'backtrack_results.jsonl'  # One JSON record per analyzed file, appended as files finish
+RECORD_VERSION = 2  # Bump when the record fields change so older records are re-analyzed
+
+# Matches .../MotionData_<collar>/<YYYY>/<MM...>/<DD...>.csv with either path separator
+DEFAULT_FILE_PATTERN = r".*[\\/]MotionData_.*[\\/]\d{4}[\\/]\d{2}.*[\\/]\d{2}.*\.csv$"
+
+def find_files(root_dir, pattern=DEFAULT_FILE_PATTERN):
+    """List every .csv under root_dir whose full path matches `pattern`, in walk order."""
+    file_pattern = re.compile(pattern)
+    return [os.path.join(dirpath, filename) for dirpath, _, filenames in os.walk(root_dir)
+            for filename in filenames if filename.endswith('.csv') and file_pattern.match(os.path.join(dirpath, filename))]
+
+def load_results(results_file):
+    """
+    Read per-file records from a JSONL results file.
+
+    Later records for the same file replace earlier ones. A partially written last line
+    (from an interrupted run) is ignored.
+
+    :return: Dict of file path -> record.
+    """
+    results = {}
+    if not os.path.exists(results_file):
+        return results
+    with open(results_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            results[record['file']] = record
+    return results
+
+def append_result(results_stream, record):
+    """Append one record to an open JSONL results file and flush it to disk."""
+    results_stream.write(json.dumps(record) + '\n')
+    results_stream.flush()
+
+def is_up_to_date(record, size, mtime_ns):
+    """True when `record` was produced from a file with this size and mtime."""
+    return (record is not None and record.get('version') == RECORD_VERSION
+            and record.get('mtime_ns') == mtime_ns and record.get('size') == size)
+
+def detect_backtracks(timestamps):
+    """
+    List timestamp backtracks as (timestamp, previous timestamp) pairs, in row order.
 
-# Regex pattern to match the correct file paths
-file_pattern = re.compile(r".*\\MotionData_.*\\\d{4}\\\d{2}.*\\\d{2}.*\.csv$")
+    A sample is recorded once if it is earlier than the previous sample, and once more if
+    that drop is a midnight rollover (time of day wraps into hour 0). The first sample is
+    compared against pd.Timestamp.min, as in the original row-by-row scan.
 
-# Function to save intermediate results
-def save_intermediate_results(data, file_name):
-    with open(file_name, 'wb') as file:
-        pickle.dump(data, file)
+    :param timestamps: Series of datetime64[ns] timestamps.
+    :return: List of (pd.Timestamp, pd.Timestamp) tuples.
+    """
+    ts_ns = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    previous = np.concatenate(([pd.Timestamp.min.value], ts_ns))
 
-# Function to load intermediate results
-def load_intermediate_results(file_name):
-    if os.path.exists(file_name):
-        with open(file_name, 'rb') as file:
-            return pickle.load(file)
-    return {}
+    # Indices into `previous` are one past the row index
+    rollover_rows = find_midnight_rollovers(previous, ticks_per_hour=NS_PER_HOUR) - 1
+    backtrack_rows = find_backtracks(previous) - 1
+
+    rows = np.concatenate((rollover_rows, backtrack_rows))
+    kinds = np.concatenate((np.zeros(len(rollover_rows), dtype=np.int8), np.ones(len(backtrack_rows), dtype=np.int8)))
+    rows = rows[np.lexsort((kinds, rows))]
+    return [(pd.Timestamp(ts_ns[row]), pd.Timestamp(previous[row])) for row in rows]
 
 def process_csv(file_path):
     try:
@@ -51,18 +107,7 @@ def process_csv(file_path):
         df['Timestamp'] = pd.to_datetime(df['UTC DateTime'], format='%H:%M:%S', errors='coerce') + pd.to_timedelta(df['Milliseconds'], unit='ms')
         df = df.dropna(subset=['Timestamp']).reset_index(drop=True)
 
-        # Initialize variables for tracking backtracks
-        max_time = pd.Timestamp.min
-        backtracks = []
-
-        # Iterate through each row and detect backtracks
-        for idx, row in df.iterrows():
-            current_time = row['Timestamp'].time()
-            if current_time < max_time.time() and current_time.hour == 0:
-                backtracks.append((row['Timestamp'], max_time))
-            if row['Timestamp'] < max_time:
-                backtracks.append((row['Timestamp'], max_time))
-            max_time = row['Timestamp']  # Update the max time
+        backtracks = detect_backtracks(df['Timestamp'])
 
         # Get start and end times of the file
         start_time = df['Timestamp'].iloc[0].time()
@@ -74,71 +119,115 @@ def process_csv(file_path):
         print(f"Error processing {file_path}: {e}")
         return None, [], None, None
 
-def analyze_backtracks(root_dir, max_files=None):
-    backtrack_results = load_intermediate_results(PKL_FILE)
-    error_files = []
-    incomplete_day_files = []
+def analyze_file(file_path):
+    """
+    Pool worker: profile one file and return its compact result record.
 
-    # Find all valid files
-    files = [os.path.join(dirpath, filename) for dirpath, _, filenames in os.walk(root_dir)
-             for filename in filenames if filename.endswith('.csv') and file_pattern.match(os.path.join(dirpath, filename))]
-    if max_files:
-        files = files[:max_files]
+    The record carries the file's size and mtime so later runs can skip it until it changes.
+    """
+    record = {'file': file_path, 'version': RECORD_VERSION, 'mtime_ns': None, 'size': None}
+    try:
+        # A file deleted or replaced after listing must not take down the pool
+        stat = os.stat(file_path)
+        record['mtime_ns'], record['size'] = stat.st_mtime_ns, stat.st_size
+        record.update(profile_csv(file_path))
+    except Exception as e:
+        print(f"Error processing {file_path}: {e}")
+        record['error'] = True
+    return record
 
-    files_to_process = [file for file in files if file not in backtrack_results]
-    total_cores = multiprocessing.cpu_count()
-    processes_to_use = max(1, total_cores - 4)
+def analyze_backtracks(root_dir, pattern=DEFAULT_FILE_PATTERN, workers=None, output_dir='.', max_files=None,
+                       plots=True, catalog=None):
+    """
+    Analyze every matching file under root_dir, resuming from earlier runs.
 
-    start_times, end_times = [], []  # For heatmap plotting
+    Files whose size and mtime match their record in the results file are skipped; new and
+    changed files are analyzed in a single process pool and their records appended as each
+    one finishes, so an interrupted run loses at most the files still in flight.
 
-    for i in range(0, len(files_to_process), BATCH_SIZE):
-        batch_files = files_to_process[i:i + BATCH_SIZE]
-        with multiprocessing.Pool(processes=processes_to_use) as pool:
-            results = list(tqdm(pool.imap(process_csv, batch_files), total=len(batch_files), desc="Processing CSV files"))
+    :param root_dir: Directory to scan.
+    :param pattern: Regex the full file path must match.
+    :param workers: Number of worker processes (default: CPU count - 4, at least 1).
+    :param output_dir: Directory for the results file, reports and plots.
+    :param max_files: Optional cap on the number of matching files considered.
+    :param plots: Whether to draw and save the summary plots.
+    :param catalog: Optional FileCatalog. When given, files are listed from the catalog after a
+                    stat-diff refresh, and new profiles are stored back into it.
+    :return: Dict of file path -> record for every matching file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results_file = os.path.join(output_dir, RESULTS_FILE)
+    previous = load_results(results_file)
 
-        for (df, backtracks, start_time, end_time), file_path in zip(results, batch_files):
-            if df is None:
-                error_files.append(file_path)
-                continue
+    if catalog is not None:
+        catalog.refresh(root_dir, ('.csv',))
+        file_pattern = re.compile(pattern)
+        file_stats = {}
+        for entry in catalog.files(root_dir):
+            file_path = os.path.normpath(os.path.join(root_dir, entry.rel_path))
+            if file_pattern.match(file_path):
+                file_stats[file_path] = (entry.size, entry.mtime_ns)
+        files = list(file_stats)
+    else:
+        files = find_files(root_dir, pattern)
+    if max_files:
+        files = files[:max_files]
 
-            # Track incomplete days only if end time is outside 00:30 to 23:30 range
-            if (start_time > pd.Timestamp('00:30:00').time()) or (end_time < pd.Timestamp('23:30:00').time()):
-                incomplete_day_files.append((file_path, start_time, end_time))
+    backtrack_results = {}
+    files_to_process = []
+    for file_path in files:
+        record = previous.get(file_path)
+        if catalog is not None:
+            size, mtime_ns = file_stats[file_path]
+        else:
+            stat = os.stat(file_path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        if is_up_to_date(record, size, mtime_ns):
+            backtrack_results[file_path] = record
+        else:
+            files_to_process.append(file_path)
 
-            # Store backtrack count
-            backtrack_results[file_path] = {
-                'backtracks': len(backtracks),
-                'start_time': start_time,
-                'end_time': end_time
-            }
+    if workers is None:
+        workers = max(1, multiprocessing.cpu_count() - 4)
 
-            # Store start and end times for heatmap plotting
-            start_times.append(start_time)
-            end_times.append(end_time)
+    if files_to_process:
+        pool = multiprocessing.Pool(processes=workers) if workers > 1 else nullcontext()
+        with pool, open(results_file, 'a', encoding='utf-8') as results_stream:
+            if workers > 1:
+                records = pool.imap_unordered(analyze_file, files_to_process)
+            else:
+                records = map(analyze_file, files_to_process)
+            for record in tqdm(records, total=len(files_to_process), desc="Processing CSV files"):
+                append_result(results_stream, record)
+                backtrack_results[record['file']] = record
+                if catalog is not None and not record.get('error'):
+                    catalog.store_profile(root_dir, os.path.relpath(record['file'], root_dir), record)
+        backtrack_results = {file: backtrack_results[file] for file in files}
 
-        # Save intermediate results and clear memory
-        save_intermediate_results(backtrack_results, PKL_FILE)
-        gc.collect()
+    write_reports(backtrack_results, output_dir)
+    if plots:
+        summarize_results(backtrack_results, output_dir)
+    return backtrack_results
 
-    # Write error file report
-    with open(ERROR_REPORT_FILE, 'w') as ef:
+def write_reports(backtrack_results, output_dir='.'):
+    """Write the error, incomplete-day and backtrack text reports for a set of records."""
+    error_files = [file for file, record in backtrack_results.items() if record.get('error')]
+    with open(os.path.join(output_dir, ERROR_REPORT_FILE), 'w') as ef:
         ef.write("\n".join(error_files))
 
-    # Write incomplete day files report
-    with open(INCOMPLETE_DAYS_FILE, 'w') as idf:
-        for file_info in incomplete_day_files:
-            idf.write(f"{file_info[0]} - Start: {file_info[1]}, End: {file_info[2]}\n")
-
-    # Summarize and plot results
-    summarize_results(backtrack_results, start_times, end_times)
-
-def summarize_results(backtrack_results, start_times, end_times):
-    # Extract information for reporting and plotting
-    backtrack_files = [file for file, result in backtrack_results.items() if result['backtracks'] > 0]
-    backtrack_counts = [result['backtracks'] for result in backtrack_results.values() if result['backtracks'] > 0]
+    # Track incomplete days only if end time is outside 00:30 to 23:30 range
+    with open(os.path.join(output_dir, INCOMPLETE_DAYS_FILE), 'w') as idf:
+        for file, record in backtrack_results.items():
+            if record.get('error'):
+                continue
+            start_time = time.fromisoformat(record['start_time'])
+            end_time = time.fromisoformat(record['end_time'])
+            if start_time > time(0, 30) or end_time < time(23, 30):
+                idf.write(f"{file} - Start: {start_time}, End: {end_time}\n")
 
-    # Write backtrack report
-    with open(BACKTRACK_REPORT_FILE, 'w') as br:
+    backtrack_files = [file for file, record in backtrack_results.items() if record.get('backtracks', 0) > 0]
+    backtrack_counts = [backtrack_results[file]['backtracks'] for file in backtrack_files]
+    with open(os.path.join(output_dir, BACKTRACK_REPORT_FILE), 'w') as br:
         br.write(f"Total files with backtracks: {len(backtrack_files)}\n")
         if len(backtrack_files) > 0:
             br.write(f"Average backtracks per file: {sum(backtrack_counts) / len(backtrack_files):.2f}\n")
@@ -146,13 +235,20 @@ def summarize_results(backtrack_results, start_times, end_times):
         for file, count in zip(backtrack_files, backtrack_counts):
             br.write(f"{file} - Backtracks: {count}\n")
 
+def summarize_results(backtrack_results, output_dir='.'):
+    """Plot backtrack and start/end time summaries for a set of records."""
+    ok_results = [record for record in backtrack_results.values() if not record.get('error')]
+    backtrack_counts = [record['backtracks'] for record in ok_results if record['backtracks'] > 0]
+    start_times = [time.fromisoformat(record['start_time']) for record in ok_results]
+    end_times = [time.fromisoformat(record['end_time']) for record in ok_results]
+
     # Plot pie chart for files with and without backtracks
     plt.figure(figsize=(6, 6))
     labels = ['With Backtracks', 'Without Backtracks']
-    sizes = [len(backtrack_files), len(backtrack_results) - len(backtrack_files)]
+    sizes = [len(backtrack_counts), len(ok_results) - len(backtrack_counts)]
     plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
     plt.title('Files With and Without Backtracks')
-    plt.savefig('backtrack_pie_chart.png')
+    plt.savefig(os.path.join(output_dir, 'backtrack_pie_chart.png'))
     plt.show()
 
     # Plot summary of backtrack counts
@@ -161,7 +257,7 @@ def summarize_results(backtrack_results, start_times, end_times):
     plt.title('Distribution of Backtrack Counts per File')
     plt.xlabel('Number of Backtracks')
     plt.ylabel('Number of Files')
-    plt.savefig('backtrack_summary.png')
+    plt.savefig(os.path.join(output_dir, 'backtrack_summary.png'))
     plt.show()
 
     # Plot heatmap for start and end times
@@ -174,9 +270,31 @@ def summarize_results(backtrack_results, start_times, end_times):
     plt.xlabel('Hour of Day')
     plt.ylabel('Frequency')
     plt.legend()
-    plt.savefig('start_end_times_heatmap.png')
+    plt.savefig(os.path.join(output_dir, 'start_end_times_heatmap.png'))
     plt.show()
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Scan an archive of Vectronic motion CSVs for timestamp backtracks and incomplete days. "
+                    "Results are appended to a JSONL file in the output directory; rerunning only analyzes "
+                    "files that are new or whose size/mtime changed.")
+    parser.add_argument("root", help="Root directory of the data archive")
+    parser.add_argument("--pattern", default=DEFAULT_FILE_PATTERN,
+                        help="Regex the full path of a .csv file must match (default: MotionData_*/YYYY/MM/DD layout)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count - 4, at least 1)")
+    parser.add_argument("--output-dir", default=".", help="Directory for results, reports and plots")
+    parser.add_argument("--max-files", type=int, default=None, help="Only consider the first N matching files")
+    parser.add_argument("--no-plots", action="store_true", help="Write the text reports only")
+    parser.add_argument("--catalog", nargs="?", const=DEFAULT_CATALOG_PATH, default=None,
+                        help="List files from (and store profiles in) a file catalog instead of walking the root "
+                             f"(default path: {DEFAULT_CATALOG_PATH})")
+    args = parser.parse_args(argv)
+
+    catalog = FileCatalog(args.catalog) if args.catalog else None
+    analyze_backtracks(args.root, pattern=args.pattern, workers=args.workers, output_dir=args.output_dir,
+                       max_files=args.max_files, plots=not args.no_plots, catalog=catalog)
+
 if __name__ == "__main__":
     multiprocessing.set_start_method('spawn')  # Use 'spawn' for Windows
-    analyze_backtracks(ROOT_DIR)
+    main()
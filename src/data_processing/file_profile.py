@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from input_types.backtracks import find_backtracks, find_midnight_rollovers
+from input_types.input_interface import DEFAULT_CHUNK_ROWS
+
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_MS = 1_000_000
+
+# Bin edges (ms) for the per-file histogram of gaps between consecutive samples:
+# backwards, repeated, sub-second (normal sampling), up to 1 min, up to 1 h, longer
+GAP_HISTOGRAM_EDGES_MS = [-np.inf, 0, 1, 1_000, 60_000, 3_600_000, np.inf]
+
+
+def parse_time_of_day(utc_times, milliseconds):
+    """
+    Parse timestamps the same way backtrack_analysis.process_csv does, but only once per distinct 'HH:MM:SS' string.
+
+    Unparseable times become NaT.
+    """
+    codes, uniques = pd.factorize(utc_times, sort=False)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format='%H:%M:%S', errors='coerce').to_numpy()
+    parsed = np.append(parsed, np.datetime64('NaT', 'ns'))  # code -1 (missing) -> NaT
+    return pd.Series(parsed[codes]) + pd.to_timedelta(milliseconds.to_numpy(dtype=float), unit='ms')
+
+
+def profile_csv(file_path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Compute compact statistics for one file without holding it in memory.
+
+    Only the time columns are read, `chunk_rows` at a time; backtracks and gaps that span
+    a chunk boundary are counted by carrying the previous chunk's last timestamp forward.
+    The backtrack count equals len(backtrack_analysis.process_csv(file_path)[1]).
+
+    :param file_path: Path to the CSV file.
+    :param chunk_rows: Rows parsed per chunk.
+    :return: Dict with 'rows', 'start_time', 'end_time' (ISO time of day), 'backtracks',
+             'gap_histogram' (counts per GAP_HISTOGRAM_EDGES_MS bin) and 'sample_rate_hz'
+             (from the mean of sub-second forward gaps, None if there are none).
+    """
+    rows = 0
+    backtracks = 0
+    first_ns = last_ns = None
+    previous_ns = pd.Timestamp.min.value
+    gap_histogram = np.zeros(len(GAP_HISTOGRAM_EDGES_MS) - 1, dtype=np.int64)
+    gap_edges_ns = np.array(GAP_HISTOGRAM_EDGES_MS) * NS_PER_MS
+    regular_gaps = 0
+    regular_gap_ns = 0
+
+    reader = pd.read_csv(file_path, skiprows=1, header=0, usecols=['UTC DateTime', 'Milliseconds'],
+                         dtype={'UTC DateTime': str, 'Milliseconds': float}, chunksize=chunk_rows)
+    with reader:
+        for chunk in reader:
+            timestamps = parse_time_of_day(chunk['UTC DateTime'], chunk['Milliseconds']).dropna()
+            if timestamps.empty:
+                continue
+            ts_ns = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            extended = np.concatenate(([previous_ns], ts_ns))
+            backtracks += len(find_backtracks(extended))
+            backtracks += len(find_midnight_rollovers(extended, ticks_per_hour=NS_PER_HOUR))
+
+            gaps = np.diff(extended if first_ns is not None else ts_ns)
+            gap_histogram += np.histogram(gaps, bins=gap_edges_ns)[0]
+            regular = gaps[(gaps > 0) & (gaps < 1_000 * NS_PER_MS)]
+            regular_gaps += len(regular)
+            regular_gap_ns += int(regular.sum())
+
+            if first_ns is None:
+                first_ns = int(ts_ns[0])
+            last_ns = previous_ns = int(ts_ns[-1])
+            rows += len(ts_ns)
+
+    if rows == 0:
+        raise ValueError(f"No valid timestamps in {file_path}")
+    return {
+        'rows': rows,
+        'start_time': pd.Timestamp(first_ns).time().isoformat(),
+        'end_time': pd.Timestamp(last_ns).time().isoformat(),
+        'backtracks': backtracks,
+        'gap_histogram': gap_histogram.tolist(),
+        'sample_rate_hz': round(regular_gaps * 1e9 / regular_gap_ns, 3) if regular_gaps else None,
+    }
@@ -1,9 +1,10 @@
 import logging
+import os
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 
 from gui_components.gui_theme import PAD_MD, PAD_LG
-from models.output_settings import OutputSettings, DownsampleMethod, OutputPeriod, OutputType
+from models.output_settings import OutputSettings, DownsampleMethod, OutputPeriod, OutputType, ClipFormat
 
 
 class GenerateOutputDialog(tk.Toplevel):
@@ -61,15 +62,41 @@ class GenerateOutputDialog(tk.Toplevel):
         self.round_to_minutes_spinbox = ttk.Spinbox(self, from_=0, to=60, textvariable=self.round_to_minutes_var)
         self.round_to_minutes_spinbox.grid(row=5, column=1, columnspan=2, sticky=tk.EW, padx=PAD_MD, pady=PAD_MD)
 
-        # Row 6: Output Directory + Browse
-        ttk.Label(self, text="Output Directory:").grid(row=6, column=0, sticky=tk.W, padx=PAD_MD, pady=PAD_MD)
+        # Row 6: Worker processes
+        ttk.Label(self, text="Worker Processes:").grid(row=6, column=0, sticky=tk.W, padx=PAD_MD, pady=PAD_MD)
+        cpu_count = os.cpu_count() or 1
+        self.workers_var = tk.IntVar(value=max(1, cpu_count - 1))
+        self.workers_spinbox = ttk.Spinbox(self, from_=1, to=cpu_count, textvariable=self.workers_var)
+        self.workers_spinbox.grid(row=6, column=1, columnspan=2, sticky=tk.EW, padx=PAD_MD, pady=PAD_MD)
+
+        # Row 7: Output Directory + Browse
+        ttk.Label(self, text="Output Directory:").grid(row=7, column=0, sticky=tk.W, padx=PAD_MD, pady=PAD_MD)
         self.output_directory_entry = ttk.Entry(self)
-        self.output_directory_entry.grid(row=6, column=1, sticky=tk.EW, padx=PAD_MD, pady=PAD_MD)
-        ttk.Button(self, text="Browse", command=self.select_output_directory).grid(row=6, column=2, padx=PAD_MD, pady=PAD_MD)
+        self.output_directory_entry.grid(row=7, column=1, sticky=tk.EW, padx=PAD_MD, pady=PAD_MD)
+        ttk.Button(self, text="Browse", command=self.select_output_directory).grid(row=7, column=2, padx=PAD_MD, pady=PAD_MD)
+
+        # Row 8: Clip file formats
+        ttk.Label(self, text="Clip Formats:").grid(row=8, column=0, sticky=tk.W, padx=PAD_MD, pady=PAD_MD)
+        format_frame = ttk.Frame(self)
+        format_frame.grid(row=8, column=1, columnspan=2, sticky=tk.W, padx=PAD_MD, pady=PAD_MD)
+
+        self.format_csv_var = tk.BooleanVar(value=True)
+        self.format_npy_var = tk.BooleanVar(value=False)
+        self.format_npz_var = tk.BooleanVar(value=False)
+
+        ttk.Checkbutton(format_frame, text="CSV", variable=self.format_csv_var).pack(side=tk.LEFT, padx=(0, PAD_LG))
+        ttk.Checkbutton(format_frame, text="NPY", variable=self.format_npy_var).pack(side=tk.LEFT, padx=(0, PAD_LG))
+        ttk.Checkbutton(format_frame, text="NPZ", variable=self.format_npz_var).pack(side=tk.LEFT)
 
-        # Row 7: Cancel / Generate Output buttons
+        # Row 9: Incremental regeneration
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self, text="Only regenerate clips that changed since the last run",
+                        variable=self.incremental_var).grid(row=9, column=0, columnspan=3, sticky=tk.W,
+                                                            padx=PAD_MD, pady=PAD_MD)
+
+        # Row 10: Cancel / Generate Output buttons
         button_frame = ttk.Frame(self)
-        button_frame.grid(row=7, column=0, columnspan=3, pady=PAD_LG)
+        button_frame.grid(row=10, column=0, columnspan=3, pady=PAD_LG)
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=PAD_MD)
         ttk.Button(button_frame, text="Generate Output", command=self.generate_output).pack(side=tk.LEFT, padx=PAD_MD)
 
@@ -144,6 +171,17 @@ class GenerateOutputDialog(tk.Toplevel):
             methods.append(DownsampleMethod.MAX)
         return methods
 
+    def _get_selected_clip_formats(self):
+        """Return list of selected ClipFormat enums."""
+        formats = []
+        if self.format_csv_var.get():
+            formats.append(ClipFormat.CSV)
+        if self.format_npy_var.get():
+            formats.append(ClipFormat.NPY)
+        if self.format_npz_var.get():
+            formats.append(ClipFormat.NPZ)
+        return formats
+
     def generate_output(self):
         """Create OutputSettings from user inputs and close dialog."""
         try:
@@ -152,6 +190,11 @@ class GenerateOutputDialog(tk.Toplevel):
                 messagebox.showwarning("No Method Selected", "Please select at least one downsampling method.")
                 return
 
+            clip_formats = self._get_selected_clip_formats()
+            if not clip_formats:
+                messagebox.showwarning("No Format Selected", "Please select at least one clip format.")
+                return
+
             if not self.output_directory:
                 messagebox.showwarning("No Directory", "Please select an output directory.")
                 return
@@ -162,7 +205,10 @@ class GenerateOutputDialog(tk.Toplevel):
                 output_period=OutputPeriod(self.output_period_var.get()),
                 output_frequency=int(self.output_frequency_var.get()),
                 buffer_minutes=self.buffer_minutes_var.get(),
-                round_to_minutes=self.round_to_minutes_var.get()
+                round_to_minutes=self.round_to_minutes_var.get(),
+                workers=max(1, self.workers_var.get()),
+                incremental=self.incremental_var.get(),
+                clip_formats=clip_formats
             )
 
             self.result_ready = True
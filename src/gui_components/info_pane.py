@@ -232,7 +232,7 @@ class InfoPane(ttk.Frame):
         if self._comment_save_after_id is not None:
             self.after_cancel(self._comment_save_after_id)
             self._comment_save_after_id = None
-            self.project_service.save_project()
+            self.project_service.request_save(file_id=self.current_file_entry.id if self.current_file_entry else None)
 
         self.current_file_entry = file_entry
 
@@ -303,7 +303,7 @@ class InfoPane(ttk.Frame):
                 verified = self.reviewer_vars[current_user].get()
                 self.current_file_entry.set_verified_by(current_user, verified)
                 self.parent.set_status(f"Verification by {current_user}: {verified}")
-                self.project_service.save_project()
+                self.project_service.request_save(file_id=self.current_file_entry.id)
                 self.parent.project_browser.update_tree_item_color(
                     self.current_file_entry.id, self.current_file_entry.verified_by)
 
@@ -335,4 +335,4 @@ class InfoPane(ttk.Frame):
     def _save_comment(self):
         """Actually persist the comment after debounce delay."""
         self._comment_save_after_id = None
-        self.project_service.save_project()
+        self.project_service.request_save(file_id=self.current_file_entry.id if self.current_file_entry else None)
@@ -48,12 +48,10 @@ class ResizeLabelCommand(LabelCommand):
     def redo(self, labels):
         self.label.start_time = self.new_start
         self.label.end_time = self.new_end
-        self.label.duration = self.label.calculate_duration()
 
     def undo(self, labels):
         self.label.start_time = self.old_start
         self.label.end_time = self.old_end
-        self.label.duration = self.label.calculate_duration()
 
 
 class ChangeBehaviorCommand(LabelCommand):
@@ -6,9 +6,16 @@ from gui_components.gui_theme import PAD_MD, PAD_LG, FONT_TITLE, FONT_HEADING, F
 
 
 class LabelingDashboardDialog(tk.Toplevel):
-    """Read-only dashboard showing project-wide labeling progress and statistics."""
+    """
+    Dashboard showing project-wide labeling progress and statistics.
 
-    def __init__(self, parent, file_entries, label_displays, reviewers, verification_threshold=1.0):
+    The dialog is non-modal and follows the project: every edit reported through
+    ProjectService.add_change_listener schedules a refresh, so a burst of edits redraws it once.
+    """
+
+    REFRESH_DELAY_MS = 250
+
+    def __init__(self, parent, project_service):
         super().__init__(parent)
         self.title("Labeling Dashboard")
         self.resizable(True, True)
@@ -23,25 +30,15 @@ class LabelingDashboardDialog(tk.Toplevel):
         y = parent.winfo_rooty() + (ph - h) // 2
         self.geometry(f"{w}x{h}+{x}+{y}")
 
-        self.file_entries = file_entries
-        self.label_displays = label_displays
-        self.reviewers = reviewers
-        self.verification_threshold = verification_threshold
+        self.project_service = project_service
+        self._pending_refresh = None
 
         self._compute_stats()
         self._build_ui()
+        self._update_ui()
 
-    def _is_fully_verified(self, fe):
-        """Return True if file is fully verified (green status)."""
-        import math
-        num_verified = len(fe.verified_by)
-        if num_verified == 0:
-            return False
-        num_reviewers = len(self.reviewers)
-        if num_reviewers == 0:
-            return True
-        required = math.ceil(self.verification_threshold * num_reviewers)
-        return num_verified >= required
+        self.project_service.add_change_listener(self._on_project_changed)
+        self.bind("<Destroy>", self._on_destroy, add="+")
 
     def _format_duration(self, total_seconds):
         """Format seconds as 'X.Y sec' or 'X.Y min'."""
@@ -50,34 +47,49 @@ class LabelingDashboardDialog(tk.Toplevel):
         return f"{total_seconds / 60:.1f} min"
 
     def _compute_stats(self):
-        """Compute all dashboard statistics from file entries."""
-        self.total_files = len(self.file_entries)
-        self.files_with_labels = sum(1 for fe in self.file_entries if fe.labels)
-        self.files_fully_verified = sum(1 for fe in self.file_entries if self._is_fully_verified(fe))
-        self.total_labels = sum(len(fe.labels) for fe in self.file_entries)
-
-        # Per-behavior stats: {display_name: {"labels": int, "files": set, "duration_sec": float}}
-        self.behavior_stats = {}
-        for ld in self.label_displays:
-            self.behavior_stats[ld.display_name] = {"labels": 0, "files": set(), "duration_sec": 0.0}
-
-        for fe in self.file_entries:
-            for label in fe.labels:
-                if label.behavior in self.behavior_stats:
-                    stats = self.behavior_stats[label.behavior]
-                    stats["labels"] += 1
-                    stats["files"].add(fe.id)
-                    stats["duration_sec"] += label.duration.total_seconds()
+        """Read the dashboard statistics from the project's ProjectStatistics and settings."""
+        config = self.project_service.current_project_config
+        stats = self.project_service.get_statistics()
+        self.label_displays = config.label_display
+        self.reviewers = self.project_service.get_reviewers()
+        self.total_files = stats.total_files
+        self.files_with_labels = stats.files_with_labels
+        self.files_fully_verified = stats.files_fully_verified(len(self.reviewers), config.verification_threshold)
+        self.total_labels = stats.total_labels
+
+        # Per-behavior stats: {display_name: {"labels": int, "files": int, "duration_sec": float}}
+        self.behavior_stats = stats.behavior_stats([ld.display_name for ld in self.label_displays])
 
         # Per-reviewer stats
         self.reviewer_stats = {}
         for username, info in self.reviewers.items():
-            count = sum(1 for fe in self.file_entries if username in fe.verified_by)
             self.reviewer_stats[username] = {
                 "alias": info.get("alias", username[:2].upper()),
-                "count": count,
+                "count": stats.verified_count(username),
             }
 
+    def _on_project_changed(self, _file_id):
+        """Coalesce project edits into one refresh REFRESH_DELAY_MS after the first."""
+        if self._pending_refresh is None:
+            self._pending_refresh = self.after(self.REFRESH_DELAY_MS, self._refresh)
+
+    def _refresh(self):
+        """Recompute the statistics (only edited files are rescanned) and redraw; close if the project is gone."""
+        self._pending_refresh = None
+        if not self.project_service.current_project_config:
+            self.destroy()
+            return
+        self._compute_stats()
+        self._update_ui()
+
+    def _on_destroy(self, event):
+        if event.widget is not self:
+            return
+        self.project_service.remove_change_listener(self._on_project_changed)
+        if self._pending_refresh is not None:
+            self.after_cancel(self._pending_refresh)
+            self._pending_refresh = None
+
     def _build_ui(self):
         """Build the dialog layout."""
         # Scrollable canvas
@@ -100,7 +112,9 @@ class LabelingDashboardDialog(tk.Toplevel):
         # Bind mousewheel scrolling
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # The dialog is non-modal, so only take over the wheel while the pointer is over it
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
         self.bind("<Destroy>", lambda e: canvas.unbind_all("<MouseWheel>") if e.widget is self else None)
 
         frame = self.content_frame
@@ -113,31 +127,26 @@ class LabelingDashboardDialog(tk.Toplevel):
         stats_frame.columnconfigure(0, weight=1)
         stats_frame.columnconfigure(1, weight=1)
 
-        stat_items = [
-            ("Total Files", str(self.total_files)),
-            ("Files with Labels", str(self.files_with_labels)),
-            ("Files Fully Verified", str(self.files_fully_verified)),
-            ("Total Labels", str(self.total_labels)),
-        ]
-        for i, (header, value) in enumerate(stat_items):
+        self.stat_value_labels = {}
+        for i, header in enumerate(["Total Files", "Files with Labels", "Files Fully Verified", "Total Labels"]):
             row, col = divmod(i, 2)
             cell = ttk.Frame(stats_frame)
             cell.grid(row=row, column=col, padx=PAD_LG, pady=PAD_MD, sticky=tk.W)
             ttk.Label(cell, text=header, font=FONT_BODY).pack(anchor=tk.W)
-            ttk.Label(cell, text=value, font=FONT_HEADING).pack(anchor=tk.W)
+            self.stat_value_labels[header] = ttk.Label(cell, font=FONT_HEADING)
+            self.stat_value_labels[header].pack(anchor=tk.W)
 
         # Section B — Verification progress bar
         ttk.Separator(frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
 
-        pct = (self.files_fully_verified / self.total_files * 100) if self.total_files > 0 else 0
         ttk.Label(frame, text="Verification Progress", font=FONT_TITLE).pack(
             anchor=tk.W, padx=PAD_LG, pady=(PAD_MD, PAD_MD))
 
-        progress_bar = ttk.Progressbar(frame, length=400, mode='determinate', maximum=100, value=pct)
-        progress_bar.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
+        self.progress_bar = ttk.Progressbar(frame, length=400, mode='determinate', maximum=100)
+        self.progress_bar.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
 
-        ttk.Label(frame, text=f"{self.files_fully_verified} / {self.total_files} files verified ({pct:.0f}%)",
-                  font=FONT_BODY).pack(anchor=tk.W, padx=PAD_LG)
+        self.progress_label = ttk.Label(frame, font=FONT_BODY)
+        self.progress_label.pack(anchor=tk.W, padx=PAD_LG)
 
         # Section C — Per-behavior breakdown
         ttk.Separator(frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
@@ -145,8 +154,7 @@ class LabelingDashboardDialog(tk.Toplevel):
             anchor=tk.W, padx=PAD_LG, pady=(PAD_MD, PAD_MD))
 
         columns = ("behavior", "color", "labels", "files", "duration")
-        behavior_tree = ttk.Treeview(frame, columns=columns, show="headings",
-                                     height=min(len(self.label_displays) + 1, 10))
+        self.behavior_tree = behavior_tree = ttk.Treeview(frame, columns=columns, show="headings")
         behavior_tree.heading("behavior", text="Behavior")
         behavior_tree.heading("color", text="Color")
         behavior_tree.heading("labels", text="Labels")
@@ -159,50 +167,77 @@ class LabelingDashboardDialog(tk.Toplevel):
         behavior_tree.column("files", width=60, anchor=tk.CENTER, stretch=False)
         behavior_tree.column("duration", width=100, anchor=tk.E, stretch=False)
 
+        behavior_tree.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
+
+        # Section D — Per-reviewer verification (only shown while reviewers are configured)
+        self.reviewer_section = ttk.Frame(frame)
+        ttk.Separator(self.reviewer_section, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
+        ttk.Label(self.reviewer_section, text="Reviewer Verification", font=FONT_TITLE).pack(
+            anchor=tk.W, padx=PAD_LG, pady=(PAD_MD, PAD_MD))
+
+        rev_columns = ("reviewer", "alias", "files_verified", "pct")
+        self.reviewer_tree = reviewer_tree = ttk.Treeview(self.reviewer_section, columns=rev_columns, show="headings")
+        reviewer_tree.heading("reviewer", text="Reviewer")
+        reviewer_tree.heading("alias", text="Alias")
+        reviewer_tree.heading("files_verified", text="Files Verified")
+        reviewer_tree.heading("pct", text="%")
+
+        reviewer_tree.column("reviewer", width=120, stretch=True)
+        reviewer_tree.column("alias", width=60, anchor=tk.CENTER, stretch=False)
+        reviewer_tree.column("files_verified", width=100, anchor=tk.CENTER, stretch=False)
+        reviewer_tree.column("pct", width=60, anchor=tk.E, stretch=False)
+
+        reviewer_tree.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
+
+        # Close button
+        self.close_separator = ttk.Separator(frame, orient=tk.HORIZONTAL)
+        self.close_separator.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
+        ttk.Button(frame, text="Close", command=self.destroy).pack(pady=PAD_LG)
+
+    def _update_ui(self):
+        """Show the current statistics in the widgets created by _build_ui."""
+        stat_values = {
+            "Total Files": self.total_files,
+            "Files with Labels": self.files_with_labels,
+            "Files Fully Verified": self.files_fully_verified,
+            "Total Labels": self.total_labels,
+        }
+        for header, value in stat_values.items():
+            self.stat_value_labels[header].configure(text=str(value))
+
+        pct = (self.files_fully_verified / self.total_files * 100) if self.total_files > 0 else 0
+        self.progress_bar.configure(value=pct)
+        self.progress_label.configure(
+            text=f"{self.files_fully_verified} / {self.total_files} files verified ({pct:.0f}%)")
+
+        behavior_tree = self.behavior_tree
+        behavior_tree.delete(*behavior_tree.get_children())
+        behavior_tree.configure(height=min(len(self.label_displays) + 1, 10))
         for ld in self.label_displays:
-            stats = self.behavior_stats.get(ld.display_name, {"labels": 0, "files": set(), "duration_sec": 0.0})
+            stats = self.behavior_stats.get(ld.display_name, {"labels": 0, "files": 0, "duration_sec": 0.0})
             tag_name = f"color_{ld.display_name}"
             behavior_tree.tag_configure(tag_name, foreground=ld.color)
             behavior_tree.insert("", tk.END, values=(
                 ld.display_name,
                 "\u2588",
                 stats["labels"],
-                len(stats["files"]),
+                stats["files"],
                 self._format_duration(stats["duration_sec"]),
             ), tags=(tag_name,))
 
-        behavior_tree.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
-
-        # Section D — Per-reviewer verification (only if reviewers configured)
-        if self.reviewers:
-            ttk.Separator(frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
-            ttk.Label(frame, text="Reviewer Verification", font=FONT_TITLE).pack(
-                anchor=tk.W, padx=PAD_LG, pady=(PAD_MD, PAD_MD))
-
-            rev_columns = ("reviewer", "alias", "files_verified", "pct")
-            reviewer_tree = ttk.Treeview(frame, columns=rev_columns, show="headings",
-                                         height=min(len(self.reviewers) + 1, 10))
-            reviewer_tree.heading("reviewer", text="Reviewer")
-            reviewer_tree.heading("alias", text="Alias")
-            reviewer_tree.heading("files_verified", text="Files Verified")
-            reviewer_tree.heading("pct", text="%")
-
-            reviewer_tree.column("reviewer", width=120, stretch=True)
-            reviewer_tree.column("alias", width=60, anchor=tk.CENTER, stretch=False)
-            reviewer_tree.column("files_verified", width=100, anchor=tk.CENTER, stretch=False)
-            reviewer_tree.column("pct", width=60, anchor=tk.E, stretch=False)
-
-            for username, rev_stats in self.reviewer_stats.items():
-                rev_pct = (rev_stats["count"] / self.total_files * 100) if self.total_files > 0 else 0
-                reviewer_tree.insert("", tk.END, values=(
-                    username,
-                    rev_stats["alias"],
-                    rev_stats["count"],
-                    f"{rev_pct:.0f}%",
-                ))
-
-            reviewer_tree.pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
-
-        # Close button
-        ttk.Separator(frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=PAD_LG, pady=PAD_MD)
-        ttk.Button(frame, text="Close", command=self.destroy).pack(pady=PAD_LG)
+        reviewer_tree = self.reviewer_tree
+        reviewer_tree.delete(*reviewer_tree.get_children())
+        if not self.reviewers:
+            self.reviewer_section.pack_forget()
+            return
+        reviewer_tree.configure(height=min(len(self.reviewers) + 1, 10))
+        for username, rev_stats in self.reviewer_stats.items():
+            rev_pct = (rev_stats["count"] / self.total_files * 100) if self.total_files > 0 else 0
+            reviewer_tree.insert("", tk.END, values=(
+                username,
+                rev_stats["alias"],
+                rev_stats["count"],
+                f"{rev_pct:.0f}%",
+            ))
+        if not self.reviewer_section.winfo_manager():
+            self.reviewer_section.pack(fill=tk.X, before=self.close_separator)
@@ -1,25 +1,146 @@
 import logging
 import os
 import re
+import threading
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 
-from gui_components.gui_theme import PAD_MD, PAD_LG, PAD_SM, FONT_BODY, FONT_SMALL
+from gui_components.gui_theme import PAD_MD, PAD_LG, PAD_SM, FONT_SMALL, COLOR_STATUS_BG
 from models.directory_entry import DirectoryEntry
 from models.file_entry import FileEntry
 from models.project_config import DEFAULT_INDIVIDUAL_ID_REGEX
+from services.file_catalog import FileCatalog
 from services.project_service import ProjectService
+from services.project_store import SQLITE_PROJECT_EXTENSION
+
+
+# Minimum interval between checkbox tree rebuilds while scan results stream in
+SCAN_TREE_REFRESH_MS = 500
+
+
+class _ScanCancelled(Exception):
+    """Raised from the scan progress callback when the scan has been cancelled or superseded."""
+    pass
+
+
+# Size (px) of the check box image drawn in front of each row of the file selection tree
+CHECK_IMAGE_SIZE = 13
+
+
+class FileSelectionModel:
+    """
+    Check state for a set of '/'-separated relative file paths, arranged as a directory tree.
+
+    Holds no widgets, so select-all/deselect-all and directory toggles are set operations,
+    and per-directory checked counts are kept up to date for tri-state directory glyphs.
+    Directories are identified by their relative path ('' for the root).
+    """
+
+    def __init__(self, rel_paths, unchecked=()):
+        """
+        :param rel_paths: File paths to show; every file starts checked unless listed in `unchecked`.
+        :param unchecked: Paths to start unchecked (paths not in `rel_paths` are ignored).
+        """
+        self._subdirs = {"": set()}   # dir -> child directory paths
+        self._files = {"": []}        # dir -> file paths directly inside it
+        self._file_count = {"": 0}    # dir -> files in its whole subtree
+        for rel in rel_paths:
+            parent = ""
+            for part in rel.split("/")[:-1]:
+                child = f"{parent}/{part}" if parent else part
+                if child not in self._subdirs:
+                    self._subdirs[child] = set()
+                    self._files[child] = []
+                    self._file_count[child] = 0
+                    self._subdirs[parent].add(child)
+                parent = child
+            self._files[parent].append(rel)
+            for directory in self._ancestors(rel):
+                self._file_count[directory] += 1
+
+        self._checked = set(rel_paths) - set(unchecked)
+        self._checked_count = dict.fromkeys(self._file_count, 0)
+        for rel in self._checked:
+            for directory in self._ancestors(rel):
+                self._checked_count[directory] += 1
+
+    @staticmethod
+    def _ancestors(path):
+        """Directories containing `path`, from the root down."""
+        parts = path.split("/")[:-1]
+        return [""] + ["/".join(parts[:i + 1]) for i in range(len(parts))]
+
+    @property
+    def total(self):
+        return self._file_count[""]
+
+    @property
+    def selected(self):
+        return self._checked_count[""]
+
+    def children(self, directory=""):
+        """Return (subdirectory paths, file paths) directly inside `directory`, each sorted."""
+        return sorted(self._subdirs[directory]), sorted(self._files[directory])
+
+    def is_checked(self, rel):
+        return rel in self._checked
+
+    def dir_state(self, directory):
+        """'checked', 'unchecked' or 'partial' for a directory's subtree."""
+        checked = self._checked_count[directory]
+        if checked == 0:
+            return "unchecked"
+        return "checked" if checked == self._file_count[directory] else "partial"
+
+    def set_checked(self, rel, checked):
+        if checked == (rel in self._checked):
+            return
+        if checked:
+            self._checked.add(rel)
+        else:
+            self._checked.discard(rel)
+        for directory in self._ancestors(rel):
+            self._checked_count[directory] += 1 if checked else -1
+
+    def set_dir_checked(self, directory, checked):
+        """Check or uncheck every file under `directory`."""
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            stack.extend(self._subdirs[current])
+            for rel in self._files[current]:
+                self.set_checked(rel, checked)
+
+    def set_all(self, checked):
+        if checked:
+            self._checked = {rel for files in self._files.values() for rel in files}
+            self._checked_count = dict(self._file_count)
+        else:
+            self._checked = set()
+            self._checked_count = dict.fromkeys(self._file_count, 0)
+
+    def checked_paths(self):
+        return sorted(self._checked)
+
+    def unchecked_paths(self):
+        return {rel for files in self._files.values() for rel in files} - self._checked
 
 
 class NewProjectDialog(tk.Toplevel):
-    def __init__(self, parent):
+    def __init__(self, parent, file_catalog=None):
         super().__init__(parent)
         self.title("New Project")
         self.resizable(True, True)
 
         self.project_service = ProjectService()
+        self.file_catalog = file_catalog if file_catalog is not None else FileCatalog()
         self.created_project_path = None
-        self._file_vars = {}   # relative_path -> BooleanVar
+        self._selection = FileSelectionModel([])
+        self._open_dirs = set()  # directories expanded in the tree, kept open across rebuilds
+        self._scan_paths = []  # relative paths found by the latest scan (unflattened)
+        self._scan_generation = 0  # bumped per scan; results from older scans are dropped
+        self._scanning = False
+        self._tree_refresh_after_id = None
 
         # ── Top form ────────────────────────────────────────────────────────
         form = ttk.Frame(self)
@@ -59,9 +180,12 @@ class NewProjectDialog(tk.Toplevel):
         self.flatten_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(
             opts_frame, text="Flatten by individual ID", variable=self.flatten_var,
-            command=self._on_scan
+            command=self._refresh_tree
         ).pack(side=tk.LEFT, padx=(0, PAD_LG))
         ttk.Button(opts_frame, text="Scan for Files", command=self._on_scan).pack(side=tk.LEFT)
+        self.cancel_scan_button = ttk.Button(opts_frame, text="Cancel Scan", command=self._cancel_scan,
+                                             state=tk.DISABLED)
+        self.cancel_scan_button.pack(side=tk.LEFT, padx=PAD_SM)
         self.scan_count_label = ttk.Label(opts_frame, text="", font=FONT_SMALL, foreground="gray")
         self.scan_count_label.pack(side=tk.LEFT, padx=PAD_MD)
 
@@ -76,19 +200,20 @@ class NewProjectDialog(tk.Toplevel):
         self.selected_count_label = ttk.Label(sel_bar, text="No files scanned yet.", font=FONT_SMALL, foreground="gray")
         self.selected_count_label.pack(side=tk.LEFT, padx=PAD_MD)
 
-        # Scrollable canvas for checkboxes
-        canvas_frame = ttk.Frame(preview_frame)
-        canvas_frame.pack(fill=tk.BOTH, expand=True, padx=PAD_SM, pady=PAD_SM)
-        self.canvas = tk.Canvas(canvas_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Only expanded directories have their children inserted, so large scans stay responsive
+        tree_frame = ttk.Frame(preview_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=PAD_SM, pady=PAD_SM)
+        self.file_tree = ttk.Treeview(tree_frame, show="tree", selectmode="none")
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.file_tree.yview)
+        self.file_tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.scroll_frame = ttk.Frame(self.canvas)
-        self._scroll_window = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
-        self.scroll_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-        self.canvas.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 * (e.delta // 120), "units"))
+        self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.file_tree.tag_configure("unchecked", foreground="gray")
+        self._check_images = {state: self._make_check_image(state) for state in ("checked", "unchecked", "partial")}
+        self.file_tree.bind("<<TreeviewOpen>>", self._on_tree_open)
+        self.file_tree.bind("<<TreeviewClose>>", self._on_tree_close)
+        self.file_tree.bind("<Button-1>", self._on_tree_click)
+        self.file_tree.bind("<space>", self._on_tree_space)
 
         # ── Bottom buttons ───────────────────────────────────────────────────
         btn_frame = ttk.Frame(self)
@@ -98,20 +223,12 @@ class NewProjectDialog(tk.Toplevel):
 
         self.minsize(520, 460)
 
-    # ── Scrollable canvas helpers ────────────────────────────────────────────
-
-    def _on_frame_configure(self, event=None):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def _on_canvas_configure(self, event):
-        self.canvas.itemconfig(self._scroll_window, width=event.width)
-
     # ── File browsing ────────────────────────────────────────────────────────
 
     def select_file(self):
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json")],
+            filetypes=[("JSON files", "*.json"), ("SQLite projects", f"*{SQLITE_PROJECT_EXTENSION}")],
             title="Save Project File"
         )
         if not file_path:
@@ -152,32 +269,103 @@ class NewProjectDialog(tk.Toplevel):
         if not data_root or not os.path.isdir(data_root):
             return
         extensions = self._parse_extensions()
-        flatten = self.flatten_var.get()
-        self._scan_files(data_root, extensions, flatten)
-
-    def _scan_files(self, data_root, extensions, flatten):
-        """Walk data_root, collect matching files, rebuild checkbox tree."""
-        # Collect all matching relative paths
-        found = []
-        for dirpath, _dirs, filenames in os.walk(data_root):
-            for filename in sorted(filenames):
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in extensions:
-                    rel = os.path.relpath(os.path.join(dirpath, filename), data_root)
-                    rel = rel.replace("\\", "/")
-                    found.append(rel)
-
-        # Optionally flatten by individual ID
-        if flatten:
-            found = self._flatten_paths(found)
+        self._scan_files(data_root, extensions)
+
+    def _scan_files(self, data_root, extensions):
+        """
+        Refresh the file catalog for data_root on a background thread.
+
+        Files stream into the checkbox tree as directories are listed; once the scan completes
+        the tree is rebuilt from the catalog. Starting a new scan supersedes any running one.
+        """
+        self._scan_generation += 1
+        generation = self._scan_generation
+        self._scan_paths = []
+        self._scanning = True
+        self.cancel_scan_button.config(state=tk.NORMAL)
+        self.scan_count_label.config(text="Scanning...")
+        self._refresh_tree()
+
+        def post(callback):
+            # The dialog may have been closed or a newer scan started since this one began
+            if generation != self._scan_generation:
+                raise _ScanCancelled()
+            self.after(0, callback)
+
+        def progress_callback(new_paths, found_count):
+            post(lambda: self._on_scan_progress(generation, new_paths, found_count))
+
+        def _scan():
+            try:
+                self.file_catalog.refresh(data_root, extensions, progress_callback=progress_callback)
+                found = [entry.rel_path for entry in self.file_catalog.files(data_root, extensions)]
+                post(lambda: self._on_scan_complete(generation, found))
+            except _ScanCancelled:
+                logging.info(f"Scan of {data_root} cancelled")
+            except Exception as e:
+                logging.error(f"Error scanning {data_root}: {e}")
+                try:
+                    post(lambda: self._on_scan_failed(generation, str(e)))
+                except (_ScanCancelled, tk.TclError):
+                    pass
+
+        threading.Thread(target=_scan, daemon=True).start()
+
+    def _cancel_scan(self):
+        """Stop the running scan, keeping the files found so far in the tree."""
+        if not self._scanning:
+            return
+        self._scan_generation += 1
+        self._finish_scan(f"Scan cancelled - {len(self._scan_paths)} files found so far")
+        self._refresh_tree()
+
+    def _on_scan_progress(self, generation, new_paths, found_count):
+        """Main thread: add a batch of streamed scan results."""
+        if generation != self._scan_generation:
+            return
+        self._scan_paths.extend(new_paths)
+        self.scan_count_label.config(text=f"Scanning... {found_count} files found")
+        # Rebuilding the tree is relatively expensive, so coalesce batches
+        if self._tree_refresh_after_id is None:
+            self._tree_refresh_after_id = self.after(SCAN_TREE_REFRESH_MS, self._refresh_tree)
+
+    def _on_scan_complete(self, generation, found):
+        if generation != self._scan_generation:
+            return
+        self._scan_paths = found
+        self._finish_scan(f"{len(found)} files found")
+        self._refresh_tree()
 
-        self.scan_count_label.config(text=f"{len(found)} files found")
+    def _on_scan_failed(self, generation, error_msg):
+        if generation != self._scan_generation:
+            return
+        self._finish_scan("Scan failed")
+        messagebox.showerror("Scan Failed", f"Unable to scan the data root: {error_msg}")
+
+    def _finish_scan(self, status_text):
+        self._scanning = False
+        self.cancel_scan_button.config(state=tk.DISABLED)
+        self.scan_count_label.config(text=status_text)
+
+    def _refresh_tree(self):
+        """Rebuild the selection tree from the current scan results, keeping each file's checked state."""
+        if self._tree_refresh_after_id is not None:
+            self.after_cancel(self._tree_refresh_after_id)
+            self._tree_refresh_after_id = None
+        found = sorted(self._scan_paths)
+        if self.flatten_var.get():
+            found = self._flatten_paths(found)
         self._build_checkbox_tree(found)
         self._update_count_label()
 
+    def destroy(self):
+        self._scan_generation += 1  # stop any running scan
+        super().destroy()
+
     def _flatten_paths(self, rel_paths):
         """Remap paths to individual/filename using DEFAULT_INDIVIDUAL_ID_REGEX."""
         result = []
+        seen = set()
         unknown_count = {}
         for rel in rel_paths:
             filename = rel.split("/")[-1]
@@ -191,76 +379,156 @@ class NewProjectDialog(tk.Toplevel):
                 individual = "Unknown"
             # Avoid collisions if same filename appears under same individual
             candidate = f"{individual}/{filename}"
-            if candidate in result:
+            if candidate in seen:
                 stem, ext_part = os.path.splitext(filename)
                 n = unknown_count.get(candidate, 1)
                 candidate = f"{individual}/{stem}_{n}{ext_part}"
                 unknown_count[f"{individual}/{filename}"] = n + 1
             result.append(candidate)
+            seen.add(candidate)
         return result
 
-    # ── Checkbox tree building ───────────────────────────────────────────────
+    # ── Selection tree ───────────────────────────────────────────────────────
 
-    def _build_checkbox_tree(self, rel_paths):
-        """Rebuild scroll_frame with a hierarchical checkbox list."""
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-        self._file_vars.clear()
+    def _make_check_image(self, state):
+        """Draw a check box image: empty when unchecked, filled when checked, half-filled when partial."""
+        size = CHECK_IMAGE_SIZE
+        image = tk.PhotoImage(master=self, width=size, height=size)
+        image.put("#808080", to=(0, 0, size, size))
+        image.put("#ffffff", to=(1, 1, size - 1, size - 1))
+        if state == "checked":
+            image.put(COLOR_STATUS_BG, to=(3, 3, size - 3, size - 3))
+        elif state == "partial":
+            image.put("#a0a0a0", to=(3, 3, size - 3, size - 3))
+        return image
 
-        # Build a nested dict tree from paths
-        tree = {}
-        for rel in rel_paths:
-            parts = rel.split("/")
-            node = tree
-            for part in parts[:-1]:
-                node = node.setdefault(part, {})
-            node[parts[-1]] = rel  # leaf: value is the full relative path
-
-        self._render_tree_node(tree, depth=0, parent_rel="")
-
-    def _render_tree_node(self, node, depth, parent_rel):
-        indent = depth * 16
-        for name, value in sorted(node.items(), key=lambda kv: (isinstance(kv[1], dict), kv[0])):
-            if isinstance(value, dict):
-                # Directory label
-                lbl = ttk.Label(self.scroll_frame, text=f"[{name}]", font=FONT_BODY)
-                lbl.pack(anchor=tk.W, padx=(PAD_SM + indent, PAD_SM), pady=1)
-                self._render_tree_node(value, depth + 1, f"{parent_rel}/{name}" if parent_rel else name)
+    def _build_checkbox_tree(self, rel_paths):
+        """Replace the selection model with `rel_paths` and show its top level (plus previously open directories)."""
+        self._selection = FileSelectionModel(rel_paths, unchecked=self._selection.unchecked_paths())
+        self.file_tree.delete(*self.file_tree.get_children())
+        self._insert_children("")
+
+    @staticmethod
+    def _dir_iid(directory):
+        return "d:" + directory if directory else ""
+
+    @staticmethod
+    def _file_iid(rel):
+        return "f:" + rel
+
+    def _insert_children(self, directory):
+        """Insert the rows directly under `directory`; subdirectories get a placeholder until opened."""
+        parent_iid = self._dir_iid(directory)
+        subdirs, files = self._selection.children(directory)
+        for subdir in subdirs:
+            iid = self._dir_iid(subdir)
+            state = self._selection.dir_state(subdir)
+            self.file_tree.insert(parent_iid, tk.END, iid=iid, text=subdir.rsplit("/", 1)[-1],
+                                  image=self._check_images[state], tags=(state,))
+            if subdir in self._open_dirs:
+                self._insert_children(subdir)
+                self.file_tree.item(iid, open=True)
             else:
-                # File checkbox
-                var = tk.BooleanVar(value=True)
-                self._file_vars[value] = var
-                cb = ttk.Checkbutton(
-                    self.scroll_frame, text=name, variable=var,
-                    command=self._update_count_label
-                )
-                cb.pack(anchor=tk.W, padx=(PAD_SM + indent, PAD_SM), pady=1)
+                self.file_tree.insert(iid, tk.END, iid="placeholder:" + subdir, text="")
+        for rel in files:
+            state = "checked" if self._selection.is_checked(rel) else "unchecked"
+            self.file_tree.insert(parent_iid, tk.END, iid=self._file_iid(rel), text=rel.rsplit("/", 1)[-1],
+                                  image=self._check_images[state], tags=(state,))
+
+    def _on_tree_open(self, event=None):
+        iid = self.file_tree.focus()
+        if not iid.startswith("d:"):
+            return
+        directory = iid[2:]
+        self._open_dirs.add(directory)
+        placeholder = "placeholder:" + directory
+        if self.file_tree.exists(placeholder):
+            self.file_tree.delete(placeholder)
+            self._insert_children(directory)
+
+    def _on_tree_close(self, event=None):
+        iid = self.file_tree.focus()
+        if iid.startswith("d:"):
+            self._open_dirs.discard(iid[2:])
+
+    def _on_tree_click(self, event):
+        # Files toggle anywhere on the row, directories only on their check box so the name can be used to expand
+        iid = self.file_tree.identify_row(event.y)
+        if not iid:
+            return
+        element = self.file_tree.identify_element(event.x, event.y)
+        if iid.startswith("f:") or "image" in element:
+            self.file_tree.focus(iid)
+            self._toggle(iid)
+
+    def _on_tree_space(self, event=None):
+        iid = self.file_tree.focus()
+        if iid:
+            self._toggle(iid)
+        return "break"
+
+    def _toggle(self, iid):
+        """Flip a file, or every file under a directory, then redraw the affected visible rows."""
+        if iid.startswith("f:"):
+            rel = iid[2:]
+            self._selection.set_checked(rel, not self._selection.is_checked(rel))
+            self._refresh_rows(rel, subtree=None)
+        elif iid.startswith("d:"):
+            directory = iid[2:]
+            self._selection.set_dir_checked(directory, self._selection.dir_state(directory) != "checked")
+            self._refresh_rows(directory, subtree=directory)
+        self._update_count_label()
+
+    def _refresh_rows(self, path, subtree):
+        """Redraw the check boxes of `path`'s ancestor directories and, if given, every materialized row under `subtree`."""
+        directories = FileSelectionModel._ancestors(path)[1:]
+        if subtree is not None:
+            directories.append(subtree)
+        for directory in directories:
+            self._set_row_state(self._dir_iid(directory), self._selection.dir_state(directory))
+        if subtree is not None:
+            self._refresh_subtree(self._dir_iid(subtree))
+        elif path:
+            self._set_row_state(self._file_iid(path), "checked" if self._selection.is_checked(path) else "unchecked")
+
+    def _refresh_subtree(self, parent_iid):
+        """Redraw every materialized row below `parent_iid`."""
+        for iid in self.file_tree.get_children(parent_iid):
+            if iid.startswith("d:"):
+                self._set_row_state(iid, self._selection.dir_state(iid[2:]))
+                self._refresh_subtree(iid)
+            elif iid.startswith("f:"):
+                self._set_row_state(iid, "checked" if self._selection.is_checked(iid[2:]) else "unchecked")
+
+    def _set_row_state(self, iid, state):
+        if not self.file_tree.exists(iid):
+            return
+        self.file_tree.item(iid, image=self._check_images[state], tags=(state,))
 
     # ── Select all / deselect all ────────────────────────────────────────────
 
     def _select_all(self):
-        for var in self._file_vars.values():
-            var.set(True)
+        self._selection.set_all(True)
+        self._refresh_subtree("")
         self._update_count_label()
 
     def _deselect_all(self):
-        for var in self._file_vars.values():
-            var.set(False)
+        self._selection.set_all(False)
+        self._refresh_subtree("")
         self._update_count_label()
 
     def _update_count_label(self):
-        total = len(self._file_vars)
-        selected = sum(1 for v in self._file_vars.values() if v.get())
+        total = self._selection.total
         if total == 0:
             self.selected_count_label.config(text="No files scanned yet.")
         else:
-            self.selected_count_label.config(text=f"{selected} of {total} selected")
+            self.selected_count_label.config(text=f"{self._selection.selected} of {total} selected")
 
     # ── Project creation ─────────────────────────────────────────────────────
 
     def _build_entries_from_checked(self):
         """Convert checked file vars into a DirectoryEntry/FileEntry tree."""
-        checked = [rel for rel, var in self._file_vars.items() if var.get()]
+        checked = self._selection.checked_paths()
 
         # Build nested dict: dir_name -> {... -> relative_path}
         root_dict = {}
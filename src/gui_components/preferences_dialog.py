@@ -7,12 +7,15 @@ from gui_components.gui_theme import PAD_MD, PAD_LG
 class PreferencesDialog(tk.Toplevel):
     """Dialog for editing user preferences."""
 
-    def __init__(self, parent, comment_save_delay=500, info_pane_max_width=300):
+    def __init__(self, parent, comment_save_delay=500, info_pane_max_width=300, data_cache_max_mb=2048,
+                 project_save_delay=1000):
         super().__init__(parent)
         self.title("Preferences")
         self.result_ready = False
         self.result_comment_save_delay = None
         self.result_info_pane_max_width = None
+        self.result_data_cache_max_mb = None
+        self.result_project_save_delay = None
 
         # Comment auto-save delay
         ttk.Label(self, text="Comment auto-save delay (ms):").grid(
@@ -30,9 +33,25 @@ class PreferencesDialog(tk.Toplevel):
                      textvariable=self.max_width_var, width=8).grid(
             row=1, column=1, sticky=tk.EW, padx=PAD_LG, pady=PAD_MD)
 
+        # Parsed-data cache disk budget (0 disables the cache)
+        ttk.Label(self, text="Data cache size (MB, 0 = off):").grid(
+            row=2, column=0, sticky=tk.W, padx=PAD_LG, pady=PAD_MD)
+        self.cache_size_var = tk.IntVar(value=data_cache_max_mb)
+        ttk.Spinbox(self, from_=0, to=102400, increment=512,
+                     textvariable=self.cache_size_var, width=8).grid(
+            row=2, column=1, sticky=tk.EW, padx=PAD_LG, pady=PAD_MD)
+
+        # Quiet period before edits are written to the project file (0 saves on every edit)
+        ttk.Label(self, text="Project save delay (ms, 0 = immediate):").grid(
+            row=3, column=0, sticky=tk.W, padx=PAD_LG, pady=PAD_MD)
+        self.save_delay_var = tk.IntVar(value=project_save_delay)
+        ttk.Spinbox(self, from_=0, to=10000, increment=250,
+                     textvariable=self.save_delay_var, width=8).grid(
+            row=3, column=1, sticky=tk.EW, padx=PAD_LG, pady=PAD_MD)
+
         # Buttons
         button_frame = ttk.Frame(self)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=PAD_LG)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=PAD_LG)
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=PAD_MD)
         ttk.Button(button_frame, text="Save", command=self._save).pack(side=tk.LEFT, padx=PAD_MD)
 
@@ -42,6 +61,8 @@ class PreferencesDialog(tk.Toplevel):
         try:
             self.result_comment_save_delay = self.delay_var.get()
             self.result_info_pane_max_width = self.max_width_var.get()
+            self.result_data_cache_max_mb = self.cache_size_var.get()
+            self.result_project_save_delay = self.save_delay_var.get()
         except (tk.TclError, ValueError):
             return
         self.result_ready = True
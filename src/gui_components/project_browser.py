@@ -7,6 +7,193 @@ from models.directory_entry import DirectoryEntry
 from models.file_entry import FileEntry
 
 
+# Delay after the last keystroke before the filter text is applied
+FILTER_DELAY_MS = 200
+
+# Status filter choice -> verification color it keeps
+STATUS_FILTER_COLORS = {"Verified": "green", "Partial": "yellow", "Unverified": "red"}
+
+# A filter showing at most this many nodes opens every directory leading to a match
+FILTER_EXPAND_LIMIT = 2000
+
+
+class ProjectTreeModel:
+    """
+    The project tree as shown in the Project Browser, kept beside the Treeview.
+
+    Holds every node's text and children in project order, a file id -> node map, a lowercase
+    filename index and every file's verification color, with per-directory color counts rolled up
+    from the files below. The browser only inserts a directory's children into the Treeview when
+    the directory is first opened, and applies filters by detaching and reattaching nodes; both
+    read the tree from here. A filter yields the set of nodes to show (matching files plus their
+    ancestors). Nodes are identified by their Treeview iid.
+    """
+
+    def __init__(self):
+        self._children = {"": []}  # node -> child nodes in project order ("" = above the project root)
+        self._parent = {}
+        self._texts = {}           # node -> displayed text
+        self._file_names = {}      # file node -> lowercase filename
+        self._colors = {}          # file node -> "green" / "yellow" / "red"
+        self._color_counts = {}    # directory node -> {color: files in its subtree}
+        self._file_nodes = {}      # file id -> file node
+        self._file_ids = {}        # file node -> file id
+        self._last_match = None    # (text, status, matching file nodes) of the last filter
+
+    def add_directory(self, iid, parent, text):
+        """Register a directory node (or the project root, with parent "") as the last child of parent."""
+        self._add(iid, parent, text)
+        self._color_counts[iid] = {}
+
+    def add_file(self, iid, parent, file_id, text, color):
+        """Register a file node as the last child of parent."""
+        self._add(iid, parent, text)
+        self._file_names[iid] = text.split('\\')[-1].lower()
+        self._file_nodes[file_id] = iid
+        self._file_ids[iid] = file_id
+        self._colors[iid] = color
+        self._count_color(iid, color, 1)
+
+    def _add(self, iid, parent, text):
+        self._children[iid] = []
+        self._children[parent].append(iid)
+        self._parent[iid] = parent
+        self._texts[iid] = text
+        self._last_match = None
+
+    def remove(self, iid):
+        """Unregister a node and its subtree."""
+        for child in list(self._children[iid]):
+            self.remove(child)
+        if iid in self._colors:
+            self._count_color(iid, self._colors.pop(iid), -1)
+            del self._file_names[iid]
+            file_id = self._file_ids.pop(iid)
+            if self._file_nodes.get(file_id) == iid:
+                del self._file_nodes[file_id]
+        self._color_counts.pop(iid, None)
+        self._children[self._parent.pop(iid)].remove(iid)
+        del self._children[iid]
+        del self._texts[iid]
+        self._last_match = None
+
+    def move(self, iid, parent):
+        """Move a file node to the end of another directory."""
+        color = self._colors[iid]
+        self._count_color(iid, color, -1)
+        self._children[self._parent[iid]].remove(iid)
+        self._children[parent].append(iid)
+        self._parent[iid] = parent
+        self._count_color(iid, color, 1)
+
+    def is_file(self, iid):
+        return iid in self._file_ids
+
+    def has_children(self, iid):
+        return bool(self._children[iid])
+
+    def text(self, iid):
+        return self._texts[iid]
+
+    def file_id(self, iid):
+        """The file id shown by a file node."""
+        return self._file_ids[iid]
+
+    def color(self, iid):
+        """A file node's verification color."""
+        return self._colors[iid]
+
+    def parent(self, iid):
+        return self._parent[iid]
+
+    def file_node(self, file_id):
+        """The node showing file_id, or None."""
+        return self._file_nodes.get(file_id)
+
+    def set_color(self, iid, color):
+        """Record a file node's new verification color."""
+        previous = self._colors.get(iid)
+        if previous is None or previous == color:
+            return
+        self._count_color(iid, previous, -1)
+        self._count_color(iid, color, 1)
+        self._colors[iid] = color
+        self._last_match = None
+
+    def _count_color(self, iid, color, delta):
+        """Adjust the color counts of every directory above a file node."""
+        node = self._parent[iid]
+        while node:
+            counts = self._color_counts[node]
+            counts[color] = counts.get(color, 0) + delta
+            node = self._parent[node]
+
+    def children(self, iid, visible=None):
+        """Child nodes of iid in project order, restricted to the `visible` set unless it is None."""
+        if visible is None:
+            return list(self._children[iid])
+        return [child for child in self._children[iid] if child in visible]
+
+    def matching_files(self, text="", status="All"):
+        """
+        File nodes whose filename contains text (case-insensitive) and whose color matches status.
+
+        A text containing the previous one is only checked against the previous matches, and a
+        status filter skips every directory whose color counts have no file of that color.
+        """
+        color = STATUS_FILTER_COLORS.get(status)
+        text = text.lower()
+        last = self._last_match
+        if last is not None and last[1] == status and last[0] in text:
+            candidates = last[2]
+        elif color is not None:
+            candidates = self._files_with_color(color)
+        else:
+            candidates = self._file_names
+        matches = {iid for iid in candidates if text in self._file_names[iid]} if text else set(candidates)
+        self._last_match = (text, status, matches)
+        return matches
+
+    def _files_with_color(self, color):
+        """File nodes of one color, descending only into directories that contain some."""
+        found = []
+        stack = [""]
+        while stack:
+            for child in self._children[stack.pop()]:
+                if child in self._colors:
+                    if self._colors[child] == color:
+                        found.append(child)
+                elif self._color_counts.get(child, {}).get(color):
+                    stack.append(child)
+        return found
+
+    def visible_nodes(self, text="", status="All"):
+        """
+        Nodes to show for a filter: matching files and their ancestors, or None (everything) without one.
+        """
+        if not text and status not in STATUS_FILTER_COLORS:
+            return None
+        visible = set()
+        for iid in self.matching_files(text, status):
+            while iid and iid not in visible:
+                visible.add(iid)
+                iid = self._parent[iid]
+        # The project root stays visible even when nothing matches
+        visible.update(self._children[""])
+        return visible
+
+    def changed_parents(self, old_visible, new_visible):
+        """Nodes whose shown children differ between two visible_nodes results."""
+        if old_visible is None and new_visible is None:
+            return []
+        if old_visible is None or new_visible is None:
+            shown = old_visible if new_visible is None else new_visible
+            changed = self._parent.keys() - shown
+        else:
+            changed = old_visible ^ new_visible
+        return {self._parent[iid] for iid in changed}
+
+
 class ProjectBrowser(ttk.Frame):
     def __init__(self, parent, project_service, **kwargs):
         super().__init__(parent, **kwargs)
@@ -18,6 +205,11 @@ class ProjectBrowser(ttk.Frame):
         self.title_label.pack(side=tk.TOP, anchor=tk.W, padx=PAD_SM, pady=PAD_SM)
 
         # Create filter bar between title and tree
+        self._tree_model = ProjectTreeModel()
+        self._populated = {""}      # Nodes whose children have been inserted into the Treeview
+        self._node_counter = 0      # For generated iids
+        self._visible_nodes = None  # Nodes shown by the current filter, None = all
+        self._filter_job = None     # Pending debounced _apply_filter
         self._create_filter_bar()
 
         # Create a frame for Treeview to ensure tight layout
@@ -39,6 +231,7 @@ class ProjectBrowser(ttk.Frame):
 
         self.tree.bind("<Button-3>", self.show_context_menu)  # Right-click on Windows/Linux
         self.tree.bind("<Double-1>", self.on_double_click)
+        self.tree.bind("<<TreeviewOpen>>", self._on_tree_open)
 
         # Drag-and-drop state
         self._drag_source_fid = None   # file entry UUID being dragged
@@ -56,7 +249,7 @@ class ProjectBrowser(ttk.Frame):
 
         self.filter_entry = ttk.Entry(filter_frame)
         self.filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, PAD_SM))
-        self.filter_entry.bind("<KeyRelease>", lambda e: self._apply_filter())
+        self.filter_entry.bind("<KeyRelease>", lambda e: self._schedule_filter())
 
         self.status_filter_var = tk.StringVar(value="All")
         self.status_filter_combo = ttk.Combobox(
@@ -75,41 +268,43 @@ class ProjectBrowser(ttk.Frame):
         self.status_filter_var.set("All")
         self._apply_filter()
 
+    def _schedule_filter(self):
+        """Apply the filter once typing pauses for FILTER_DELAY_MS."""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DELAY_MS, self._apply_filter)
+
     def _apply_filter(self):
-        """Reload the tree with current filter criteria."""
-        self.tree.delete(*self.tree.get_children())
+        """
+        Show only the nodes matching the current filter criteria.
 
-        if not self.project_service or not self.project_service.current_project_config:
-            return
+        Nodes that change visibility are detached from or reattached to their parents in project
+        order; the rest of the tree is left as it is. Parents not populated yet pick the filter up
+        when they are.
+        """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
 
-        text_filter = self.filter_entry.get().strip().lower()
+        text_filter = self.filter_entry.get().strip()
         status_filter = self.status_filter_var.get()
-
-        proj_name = self.project_service.get_project_name()
-        root_node = self.tree.insert('', 'end', proj_name, text=proj_name, open=True)
-
-        for entry in self.project_service.get_entries():
-            self._populate_tree(root_node, entry, text_filter, status_filter)
-
-    def _entry_matches_filter(self, entry, text_filter, status_filter):
-        """Check if a file or directory (recursively) matches the filter criteria."""
-        if isinstance(entry, FileEntry):
-            filename = entry.path.split('/')[-1].split('\\')[-1].lower()
-            if text_filter and text_filter not in filename:
-                return False
-            if status_filter != "All":
-                color = self._get_verification_color(entry.verified_by)
-                if status_filter == "Verified" and color != "green":
-                    return False
-                if status_filter == "Partial" and color != "yellow":
-                    return False
-                if status_filter == "Unverified" and color != "red":
-                    return False
-            return True
-        elif isinstance(entry, DirectoryEntry):
-            return any(self._entry_matches_filter(child, text_filter, status_filter)
-                       for child in entry.entries)
-        return False
+        visible = self._tree_model.visible_nodes(text_filter, status_filter)
+        for parent in self._tree_model.changed_parents(self._visible_nodes, visible):
+            if parent in self._populated:
+                self.tree.set_children(parent, *self._tree_model.children(parent, visible))
+        self._visible_nodes = visible
+        if visible is not None and len(visible) <= FILTER_EXPAND_LIMIT:
+            self._expand_visible(visible)
+
+    def _expand_visible(self, visible):
+        """Open every visible directory so the matching files show without expanding by hand."""
+        stack = self._tree_model.children("", visible)
+        while stack:
+            iid = stack.pop()
+            if not self._tree_model.is_file(iid):
+                self._populate(iid)
+                self.tree.item(iid, open=True)
+                stack.extend(self._tree_model.children(iid, visible))
 
     def show_context_menu(self, event):
         iid = self.tree.identify_row(event.y)
@@ -132,8 +327,11 @@ class ProjectBrowser(ttk.Frame):
             self.project_service.add_directory(full_path, new_dir_name)
 
             # Create a unique ID for the new directory
-            new_id = f"{selected_item}/{new_dir_name}"
-            self.tree.insert(selected_item, 'end', new_id, text=new_dir_name)
+            self._populate(selected_item)
+            new_id = self._new_node_id()
+            self._tree_model.add_directory(new_id, selected_item, new_dir_name)
+            self._insert_node(selected_item, new_id)
+            self._show_node(new_id)
 
             # Expand all parent nodes to make sure the new item is visible
             self.tree.see(new_id)
@@ -181,8 +379,10 @@ class ProjectBrowser(ttk.Frame):
             file_entry = FileEntry(path=relative_path)
             self.project_service.add_file(full_path, file_entry)
 
-            self.tree.insert(selected_item, 'end', text=relative_path.split('/')[-1], values=(file_entry.id,))
-            self.update_tree_item_color(file_entry.id, file_entry.verified_by)
+            self._populate(selected_item)
+            file_node = self._add_file_node(selected_item, file_entry)
+            self._insert_node(selected_item, file_node)
+            self._show_node(file_node)
 
             # Open the file in the viewer
             self.parent.open_file(file_entry)
@@ -193,71 +393,114 @@ class ProjectBrowser(ttk.Frame):
 
     def update_tree_item_color(self, id, verified_by):
         """Update the color of the tree item based on the verified_by list."""
-        item_id = self.find_tree_item_by_id(id)
+        item_id = self._tree_model.file_node(id)
         if item_id:
             color = self._get_verification_color(verified_by)
-            self.tree.item(item_id, tags=(color,))
+            self._tree_model.set_color(item_id, color)
+            # Nodes not inserted yet take their color from the model when they are
+            if self.tree.exists(item_id):
+                self.tree.item(item_id, tags=(color,))
 
     def find_tree_item_by_id(self, id):
-        """Find the tree item ID for the given file ID."""
-        # Recursively search through all items in the tree
-        for item in self.tree.get_children(''):
-            result = self._search_tree(item, id)
-            if result:
-                return result
-        return None
-
-    def _search_tree(self, item, id):
-        """Helper function to recursively search the tree for a file ID."""
-        if self.tree.item(item, "values") and self.tree.item(item, "values")[0] == id:
-            return item
-        for child_item in self.tree.get_children(item):
-            result = self._search_tree(child_item, id)
-            if result:
-                return result
-        return None
+        """Find the tree item ID for the given file ID, inserting its directories' children if needed."""
+        item_id = self._tree_model.file_node(id)
+        if item_id:
+            node = self._tree_model.parent(item_id)
+            ancestors = []
+            while node:
+                ancestors.append(node)
+                node = self._tree_model.parent(node)
+            for node in reversed(ancestors):
+                self._populate(node)
+        return item_id
 
     def load_project(self):
         # Clear the tree first
         self.tree.delete(*self.tree.get_children())
+        self._tree_model = ProjectTreeModel()
+        self._populated = {""}
+        self._visible_nodes = None
 
         if not self.project_service or not self.project_service.current_project_config:
             return
 
         # Add root node
         proj_name = self.project_service.get_project_name()
-        root_node = self.tree.insert('', 'end', proj_name, text=proj_name, open=True)
+        root_node = self._new_node_id()
+        self._tree_model.add_directory(root_node, '', proj_name)
 
-        # Recursively add all directories and files
+        # Recursively add all directories and files to the model; the Treeview gets only the
+        # root's children now and each directory's children when it is first opened
         for entry in self.project_service.get_entries():
-            self._populate_tree(root_node, entry)
+            self._add_entry(root_node, entry)
+        self._insert_node('', root_node)
+        self._populate(root_node)
+        self.tree.item(root_node, open=True)
+
+        # Keep whatever filter is entered applied to the reloaded tree
+        self._apply_filter()
 
-    def _populate_tree(self, parent_node, entry, text_filter="", status_filter="All"):
+    def _new_node_id(self):
+        self._node_counter += 1
+        return f"node{self._node_counter}"
+
+    def _add_entry(self, parent_node, entry):
         """
-        Recursively populates the tree view with the given directory structure or file entry.
+        Recursively adds the given directory structure or file entry to the tree model.
         Args:
-            parent_node: The tree node under which the entries will be added.
+            parent_node: The node under which the entries will be added.
             entry: A DirectoryEntry or FileEntry instance to be added to the tree.
-            text_filter: Lowercase text to filter filenames by substring.
-            status_filter: "All", "Verified", or "Unverified".
         """
-        has_filter = text_filter or status_filter != "All"
-
         if isinstance(entry, DirectoryEntry):
-            if has_filter and not self._entry_matches_filter(entry, text_filter, status_filter):
-                return
-            # Add a directory node
-            dir_node = self.tree.insert(parent_node, 'end', text=entry.name, open=True)
-            # Recursively populate its children
+            dir_node = self._new_node_id()
+            self._tree_model.add_directory(dir_node, parent_node, entry.name)
             for child_entry in entry.entries:
-                self._populate_tree(dir_node, child_entry, text_filter, status_filter)
+                self._add_entry(dir_node, child_entry)
         elif isinstance(entry, FileEntry):
-            if has_filter and not self._entry_matches_filter(entry, text_filter, status_filter):
-                return
+            self._add_file_node(parent_node, entry)
+
+    def _add_file_node(self, parent_node, file_entry):
+        """Add a file node, colored by verification state, to the tree model and return its iid."""
+        file_node = self._new_node_id()
+        color_tag = self._get_verification_color(file_entry.verified_by)
+        self._tree_model.add_file(file_node, parent_node, file_entry.id, file_entry.path.split('/')[-1], color_tag)
+        return file_node
+
+    def _on_tree_open(self, event):
+        """Insert a directory's children the first time it is expanded."""
+        self._populate(self.tree.focus())
+
+    def _populate(self, iid):
+        """Insert the children of a node into the Treeview, once, in place of its placeholder."""
+        if iid in self._populated or not self.tree.exists(iid):
+            return
+        self._populated.add(iid)
+        self.tree.delete(*self.tree.get_children(iid))
+        for child in self._tree_model.children(iid):
+            self._insert_node(iid, child)
+        if self._visible_nodes is not None:
+            self.tree.set_children(iid, *self._tree_model.children(iid, self._visible_nodes))
+
+    def _insert_node(self, parent, iid):
+        """Insert one model node into the Treeview under parent."""
+        model = self._tree_model
+        if model.is_file(iid):
             # Use the file's id as a hidden value for easy lookup later
-            color_tag = self._get_verification_color(entry.verified_by)
-            self.tree.insert(parent_node, 'end', text=entry.path.split('/')[-1], values=(entry.id,),
-                             tags=(color_tag,))
+            self.tree.insert(parent, 'end', iid, text=model.text(iid), values=(model.file_id(iid),),
+                             tags=(model.color(iid),))
+        else:
+            self.tree.insert(parent, 'end', iid, text=model.text(iid))
+            if model.has_children(iid):
+                self._insert_placeholder(iid)
+
+    def _insert_placeholder(self, iid):
+        """Give an unpopulated directory an empty child so it shows an expand arrow."""
+        self.tree.insert(iid, 'end', text="")
+
+    def _show_node(self, iid):
+        """Keep a node the user just added visible under the current filter."""
+        if self._visible_nodes is not None:
+            self._visible_nodes.add(iid)
 
     def on_double_click(self, event):
         """Handle double-click on a tree item"""
@@ -297,6 +540,9 @@ class ProjectBrowser(ttk.Frame):
 
         # Remove the item from the tree view
         self.tree.delete(selected_item)
+        self._tree_model.remove(selected_item[0])
+        if self._visible_nodes is not None:
+            self._visible_nodes.discard(selected_item[0])
 
         self.parent.set_status(f"Deleted file: {file_entry.path}")
 
@@ -352,12 +598,27 @@ class ProjectBrowser(ttk.Frame):
             return
 
         target_path = self.get_full_path(target_iid)
-        self.project_service.move_file(fid, target_path)
-
-        # Refresh tree to reflect new structure
-        self.load_project()
+        # The service refuses moves it cannot resolve; the tree only follows a move that happened
+        if not self.project_service.move_file(fid, target_path):
+            self.parent.set_status(f"Could not move file to '{target_path or 'project root'}'.")
+            return
+        self._move_file_node(fid, target_iid)
         self.parent.set_status(f"Moved file to '{target_path or 'project root'}'.")
 
+    def _move_file_node(self, file_id, target_iid):
+        """Move a file's node to the end of a directory node, as ProjectService.move_file does with the entry."""
+        iid = self._tree_model.file_node(file_id)
+        if iid is None:
+            return
+        self._tree_model.move(iid, target_iid)
+        if target_iid in self._populated:
+            self.tree.move(iid, target_iid, 'end')
+        else:
+            # Inserted with the rest of the target's children when it is opened
+            self.tree.delete(iid)
+            if not self.tree.get_children(target_iid):
+                self._insert_placeholder(target_iid)
+
     def _restore_item_tags(self, iid):
         """Remove the drop_target tag from an item, restoring its original colour."""
         if not self.tree.exists(iid):
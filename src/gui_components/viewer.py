@@ -17,6 +17,7 @@ from gui_components.label_commands import (
     LabelCommandStack, CreateLabelCommand, DeleteLabelCommand,
     ResizeLabelCommand, ChangeBehaviorCommand
 )
+from input_types.lod_pyramid import LODPyramid
 from input_types.vectronic_motion import VectronicMotionInput
 from models.label import Label
 from models.input_settings import InputType
@@ -28,10 +29,11 @@ class Viewer(tk.Frame):
         self.parent = parent
         self.project_service = project_service
         self.info_pane = None
+        self.data_cache = None  # Optional DataCache shared across tabs
         self.axes_config = None
         self.active_axes = []
         self.data_path = None
-        self.data = None
+        self.data = None  # MappedData: int64 ms timestamps + float32 axes (memory-mapped when cached)
         self.labels = []
         self.start_label_time = None
         self.current_xlim = None  # used to keep pan/zoom consistent across user actions
@@ -41,8 +43,8 @@ class Viewer(tk.Frame):
         self.project_config = None
         self.file_entry = None  # Reference to the project config's FileEntry for the loaded CSV
         self._last_mouse_move = 0  # throttle timestamp for on_mouse_move
-        self._ts_numeric = None  # cached int64 ms timestamps for binary search
-        self._ts_naive = None  # cached tz-naive timestamp series
+        self._ts_numeric = None  # int64 ms timestamps for binary search (view of self.data, not a copy)
+        self._pyramid = None  # LODPyramid of self.data for display downsampling
         self._data_min = None  # cached min timestamp
         self._data_max = None  # cached max timestamp
         self._replot_after_id = None  # tkinter after() id for debounced replot
@@ -59,6 +61,10 @@ class Viewer(tk.Frame):
         """Sets a reference to the InfoPane instance."""
         self.info_pane = info_pane
 
+    def set_data_cache(self, data_cache):
+        """Sets the DataCache used to skip re-parsing previously loaded CSVs."""
+        self.data_cache = data_cache
+
     def setup_viewer(self):
         # Setup for the viewer (figure, canvas, etc.)
         self.fig, self.ax = plt.subplots(figsize=(10, 6))
@@ -178,24 +184,26 @@ class Viewer(tk.Frame):
 
         def _load():
             try:
-                data = input_interface.load_data(file_path)
-                input_interface.validate_format(data)
-                self.parent.after(0, lambda: self._on_load_complete(file_entry, file_path, input_interface, data))
+                data = input_interface.load_mapped(file_path)
+                pyramid = input_interface.load_pyramid(file_path, data)
+                self.parent.after(0, lambda: self._on_load_complete(file_entry, file_path, input_interface, data,
+                                                                    pyramid))
             except Exception as e:
                 logging.error(f"Error loading data from {file_path}: {e}")
                 self.parent.after(0, lambda: self.parent.set_status(f"Failed to load: {filename}"))
 
         threading.Thread(target=_load, daemon=True).start()
 
-    def _on_load_complete(self, file_entry, file_path, input_interface, data):
+    def _on_load_complete(self, file_entry, file_path, input_interface, data, pyramid=None):
         """Called on the main thread once background CSV load succeeds."""
+        self.release_data()
         self.data = data
+        self._pyramid = pyramid if pyramid is not None else LODPyramid.build(data)
 
-        # Cache timestamp data for performance
-        self._ts_numeric = self.data['Timestamp'].values.astype('int64') // 10**6  # ms as int64
-        self._ts_naive = self.data['Timestamp'].dt.tz_localize(None)
-        self._data_min = pd.Timestamp(self.data['Timestamp'].min()).tz_localize(None).to_pydatetime()
-        self._data_max = pd.Timestamp(self.data['Timestamp'].max()).tz_localize(None).to_pydatetime()
+        # Timestamps are already int64 ms, so no per-tab copies are needed
+        self._ts_numeric = data.timestamps_ms
+        self._data_min = pd.Timestamp(int(self._ts_numeric.min()), unit='ms').to_pydatetime()
+        self._data_max = pd.Timestamp(int(self._ts_numeric.max()), unit='ms').to_pydatetime()
 
         self.set_axes_config(input_interface.get_axes_config())
 
@@ -206,9 +214,25 @@ class Viewer(tk.Frame):
         self.setup_mouse_events()
 
         filename = os.path.basename(file_path)
-        self.parent.set_status(f"Loaded: {filename}")
+        backtracks = data.find_backtracks()
+        if len(backtracks):
+            logging.warning(f"{file_path} has {len(backtracks)} timestamp backtrack(s), first at sample {backtracks[0]}")
+            self.parent.set_status(f"Loaded: {filename} ({len(backtracks)} timestamp backtracks)")
+        else:
+            self.parent.set_status(f"Loaded: {filename}")
         self.update_label_list()
 
+    def release_data(self):
+        """Drop all references to the loaded data so its memory (or mapped pages) is freed immediately."""
+        if self.data is not None:
+            self.data.close()
+        self.data = None
+        self._pyramid = None
+        self._ts_numeric = None
+        self._data_min = None
+        self._data_max = None
+        self.ax.clear()
+
     def get_data_path(self):
         if self.data_path:
             # Return the filename without the .csv extension
@@ -247,22 +271,9 @@ class Viewer(tk.Frame):
         end_idx = min(len(self._ts_numeric), np.searchsorted(self._ts_numeric, xlim_max_ms + buffer_ms))
         return start_idx, end_idx
 
-    def _downsample_for_display(self, timestamps, values, max_points=4000):
-        """Downsample data for display, preserving visual peaks via min/max per chunk."""
-        n = len(timestamps)
-        if n <= max_points:
-            return timestamps, values
-        chunk_size = n // (max_points // 2)  # 2 points per chunk (min + max)
-        if chunk_size < 1:
-            return timestamps, values
-        indices = []
-        for i in range(0, n, chunk_size):
-            chunk = values[i:i + chunk_size]
-            if len(chunk) > 0:
-                indices.append(i + chunk.argmin())
-                indices.append(i + chunk.argmax())
-        indices = sorted(set(indices))
-        return timestamps[indices], values[indices]
+    def _downsample_for_display(self, column, start_idx, end_idx, max_points=4000):
+        """Downsample one axis of the visible range for display, preserving visual peaks via the LOD pyramid."""
+        return self._pyramid.downsample(self.data, column, start_idx, end_idx, max_points)
 
     def _schedule_replot(self):
         """Debounced replot after zoom/pan — waits 200ms of inactivity before replotting."""
@@ -325,13 +336,11 @@ class Viewer(tk.Frame):
 
         for axis_display in self.axes_config.axis_displays:
             # Ensure column exists in data
-            if axis_display.input_name in self.data.columns and axis_display.input_name in self.active_axes:
+            if axis_display.input_name in self.data and axis_display.input_name in self.active_axes:
                 color = axis_display.color
                 alpha = axis_display.alpha
-                visible_ts = self.data['Timestamp'].values[start_idx:end_idx]
-                visible_vals = self.data[axis_display.input_name].values[start_idx:end_idx]
-                ts, vals = self._downsample_for_display(visible_ts, visible_vals)
-                self.ax.plot(ts, vals, color=color, alpha=alpha,
+                ts, vals = self._downsample_for_display(axis_display.input_name, start_idx, end_idx)
+                self.ax.plot(ts.astype('datetime64[ms]'), vals, color=color, alpha=alpha,
                              label=axis_display.display_name)
 
         if self.current_xlim:
@@ -467,8 +476,8 @@ class Viewer(tk.Frame):
                 idx = min(max(idx, 0), len(self._ts_numeric) - 1)
 
                 for axis_display in self.axes_config.axis_displays:
-                    if axis_display.input_name in self.data.columns:
-                        data_values[axis_display.input_name] = f"{self.data.iloc[idx][axis_display.input_name]:.2f}"
+                    if axis_display.input_name in self.data:
+                        data_values[axis_display.input_name] = f"{self.data[axis_display.input_name][idx]:.2f}"
 
             # Update the InfoPane with current cursor position
             if self.info_pane:
@@ -741,7 +750,6 @@ class Viewer(tk.Frame):
             # Apply the new times directly (redo would double-apply since rect already moved)
             self.selected_label.start_time = new_start
             self.selected_label.end_time = new_end
-            self.selected_label.duration = self.selected_label.calculate_duration()
             self._command_stack._undo_stack.append(cmd)
             self._command_stack._redo_stack.clear()
 
@@ -839,7 +847,7 @@ class Viewer(tk.Frame):
 
     def zoom_out_to_show_all(self, event=None):
         """Zoom the plot to display all available data."""
-        if self.data is None or self.data.empty:
+        if self.data is None or len(self.data) == 0:
             self.parent.set_status("No data available to display.")
             return
 
@@ -884,6 +892,6 @@ class Viewer(tk.Frame):
 
         # Select the concrete input interface based on `input_type`
         if input_type == InputType.VECTRONIC_MOTION:
-            return VectronicMotionInput(frequency=frequency)
+            return VectronicMotionInput(frequency=frequency, cache=self.data_cache)
         else:
             raise ValueError(f"Unsupported input type: {input_type}")
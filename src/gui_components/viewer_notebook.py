@@ -55,8 +55,9 @@ class ViewerNotebook(ttk.Frame):
     Tabbed viewer container that wraps ttk.Notebook.
 
     Each tab holds one Viewer instance. Exposes the same interface as Viewer
-    so main.py and InfoPane can treat it transparently. Closing a tab calls
-    plt.close() on the figure to free matplotlib memory.
+    so main.py and InfoPane can treat it transparently. Closing a tab releases
+    the viewer's data arrays and calls plt.close() on the figure to free
+    matplotlib memory.
 
     Tab management:
       - Double-clicking a file in the project browser opens it in a new tab
@@ -73,6 +74,7 @@ class ViewerNotebook(ttk.Frame):
         # State shared across all tabs
         self._project_config = None
         self._info_pane = None
+        self._data_cache = None
 
         # Tab tracking: file_entry_id -> {'frame', 'viewer', 'entry'}
         self._tabs = {}
@@ -116,6 +118,8 @@ class ViewerNotebook(ttk.Frame):
             viewer.set_project_config(self._project_config)
         if self._info_pane:
             viewer.set_info_pane(self._info_pane)
+        if self._data_cache:
+            viewer.set_data_cache(self._data_cache)
 
         viewer.load_file_entry(file_entry)
 
@@ -140,6 +144,11 @@ class ViewerNotebook(ttk.Frame):
         for tab in self._tabs.values():
             tab['viewer'].set_info_pane(info_pane)
 
+    def set_data_cache(self, data_cache):
+        self._data_cache = data_cache
+        for tab in self._tabs.values():
+            tab['viewer'].set_data_cache(data_cache)
+
     def clear_plot(self):
         """Close all tabs (called when a new project is loaded)."""
         self._close_all_tabs()
@@ -297,6 +306,7 @@ class ViewerNotebook(ttk.Frame):
         if tab is None:
             return
         viewer = tab['viewer']
+        viewer.release_data()
         try:
             plt.close(viewer.fig)
         except Exception:
@@ -0,0 +1,37 @@
+import numpy as np
+
+MS_PER_HOUR = 3_600_000
+
+
+def find_backtracks(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Find samples whose timestamp is earlier than the sample before it.
+
+    Works on any monotonic integer time unit (ms for MappedData, ns for datetime64 views).
+
+    :param timestamps: int64 timestamps in file order.
+    :return: Indices i (>= 1) where timestamps[i] < timestamps[i - 1].
+    """
+    timestamps = np.asarray(timestamps)
+    if len(timestamps) < 2:
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(timestamps[1:] < timestamps[:-1]) + 1
+
+
+def find_midnight_rollovers(timestamps: np.ndarray, ticks_per_hour: int = MS_PER_HOUR) -> np.ndarray:
+    """
+    Find samples where the time of day wraps back into hour 0.
+
+    Vectronic files store only the time of day, so a file that runs past midnight keeps
+    the same date and shows up as a backtrack at the wrap; these are usually benign.
+
+    :param timestamps: int64 timestamps in file order.
+    :param ticks_per_hour: Timestamp ticks per hour (default: milliseconds).
+    :return: Indices i (>= 1) where time-of-day[i] < time-of-day[i - 1] and i falls in hour 0.
+    """
+    timestamps = np.asarray(timestamps)
+    if len(timestamps) < 2:
+        return np.empty(0, dtype=np.intp)
+    time_of_day = timestamps % (24 * ticks_per_hour)
+    wrapped = (time_of_day[1:] < time_of_day[:-1]) & (time_of_day[1:] < ticks_per_hour)
+    return np.flatnonzero(wrapped) + 1
@@ -0,0 +1,305 @@
+import hashlib
+import logging
+import os
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from input_types.lod_pyramid import LODPyramid
+from input_types.mapped_data import MappedData
+
+# Default location and disk budget for the parsed-data cache
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".accelscope_cache")
+DEFAULT_CACHE_MAX_MB = 2048
+
+# Bump whenever the on-disk layout changes so old entries are never read back
+CACHE_FORMAT_VERSION = 2
+
+
+class DataCache:
+    """
+    Persistent, content-keyed binary cache of parsed input files.
+
+    Each entry is an uncompressed .npz holding the combined int64 'Timestamp' column and the
+    float64 axis columns of one input file, plus the parsed frame's column order and axis dtypes
+    so a hit returns the same frame as parsing. The viewer additionally stores a compact sidecar
+    (int64 ms timestamps + float32 axes as plain .npy files) that can be memory-mapped, and
+    the min/max LOD pyramid built from it.
+    Entries are keyed by the source file's absolute path, mtime, size and the input settings
+    that produced them, so editing or replacing a CSV (or changing input settings) simply
+    misses the cache. All files sharing a key are evicted together, least-recently-used first,
+    whenever the cache grows past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        """
+        :param cache_dir: Directory holding the cache entries (created on first write).
+        :param max_bytes: Disk budget for all entries combined.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def make_key(self, file_path: str, settings_key: str) -> Optional[str]:
+        """
+        Build the content key for a source file, or None if the file cannot be stat'ed.
+
+        :param file_path: Path to the source data file.
+        :param settings_key: String describing the input settings used to parse the file.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        raw = f"{CACHE_FORMAT_VERSION}|{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|{settings_key}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str, suffix: str = ".npz") -> str:
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+
+    def get(self, file_path: str, settings_key: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for a source file, or None on a miss.
+
+        :param file_path: Path to the source data file.
+        :param settings_key: String describing the input settings used to parse the file.
+        """
+        key = self.make_key(file_path, settings_key)
+        if key is None:
+            return None
+        entry_path = self._entry_path(key)
+        if not os.path.isfile(entry_path):
+            return None
+
+        try:
+            with np.load(entry_path, allow_pickle=False) as entry:
+                timestamps = entry["timestamp"]
+                values = entry["values"]
+                columns = [str(c) for c in entry["columns"]]
+                dtypes = [str(d) for d in entry["dtypes"]]
+                order = [str(c) for c in entry["order"]]
+        except Exception as e:
+            logging.warning(f"Discarding unreadable cache entry {entry_path}: {e}")
+            self._remove(entry_path)
+            return None
+
+        self._touch(entry_path)
+
+        df = pd.DataFrame(values, columns=columns)
+        for column, dtype in zip(columns, dtypes):
+            if dtype != "float64":
+                df[column] = df[column].astype(dtype)
+        df["Timestamp"] = timestamps.view("datetime64[ns]")
+        df = df[order]
+        logging.debug(f"Cache hit for {file_path}")
+        return df
+
+    def put(self, file_path: str, settings_key: str, df: pd.DataFrame, columns: List[str]):
+        """
+        Store the 'Timestamp' and given axis columns of a parsed DataFrame, then enforce the disk budget.
+
+        :param file_path: Path to the source data file.
+        :param settings_key: String describing the input settings used to parse the file.
+        :param df: Parsed DataFrame containing 'Timestamp' and `columns`; its column order is restored by `get`.
+        :param columns: Axis column names to persist alongside the timestamps.
+        """
+        if self.max_bytes <= 0:
+            return
+        key = self.make_key(file_path, settings_key)
+        if key is None:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            timestamps = df["Timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+            values = df[columns].to_numpy(dtype=np.float64)
+            dtypes = np.array([str(df[column].dtype) for column in columns])
+            order = np.array([column for column in df.columns if column in columns or column == "Timestamp"])
+
+            # Atomic write so concurrent readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, timestamp=timestamps, values=values, columns=np.array(columns), dtypes=dtypes,
+                             order=order)
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                self._remove(temp_path)
+                raise
+        except Exception as e:
+            logging.warning(f"Unable to cache parsed data for {file_path}: {e}")
+            return
+
+        self.evict()
+
+    def get_mapped(self, file_path: str, settings_key: str, columns: List[str]) -> Optional[MappedData]:
+        """
+        Return the memory-mapped display sidecar for a source file, or None on a miss.
+
+        :param file_path: Path to the source data file.
+        :param settings_key: String describing the input settings used to parse the file.
+        :param columns: Axis column names stored in the sidecar, in order.
+        """
+        key = self.make_key(file_path, settings_key)
+        if key is None:
+            return None
+        ts_path, axes_path = self._entry_path(key, ".ts.npy"), self._entry_path(key, ".axes.npy")
+        if not (os.path.isfile(ts_path) and os.path.isfile(axes_path)):
+            return None
+
+        try:
+            mapped = MappedData.open(ts_path, axes_path, columns)
+        except Exception as e:
+            logging.warning(f"Discarding unreadable cache sidecar for {file_path}: {e}")
+            self._remove(ts_path)
+            self._remove(axes_path)
+            return None
+
+        self._touch(ts_path)
+        logging.debug(f"Mapped cache hit for {file_path}")
+        return mapped
+
+    def put_mapped(self, file_path: str, settings_key: str, df: pd.DataFrame, columns: List[str]) -> Optional[MappedData]:
+        """
+        Write the display sidecar for a parsed DataFrame and return it memory-mapped.
+
+        :return: The mapped data, or None if caching is disabled or the write failed.
+        """
+        if self.max_bytes <= 0:
+            return None
+        key = self.make_key(file_path, settings_key)
+        if key is None:
+            return None
+
+        ts_path, axes_path = self._entry_path(key, ".ts.npy"), self._entry_path(key, ".axes.npy")
+        temp_paths = []
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for _ in range(2):
+                fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+                os.close(fd)
+                temp_paths.append(temp_path)
+            with open(temp_paths[0], "wb") as ts_file, open(temp_paths[1], "wb") as axes_file:
+                MappedData.save(df, columns, ts_file, axes_file)
+            os.replace(temp_paths[1], axes_path)
+            os.replace(temp_paths[0], ts_path)
+        except Exception as e:
+            logging.warning(f"Unable to write cache sidecar for {file_path}: {e}")
+            for temp_path in temp_paths:
+                self._remove(temp_path)
+            return None
+
+        self.evict()
+        return self.get_mapped(file_path, settings_key, columns)
+
+    def get_pyramid(self, file_path: str, settings_key: str, length: int) -> Optional[LODPyramid]:
+        """
+        Return the persisted LOD pyramid for a source file, or None on a miss.
+
+        :param length: Number of samples in the loaded data, used to reject stale pyramids.
+        """
+        key = self.make_key(file_path, settings_key)
+        if key is None:
+            return None
+        entry_path = self._entry_path(key, ".lod.npz")
+        if not os.path.isfile(entry_path):
+            return None
+
+        try:
+            pyramid = LODPyramid.load(entry_path, length)
+        except Exception as e:
+            logging.warning(f"Discarding unreadable LOD pyramid {entry_path}: {e}")
+            self._remove(entry_path)
+            return None
+
+        self._touch(entry_path)
+        return pyramid
+
+    def put_pyramid(self, file_path: str, settings_key: str, pyramid: LODPyramid):
+        """Persist the LOD pyramid for a source file next to its other cache files."""
+        if self.max_bytes <= 0:
+            return
+        key = self.make_key(file_path, settings_key)
+        if key is None:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pyramid.save(f)
+                os.replace(temp_path, self._entry_path(key, ".lod.npz"))
+            except BaseException:
+                self._remove(temp_path)
+                raise
+        except Exception as e:
+            logging.warning(f"Unable to cache LOD pyramid for {file_path}: {e}")
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Delete least-recently-used entries until the cache fits within `max_bytes`."""
+        entries = self._list_entries()
+        total = sum(size for _paths, size, _mtime in entries.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, (paths, size, _mtime) in sorted(entries.items(), key=lambda e: e[1][2]):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                self._remove(path)
+            total -= size
+            logging.debug(f"Evicted cache entry {key}")
+
+    def clear(self):
+        """Delete every cache entry."""
+        for paths, _size, _mtime in self._list_entries().values():
+            for path in paths:
+                self._remove(path)
+
+    def total_bytes(self) -> int:
+        """Return the combined size of all cache entries."""
+        return sum(size for _paths, size, _mtime in self._list_entries().values())
+
+    def _list_entries(self):
+        """
+        Group cache files by key.
+
+        :return: {key: ([paths], total size, most recent mtime)}
+        """
+        entries = {}
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for item in it:
+                    if item.name.endswith(".tmp") or not item.is_file():
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    key = item.name.split(".", 1)[0]
+                    paths, size, mtime = entries.get(key, ([], 0, 0.0))
+                    paths.append(item.path)
+                    entries[key] = (paths, size + stat.st_size, max(mtime, stat.st_mtime))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    @staticmethod
+    def _touch(path):
+        """Mark an entry as recently used for LRU eviction."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
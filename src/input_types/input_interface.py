@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 import pandas as pd
+from input_types.mapped_data import MappedData
+from input_types.lod_pyramid import LODPyramid
 from models.axes_config import AxisInfo, AxesConfig, AxisDisplay
 
+# Rows per chunk for streaming loads (~8 hours at 16 Hz)
+DEFAULT_CHUNK_ROWS = 500_000
+
 
 class InputInterface(ABC):
     """
@@ -16,6 +21,7 @@ class InputInterface(ABC):
         Each inheriting class must define its `column_info` as a list of `AxisInfo` objects.
         """
         self.column_info: List[AxisInfo] = []
+        self.cache = None
 
     @abstractmethod
     def load_data(self, file_path: str) -> pd.DataFrame:
@@ -27,6 +33,111 @@ class InputInterface(ABC):
         """
         pass
 
+    def load_cached(self, file_path: str) -> pd.DataFrame:
+        """
+        Load the 'Timestamp' and axis columns of a file, reading through the data cache when one is set.
+
+        On a miss the file is parsed with `load_data` and the result is stored for next time.
+
+        :param file_path: Path to the data file.
+        :return: A DataFrame containing 'Timestamp' and the axis columns, in the order `load_data` returns them.
+        """
+        return self._load_columns(file_path, store=True)
+
+    def _load_columns(self, file_path: str, store: bool) -> pd.DataFrame:
+        """
+        `load_cached`, optionally without storing a parsed file in the cache.
+
+        :param store: Whether to write the parsed frame to the cache on a miss.
+        """
+        columns = self.get_cached_columns()
+        cache = getattr(self, "cache", None)
+        if cache is not None:
+            df = cache.get(file_path, self.get_cache_key())
+            if df is not None:
+                return df
+
+        df = self.load_data(file_path)
+        df = df[[col for col in df.columns if col in columns or col == "Timestamp"]]
+        if cache is not None and store:
+            cache.put(file_path, self.get_cache_key(), df, columns)
+        return df
+
+    def iter_chunks(self, file_path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Stream a file as consecutive DataFrames of 'Timestamp' and the axis columns.
+
+        Input types that can parse incrementally override this so peak memory is bounded by
+        `chunk_rows`; the default loads the whole file and yields it as a single chunk.
+
+        :param file_path: Path to the data file.
+        :param chunk_rows: Maximum number of rows per chunk.
+        :return: Iterator of DataFrames in file order.
+        """
+        yield self.load_cached(file_path)
+
+    def load_mapped(self, file_path: str) -> MappedData:
+        """
+        Load a file as compact display arrays (int64 ms timestamps, float32 axes).
+
+        With a data cache these are memory-mapped from a sidecar written on first load;
+        without one they are built in memory from the parsed DataFrame.
+
+        :param file_path: Path to the data file.
+        :return: MappedData for the file.
+        """
+        columns = self.get_cached_columns()
+        cache = getattr(self, "cache", None)
+        if cache is not None:
+            mapped = cache.get_mapped(file_path, self.get_cache_key(), columns)
+            if mapped is not None:
+                return mapped
+
+        # The sidecar is all the viewer reads back, so a parsed file is not also stored as a frame
+        df = self._load_columns(file_path, store=False)
+        if cache is not None:
+            mapped = cache.put_mapped(file_path, self.get_cache_key(), df, columns)
+            if mapped is not None:
+                return mapped
+        return MappedData.from_frame(df, columns)
+
+    def load_pyramid(self, file_path: str, data: MappedData) -> LODPyramid:
+        """
+        Get the min/max LOD pyramid for data returned by `load_mapped`.
+
+        The pyramid is read from the data cache when present, otherwise built and stored there.
+
+        :param file_path: Path to the data file.
+        :param data: The file's MappedData.
+        :return: LODPyramid for the file.
+        """
+        cache = getattr(self, "cache", None)
+        if cache is not None:
+            pyramid = cache.get_pyramid(file_path, self.get_cache_key(), len(data))
+            if pyramid is not None:
+                return pyramid
+
+        pyramid = LODPyramid.build(data)
+        if cache is not None:
+            cache.put_pyramid(file_path, self.get_cache_key(), pyramid)
+        return pyramid
+
+    def get_cache_key(self) -> str:
+        """
+        Describe the settings that affect parsing, so cached data is never reused across settings.
+
+        :return: A string unique to this input type and its settings.
+        """
+        return f"{type(self).__name__}:{self.get_frequency()}"
+
+    def get_cached_columns(self) -> List[str]:
+        """
+        Names of the axis columns persisted by the data cache (excluding 'Timestamp').
+
+        :return: List of column names.
+        """
+        return [axis.input_name for axis in self.get_axes_config().axis_displays]
+
     @abstractmethod
     def get_frequency(self) -> int:
         """
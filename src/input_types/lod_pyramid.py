@@ -0,0 +1,186 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from input_types.mapped_data import MappedData
+
+# Smallest bucket size stored in the pyramid. Views needing finer buckets than this
+# cover so few samples that reducing the visible slice directly is already cheap.
+BASE_BUCKET_SIZE = 16
+
+# Bump whenever the persisted layout changes
+LOD_FORMAT_VERSION = 1
+
+
+class LODPyramid:
+    """
+    Multi-resolution min/max envelope of a MappedData, for constant-cost display downsampling.
+
+    Level k holds, for every bucket of BASE_BUCKET_SIZE * 2**k consecutive samples, the index of
+    the minimum and maximum sample of each axis. Levels are built once per file by pairwise
+    reduction of the level below, so the whole pyramid costs one pass over the data and about
+    n / 8 indices per axis. `downsample` then picks the coarsest level that still yields at least
+    half the requested points and gathers only those buckets, so rendering a full day costs the
+    same as rendering a minute.
+    """
+
+    def __init__(self, length: int, levels: Dict[str, List[Tuple[np.ndarray, np.ndarray]]]):
+        """
+        :param length: Number of samples in the source data.
+        :param levels: Mapping of axis column name -> [(min_idx, max_idx), ...] per level, finest first.
+        """
+        self.length = length
+        self._levels = levels
+
+    @staticmethod
+    def build(data: MappedData) -> "LODPyramid":
+        """Build the pyramid for every axis of a MappedData."""
+        n = len(data)
+        return LODPyramid(n, {col: LODPyramid._build_axis(data[col], n) for col in data.columns})
+
+    @staticmethod
+    def _build_axis(values: np.ndarray, n: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        index_dtype = np.int32 if n < 2**31 else np.int64
+        if n < BASE_BUCKET_SIZE * 2:
+            return []
+
+        # Base level: reduce full buckets in one reshape, then the partial tail bucket
+        n_full = n // BASE_BUCKET_SIZE
+        blocks = np.asarray(values[:n_full * BASE_BUCKET_SIZE]).reshape(n_full, BASE_BUCKET_SIZE)
+        offsets = np.arange(n_full, dtype=index_dtype) * BASE_BUCKET_SIZE
+        min_idx = offsets + blocks.argmin(axis=1).astype(index_dtype)
+        max_idx = offsets + blocks.argmax(axis=1).astype(index_dtype)
+        if n_full * BASE_BUCKET_SIZE < n:
+            tail = np.asarray(values[n_full * BASE_BUCKET_SIZE:])
+            min_idx = np.append(min_idx, index_dtype(n_full * BASE_BUCKET_SIZE + tail.argmin()))
+            max_idx = np.append(max_idx, index_dtype(n_full * BASE_BUCKET_SIZE + tail.argmax()))
+        levels = [(min_idx, max_idx)]
+
+        # Each coarser level merges pairs of buckets from the one below
+        while len(min_idx) > 1:
+            min_idx = LODPyramid._merge_pairs(values, min_idx, np.less_equal)
+            max_idx = LODPyramid._merge_pairs(values, max_idx, np.greater_equal)
+            levels.append((min_idx, max_idx))
+        return levels
+
+    @staticmethod
+    def _merge_pairs(values: np.ndarray, idx: np.ndarray, keep_left) -> np.ndarray:
+        """Merge adjacent buckets, keeping the left index when `keep_left(left, right)` holds."""
+        left, right = idx[0:len(idx) - 1:2], idx[1::2]
+        merged = np.where(keep_left(values[left], values[right]), left, right)
+        if len(idx) % 2:
+            merged = np.append(merged, idx[-1])
+        return merged
+
+    def downsample_indices(self, values: np.ndarray, column: str, start: int, end: int,
+                           max_points: int = 4000) -> np.ndarray:
+        """
+        Return sorted sample indices within [start, end) that preserve the min/max envelope.
+
+        :param values: The axis samples (only read for ranges finer than the base level).
+        :param column: Axis column name.
+        :param start: First sample index of the visible range.
+        :param end: One past the last sample index of the visible range.
+        :param max_points: Approximate number of indices to return.
+        :return: Sorted, unique int64 indices into the source data.
+        """
+        count = end - start
+        if count <= max_points:
+            return np.arange(start, end)
+        indices = self._level_indices(column, start, end, max_points)
+        if indices is None:
+            indices = self.reduce_slice(values, start, end, max_points)
+        return indices
+
+    def _level_indices(self, column: str, start: int, end: int, max_points: int):
+        """Gather min/max indices from the pyramid, or None if no stored level is coarse enough."""
+        count = end - start
+        # Coarsest level whose bucket still fits max_points / 2 buckets (min + max per bucket)
+        target = -(-count // (max_points // 2))
+        level = int(np.ceil(np.log2(target / BASE_BUCKET_SIZE))) if target > BASE_BUCKET_SIZE else -1
+        levels = self._levels.get(column, [])
+        if level < 0 or level >= len(levels):
+            return None
+
+        bucket = BASE_BUCKET_SIZE << level
+        min_idx, max_idx = levels[level]
+        first, last = start // bucket, -(-end // bucket)
+        lo, hi = min_idx[first:last], max_idx[first:last]
+        indices = _interleave(lo.astype(np.int64), hi.astype(np.int64))
+        # Buckets at the edges may reach outside the range; clip them to it
+        return indices[(indices >= start) & (indices < end)]
+
+    def downsample(self, data: MappedData, column: str, start: int, end: int, max_points: int = 4000):
+        """
+        Downsample one axis of the visible range for display.
+
+        :return: (timestamps_ms, values) arrays of roughly max_points samples.
+        """
+        indices = self.downsample_indices(data[column], column, start, end, max_points)
+        return data.timestamps_ms[indices], data[column][indices]
+
+    @staticmethod
+    def reduce_slice(values: np.ndarray, start: int, end: int, max_points: int = 4000) -> np.ndarray:
+        """
+        Min/max indices of [start, end) computed directly from the samples.
+
+        Used for ranges finer than the base level, where the slice is small.
+        """
+        count = end - start
+        if count <= max_points:
+            return np.arange(start, end)
+        chunk = -(-count // (max_points // 2))
+        n_full = count // chunk
+        blocks = np.asarray(values[start:start + n_full * chunk]).reshape(n_full, chunk)
+        offsets = start + np.arange(n_full, dtype=np.int64) * chunk
+        lo, hi = offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1)
+        if n_full * chunk < count:
+            tail_start = start + n_full * chunk
+            tail = np.asarray(values[tail_start:end])
+            lo = np.append(lo, tail_start + tail.argmin())
+            hi = np.append(hi, tail_start + tail.argmax())
+        return _interleave(lo, hi)
+
+    def save(self, file):
+        """
+        Write the pyramid as an uncompressed .npz.
+
+        :param file: Destination path or binary file.
+        """
+        arrays = {"version": np.array(LOD_FORMAT_VERSION), "length": np.array(self.length),
+                  "columns": np.array(list(self._levels.keys()))}
+        for i, levels in enumerate(self._levels.values()):
+            for k, (min_idx, max_idx) in enumerate(levels):
+                arrays[f"min_{i}_{k}"] = min_idx
+                arrays[f"max_{i}_{k}"] = max_idx
+        np.savez(file, **arrays)
+
+    @staticmethod
+    def load(path: str, length: int) -> "LODPyramid":
+        """
+        Read a pyramid written by `save`.
+
+        :param path: Path to the .npz file.
+        :param length: Expected number of samples; a mismatch raises ValueError.
+        """
+        with np.load(path, allow_pickle=False) as entry:
+            if int(entry["version"]) != LOD_FORMAT_VERSION or int(entry["length"]) != length:
+                raise ValueError(f"Pyramid in {path} does not match {length} samples")
+            columns = [str(c) for c in entry["columns"]]
+            levels = {}
+            for i, col in enumerate(columns):
+                levels[col] = []
+                k = 0
+                while f"min_{i}_{k}" in entry:
+                    levels[col].append((entry[f"min_{i}_{k}"], entry[f"max_{i}_{k}"]))
+                    k += 1
+        return LODPyramid(length, levels)
+
+
+def _interleave(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Merge per-bucket min/max indices into one sorted index array without duplicates."""
+    pairs = np.column_stack((np.minimum(lo, hi), np.maximum(lo, hi))).ravel()
+    keep = np.empty(len(pairs), dtype=bool)
+    keep[:1] = True
+    np.not_equal(pairs[1:], pairs[:-1], out=keep[1:])
+    return pairs[keep]
@@ -0,0 +1,81 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from input_types.backtracks import find_backtracks, find_midnight_rollovers
+
+
+class MappedData:
+    """
+    Compact, column-oriented view of one input file for display.
+
+    Timestamps are int64 milliseconds and axes are float32. When opened from a DataCache
+    sidecar the arrays are read-only numpy memmaps, so the data lives in the OS page cache
+    rather than the process heap and is released as soon as the last reference is dropped.
+    """
+
+    def __init__(self, timestamps_ms: np.ndarray, axes: Dict[str, np.ndarray]):
+        """
+        :param timestamps_ms: int64 timestamps in milliseconds since the epoch.
+        :param axes: Mapping of axis column name -> float32 values (same length as timestamps).
+        """
+        self.timestamps_ms = timestamps_ms
+        self._axes = axes
+
+    @staticmethod
+    def from_frame(df: pd.DataFrame, columns: List[str]) -> "MappedData":
+        """Build an in-memory MappedData from a parsed DataFrame (used when no cache is available)."""
+        timestamps_ms = df["Timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64) // 10**6
+        axes = {col: df[col].to_numpy(dtype=np.float32) for col in columns}
+        return MappedData(timestamps_ms, axes)
+
+    @staticmethod
+    def save(df: pd.DataFrame, columns: List[str], ts_file, axes_file):
+        """
+        Write the sidecar arrays for a parsed DataFrame.
+
+        :param ts_file: Destination path or binary file for the int64 ms timestamps (.npy).
+        :param axes_file: Destination path or binary file for the (n_axes, n) float32 axis block (.npy).
+        """
+        timestamps_ms = df["Timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64) // 10**6
+        axes = np.empty((len(columns), len(df)), dtype=np.float32)
+        for i, col in enumerate(columns):
+            axes[i] = df[col].to_numpy(dtype=np.float32)
+        np.save(ts_file, timestamps_ms)
+        np.save(axes_file, axes)
+
+    @staticmethod
+    def open(ts_path: str, axes_path: str, columns: List[str]) -> "MappedData":
+        """Memory-map previously saved sidecar arrays."""
+        timestamps_ms = np.load(ts_path, mmap_mode="r")
+        axes = np.load(axes_path, mmap_mode="r")
+        if axes.shape != (len(columns), len(timestamps_ms)):
+            raise ValueError(f"Sidecar shape {axes.shape} does not match {len(columns)} columns x {len(timestamps_ms)} rows")
+        return MappedData(timestamps_ms, {col: axes[i] for i, col in enumerate(columns)})
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._axes.keys())
+
+    def __len__(self):
+        return 0 if self.timestamps_ms is None else len(self.timestamps_ms)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._axes[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._axes
+
+    def find_backtracks(self) -> np.ndarray:
+        """Indices of samples whose timestamp is earlier than the previous sample's."""
+        return find_backtracks(self.timestamps_ms)
+
+    def find_midnight_rollovers(self) -> np.ndarray:
+        """Indices of samples where the time of day wraps back into hour 0."""
+        return find_midnight_rollovers(self.timestamps_ms)
+
+    def close(self):
+        """Drop references to the underlying arrays so their pages can be released."""
+        self.timestamps_ms = None
+        self._axes = {}
@@ -1,23 +1,33 @@
 import logging
 import os
-from datetime import datetime
+from datetime import date, datetime
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
-from input_types.input_interface import InputInterface
+from input_types.input_interface import InputInterface, DEFAULT_CHUNK_ROWS
 from models.axes_config import AxesConfig, AxisDisplay
 
+# Date used when the filename does not carry one (matches pandas' time-only parsing default)
+_DEFAULT_DATE = date(1900, 1, 1)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Largest hour, minute and second accepted in 'UTC DateTime'
+_MAX_HMS = np.array([23, 59, 61])
+
 class VectronicMotionInput(InputInterface):
     """
     Input type class for Vectronic Motion data, handling CSV format specifics.
     """
 
-    def __init__(self, frequency: int):
+    def __init__(self, frequency: int, cache=None):
         """
         Initialize with specific frequency and predefined column info for Vectronic Motion data.
 
         :param frequency: Expected frequency of the input data in Hz.
+        :param cache: Optional DataCache used by `load_cached` to skip re-parsing CSVs.
         """
         self.frequency = frequency
+        self.cache = cache
         self.column_info = {
             "Timestamp": AxisDisplay(input_name="Timestamp", display_name="Timestamp", color="orange", alpha=1.0),
             "Acc X [g]": AxisDisplay(input_name="Acc X [g]", display_name="X-axis", color="red", alpha=0.6),
@@ -43,23 +53,11 @@ class VectronicMotionInput(InputInterface):
 
             # Combine 'UTC DateTime' and 'Milliseconds' into 'Timestamp' as a full datetime object
             if 'UTC DateTime' in df.columns and 'Milliseconds' in df.columns:
-                df['Timestamp'] = pd.to_datetime(
-                    df['UTC DateTime'].astype(str) + '.' + df['Milliseconds'].astype(str).str.zfill(3),
-                    format='%H:%M:%S.%f'
-                )
+                file_date = self._date_from_filename(file_path)
+                df['Timestamp'] = self.build_timestamps(df['UTC DateTime'], df['Milliseconds'], file_date)
 
                 # Drop original columns after combining
                 df.drop(columns=['UTC DateTime', 'Milliseconds'], inplace=True)
-
-                # Try to extract date from filename and inject into timestamps
-                date_str = os.path.splitext(os.path.basename(file_path))[0]
-                try:
-                    file_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    base = pd.Timestamp(datetime.combine(file_date, datetime.min.time()))
-                    time_of_day = df['Timestamp'] - df['Timestamp'].dt.normalize()
-                    df['Timestamp'] = base + time_of_day
-                except ValueError:
-                    logging.warning(f"Could not parse date from filename '{date_str}', using default date")
             else:
                 missing_cols = [col for col in ['UTC DateTime', 'Milliseconds'] if col not in df.columns]
                 raise KeyError(f"Missing required columns: {', '.join(missing_cols)}")
@@ -75,6 +73,70 @@ class VectronicMotionInput(InputInterface):
             logging.error(f"General error encountered: {e}")
             raise ValueError(f"Error loading data from Vectronic file: {e}")
 
+    def iter_chunks(self, file_path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Stream a Vectronic Motion CSV as 'Timestamp' + axis column chunks of at most `chunk_rows` rows.
+
+        Only the time and axis columns are parsed, and timestamps are built per chunk exactly as
+        in `load_data`, so concatenating the chunks gives the same frame as `load_cached`.
+
+        :param file_path: Path to the data file.
+        :param chunk_rows: Maximum number of rows per chunk.
+        :return: Iterator of DataFrames in file order.
+        """
+        columns = self.get_cached_columns()
+        file_date = self._date_from_filename(file_path)
+        try:
+            reader = pd.read_csv(file_path, skiprows=1, chunksize=chunk_rows,
+                                 usecols=['UTC DateTime', 'Milliseconds'] + columns)
+        except ValueError as e:
+            raise ValueError(f"Error loading data from Vectronic file: {e}")
+
+        with reader:
+            for chunk in reader:
+                timestamps = self.build_timestamps(chunk['UTC DateTime'], chunk['Milliseconds'], file_date)
+                yield chunk[columns].assign(Timestamp=timestamps).reset_index(drop=True)
+
+    @staticmethod
+    def _date_from_filename(file_path: str) -> date:
+        """Date encoded in a YYYY-MM-DD.csv filename, or the time-only default date."""
+        date_str = os.path.splitext(os.path.basename(file_path))[0]
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            logging.warning(f"Could not parse date from filename '{date_str}', using default date")
+            return _DEFAULT_DATE
+
+    @staticmethod
+    def build_timestamps(utc_times: pd.Series, milliseconds: pd.Series, file_date: date) -> np.ndarray:
+        """
+        Build datetime64[ns] timestamps from 'HH:MM:SS' strings, integer milliseconds and a date.
+
+        Each second of the day repeats once per sample (16x at 16 Hz), so only the unique
+        time strings are parsed; every row then maps back through an integer lookup. No
+        per-row strings are created.
+
+        :param utc_times: Time-of-day strings in HH:MM:SS format.
+        :param milliseconds: Millisecond offsets within each second.
+        :param file_date: Date to attach to every time-of-day.
+        :return: Array of datetime64[ns] timestamps.
+        """
+        codes, uniques = pd.factorize(utc_times.astype(str), sort=False)
+        if (codes < 0).any():
+            raise ValueError("'UTC DateTime' contains missing values")
+        hms = pd.Series(uniques).str.extract(r'^(\d{1,2}):(\d{1,2}):(\d{1,2})$')
+        if hms.isna().any().any():
+            raise ValueError("'UTC DateTime' values must be in HH:MM:SS format")
+        hms = hms.astype(np.int64).to_numpy()
+        # Same ranges as pd.to_datetime(format='%H:%M:%S'), which rolls seconds 60-61 into the next minute
+        if (hms > _MAX_HMS).any():
+            raise ValueError("'UTC DateTime' contains out-of-range times")
+        seconds_of_day = hms[:, 0] * 3600 + hms[:, 1] * 60 + hms[:, 2]
+
+        base_ms = (file_date.toordinal() - _EPOCH_ORDINAL) * 86_400_000
+        ts_ms = base_ms + seconds_of_day[codes] * 1000 + milliseconds.to_numpy(dtype=np.int64)
+        return (ts_ms * 1_000_000).view('datetime64[ns]')
+
     def validate_format(self, df: pd.DataFrame) -> bool:
         """
         Check that required columns are present in the data.
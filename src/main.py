@@ -1,6 +1,7 @@
 import csv
 import getpass
 import logging
+import multiprocessing
 import os
 import os.path
 import threading
@@ -25,12 +26,15 @@ from gui_components.verification_threshold_dialog import VerificationThresholdDi
 from gui_components.viewer_notebook import ViewerNotebook
 from gui_components.status_bar import StatusBar
 from gui_components.new_project_dialog import NewProjectDialog
+from input_types.data_cache import DataCache, DEFAULT_CACHE_DIR
 from models.directory_entry import DirectoryEntry
 from models.file_entry import FileEntry
 from models.label import Label
 from models.user_config import UserConfig
 from output_types.bebe_output import BEBEOutput
+from services.file_catalog import FileCatalog
 from services.project_service import ProjectService
+from services.project_store import SQLITE_PROJECT_EXTENSION, convert_project
 from services.user_app_config_service import UserAppConfigService
 
 
@@ -53,7 +57,21 @@ class MainApplication(tk.Tk):
 
         self.INFO_PANE_MAX_WIDTH = self.user_app_config.info_pane_max_width
 
+        # Binary cache of parsed input files, shared by the viewer and output generation
+        self.data_cache = DataCache(
+            cache_dir=self.user_app_config.data_cache_dir or DEFAULT_CACHE_DIR,
+            max_bytes=self.user_app_config.data_cache_max_mb * 1024 * 1024,
+        )
+
+        # Index of data files under each data root, shared by project creation and validation
+        self.file_catalog = FileCatalog()
+
         self.project_service = ProjectService()
+        # Coalesce project saves on the Tk event loop; the title shows when a save is pending
+        self.project_service.set_save_scheduler(self.after, self.after_cancel,
+                                                delay_ms=self.user_app_config.project_save_delay)
+        self.project_service.add_dirty_listener(lambda _dirty: self._update_title())
+        self.labeling_dashboard = None
 
         last_opened_project = self.user_app_config_service.config.last_opened_project
         if last_opened_project and os.path.exists(last_opened_project):
@@ -71,6 +89,16 @@ class MainApplication(tk.Tk):
 
         self.restore_user_settings()
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Write any pending project save, then close the application."""
+        if not self.project_service.flush():
+            if not messagebox.askyesno("Save Failed",
+                                       "The project could not be saved. Quit anyway and lose recent changes?"):
+                return
+        self.destroy()
+
     def reopen_last_project_file(self):
         """
         Attempt to reload the last open CSV from the active project
@@ -164,6 +192,7 @@ class MainApplication(tk.Tk):
         self.viewer = ViewerNotebook(self, project_service=self.project_service, relief=tk.SUNKEN)
         self.paned_window.add(self.viewer, minsize=gui_theme.PANE_MIN_VIEWER)
         self.viewer.set_project_config(project_config)
+        self.viewer.set_data_cache(self.data_cache)
 
         # info pane for legend info/controls
         self.info_pane = InfoPane(self, project_service=self.project_service)
@@ -179,7 +208,10 @@ class MainApplication(tk.Tk):
         file_menu.add_command(label='New Project', accelerator='Ctrl+N', command=self.open_new_project_dialog)
         file_menu.add_command(label='Open Project', accelerator='Ctrl+O', command=self.open_project_dialog)
         file_menu.add_separator()
-        file_menu.add_command(label='Exit', command=self.quit)
+        file_menu.add_command(label='Convert Project to SQLite...', command=self.convert_project_to_sqlite)
+        file_menu.add_command(label='Export Project as JSON...', command=self.export_project_json)
+        file_menu.add_separator()
+        file_menu.add_command(label='Exit', command=self.on_close)
 
         proj_menu = Menu(self.menu_bar, tearoff=0)
         proj_menu.add_command(label='Change Data Root...', command=self.change_data_root)
@@ -235,7 +267,8 @@ class MainApplication(tk.Tk):
     def _update_title(self):
         config = self.project_service.current_project_config
         if config and config.proj_name:
-            self.title(f'AccelScope - {config.proj_name}')
+            pending = ' *' if self.project_service.has_unsaved_changes() else ''
+            self.title(f'AccelScope - {config.proj_name}{pending}')
         else:
             self.title('AccelScope')
 
@@ -249,7 +282,7 @@ class MainApplication(tk.Tk):
         :return: None (new project is opened, user app config updated)
         """
         # Create and display the NewProjectDialog
-        new_project_dialog = NewProjectDialog(self)
+        new_project_dialog = NewProjectDialog(self, file_catalog=self.file_catalog)
         new_project_dialog.transient(self)  # Optionally make the dialog transient
         new_project_dialog.grab_set()  # Optional, but makes the dialog modal
         self.wait_window(new_project_dialog)  # Wait until dialog is closed
@@ -260,9 +293,57 @@ class MainApplication(tk.Tk):
 
     def open_project_dialog(self):
         """Dialog allowing user to select project JSON, open if exists"""
-        project_path = filedialog.askopenfilename(filetypes=[("JSON Files", "*.json")], title="Open Project File")
+        project_path = filedialog.askopenfilename(
+            filetypes=[("AccelScope Projects", f"*.json *{SQLITE_PROJECT_EXTENSION}"),
+                       ("JSON Files", "*.json"), ("SQLite Projects", f"*{SQLITE_PROJECT_EXTENSION}")],
+            title="Open Project File")
         self.open_project(project_path)
 
+    def convert_project_to_sqlite(self):
+        """Copy the open project into SQLite storage (one record per file) and switch to the copy."""
+        if not self.project_service.current_project_config:
+            messagebox.showwarning("No Project", "No project is currently open.")
+            return
+
+        source_path = self.project_service.current_project_path
+        dest_path = filedialog.asksaveasfilename(
+            defaultextension=SQLITE_PROJECT_EXTENSION,
+            initialfile=os.path.splitext(os.path.basename(source_path))[0] + SQLITE_PROJECT_EXTENSION,
+            filetypes=[("SQLite Projects", f"*{SQLITE_PROJECT_EXTENSION}")],
+            title="Convert Project to SQLite",
+        )
+        if not dest_path or not self._copy_project(source_path, dest_path):
+            return
+        self.open_project(dest_path)
+        self.set_status(f"Converted project to {dest_path}")
+
+    def export_project_json(self):
+        """Write the open project to a single JSON file (the original format) and keep working on the current one."""
+        if not self.project_service.current_project_config:
+            messagebox.showwarning("No Project", "No project is currently open.")
+            return
+
+        dest_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON Files", "*.json")],
+            title="Export Project as JSON",
+        )
+        if dest_path and self._copy_project(self.project_service.current_project_path, dest_path):
+            self.set_status(f"Exported project to {dest_path}")
+
+    def _copy_project(self, source_path, dest_path):
+        """Save pending edits, then convert source_path into dest_path's format. Returns True on success."""
+        if not self.project_service.flush():
+            messagebox.showerror("Save Failed", "The project could not be saved, so it was not copied.")
+            return False
+        try:
+            convert_project(source_path, dest_path)
+        except Exception as e:
+            logging.error(f"Failed to copy project to {dest_path}: {e}")
+            messagebox.showerror("Copy Failed", f"Failed to write {dest_path}:\n{e}")
+            return False
+        return True
+
     def open_project(self, project_path):
         """
         Open the given project JSON and reset all panes
@@ -338,7 +419,7 @@ class MainApplication(tk.Tk):
 
         if dialog.result_ready and dialog.result_label_displays is not None:
             self.project_service.current_project_config.label_display = dialog.result_label_displays
-            self.project_service.save_project()
+            self.project_service.request_save()
             # Refresh viewer and info pane to reflect new colors/labels
             self.viewer.set_project_config(self.project_service.current_project_config)
             self.viewer.update_plot()
@@ -368,7 +449,7 @@ class MainApplication(tk.Tk):
             config.y_range = dialog.result_y_range
             config.individual_id_regex = dialog.result_individual_id_regex
             config.plot_title_format = dialog.result_plot_title_format
-            self.project_service.save_project()
+            self.project_service.request_save()
             self.viewer.set_project_config(config)
             self.viewer.update_plot()
             self.set_status("Input settings updated.")
@@ -401,7 +482,7 @@ class MainApplication(tk.Tk):
                     display_name=dialog.result_display_name,
                     alias=dialog.result_alias or username[:2].upper(),
                 ))
-            self.project_service.save_project()
+            self.project_service.request_save()
             self.info_pane.refresh_user_info()
             self.set_status("Profile updated.")
 
@@ -419,7 +500,7 @@ class MainApplication(tk.Tk):
 
         if dialog.result_ready and dialog.result_user_config:
             config.users.append(dialog.result_user_config)
-            self.project_service.save_project()
+            self.project_service.request_save()
             self.info_pane._build_reviewer_checkboxes()
             self.set_status(f"Added reviewer '{dialog.result_user_config.username}' to project.")
 
@@ -449,15 +530,12 @@ class MainApplication(tk.Tk):
             messagebox.showwarning("No Project", "No project is currently open.")
             return
 
-        config = self.project_service.current_project_config
-        file_entries = []
-        self._collect_file_entries(self.project_service.get_entries(), file_entries)
-
-        dialog = LabelingDashboardDialog(self, file_entries, config.label_display, self.project_service.get_reviewers(),
-                                         verification_threshold=config.verification_threshold)
-        dialog.transient(self)
-        dialog.grab_set()
-        self.wait_window(dialog)
+        # Non-modal and refreshed as the project changes, so one instance is enough
+        if self.labeling_dashboard is not None and self.labeling_dashboard.winfo_exists():
+            self.labeling_dashboard.lift()
+            return
+        self.labeling_dashboard = LabelingDashboardDialog(self, self.project_service)
+        self.labeling_dashboard.transient(self)
 
     def edit_verification_threshold(self):
         """Open dialog to edit the verification threshold."""
@@ -473,7 +551,7 @@ class MainApplication(tk.Tk):
 
         if dialog.result_ready:
             config.verification_threshold = dialog.result_threshold
-            self.project_service.save_project()
+            self.project_service.request_save()
             self.project_browser.load_project()
             self.set_status(f"Verification threshold set to {int(dialog.result_threshold * 100)}%.")
 
@@ -507,15 +585,11 @@ class MainApplication(tk.Tk):
             writer = csv.writer(f)
             writer.writerow(["file_id", "file_path", "behavior", "start_time", "end_time"])
             for fe in file_entries:
-                for label in fe.labels:
-                    writer.writerow([
-                        fe.id,
-                        fe.path,
-                        label.behavior,
-                        Label._serialize_time(label.start_time),
-                        Label._serialize_time(label.end_time),
-                    ])
-                    label_count += 1
+                # Serialized label dicts: lazily loaded files are written without building Label objects
+                rows = [(fe.id, fe.path, label["behavior"], label["start_time"], label["end_time"])
+                        for label in fe.label_dicts()]
+                writer.writerows(rows)
+                label_count += len(rows)
 
         messagebox.showinfo("Export Complete", f"Exported {label_count} labels to:\n{file_path}")
         self.set_status(f"Exported {label_count} labels to CSV.")
@@ -554,23 +628,17 @@ class MainApplication(tk.Tk):
             fe = self.project_service.find_file_by_id(file_id)
             if fe is None:
                 # Try matching by path from the first row
-                target_path = rows[0].get("file_path", "")
-                file_entries = []
-                self._collect_file_entries(self.project_service.get_entries(), file_entries)
-                for candidate in file_entries:
-                    if candidate.path == target_path:
-                        fe = candidate
-                        break
+                fe = self.project_service.find_file_by_path(rows[0].get("file_path", ""))
 
             if fe is None:
                 skipped_files.append(file_id)
                 continue
 
             # Check for existing labels
-            if fe.labels:
+            if fe.label_count:
                 answer = messagebox.askyesnocancel(
                     "File Already Has Labels",
-                    f'"{fe.path}" already has {len(fe.labels)} labels.\n'
+                    f'"{fe.path}" already has {fe.label_count} labels.\n'
                     f'Replace with {len(rows)} labels from CSV?',
                 )
                 if answer is None:
@@ -596,7 +664,7 @@ class MainApplication(tk.Tk):
             imported_labels += len(new_labels)
             imported_files += 1
 
-        self.project_service.save_project()
+        self.project_service.request_save()
 
         # Refresh viewer and info pane
         self.viewer.update_plot()
@@ -627,6 +695,8 @@ class MainApplication(tk.Tk):
             self,
             comment_save_delay=config.comment_save_delay,
             info_pane_max_width=config.info_pane_max_width,
+            data_cache_max_mb=config.data_cache_max_mb,
+            project_save_delay=config.project_save_delay,
         )
         dialog.transient(self)
         dialog.grab_set()
@@ -636,11 +706,17 @@ class MainApplication(tk.Tk):
             self.user_app_config_service.update_preferences(
                 comment_save_delay=dialog.result_comment_save_delay,
                 info_pane_max_width=dialog.result_info_pane_max_width,
+                data_cache_max_mb=dialog.result_data_cache_max_mb,
+                project_save_delay=dialog.result_project_save_delay,
             )
             # Apply info pane max width
             self.INFO_PANE_MAX_WIDTH = dialog.result_info_pane_max_width
             # Apply comment save delay to info pane
             self.info_pane._comment_save_delay = dialog.result_comment_save_delay
+            # Apply the new cache budget, evicting immediately if it shrank
+            self.data_cache.max_bytes = dialog.result_data_cache_max_mb * 1024 * 1024
+            self.data_cache.evict()
+            self.project_service.set_save_delay(dialog.result_project_save_delay)
             self.set_status("Preferences saved.")
 
     def undo_label(self):
@@ -732,11 +808,34 @@ class MainApplication(tk.Tk):
             tk.messagebox.showerror("Validation Error", f"Error resolving root directory: {e}")
             return
 
-        # 2. Verify all referenced CSV files
+        # 2. Bring the file catalog up to date off the Tk thread, then check the files against it
+        self.set_status("Validating project files...")
+
+        def _refresh_catalog():
+            indexed_paths = set()
+            try:
+                if self.file_catalog.is_indexed(root_directory):
+                    # Stat-diff refresh so files deleted or moved since the last scan are not trusted
+                    self.file_catalog.refresh(root_directory)
+                    indexed_paths = {entry.rel_path for entry in self.file_catalog.files(root_directory)}
+            except Exception as e:
+                logging.warning(f"File catalog unavailable, checking every file on disk: {e}")
+                indexed_paths = set()
+            self.after(0, lambda: self._finish_project_validation(indexed_paths))
+
+        threading.Thread(target=_refresh_catalog, daemon=True).start()
+
+    def _finish_project_validation(self, indexed_paths):
+        """
+        Check every referenced file and label and report the results.
+
+        :param indexed_paths: Relative paths the freshly refreshed file catalog found; other paths are stat'ed.
+        """
         missing_files = []
         label_errors = []
         for entry in self.project_service.get_entries():
-            self._validate_entry_files(entry, missing_files, label_errors)
+            self._validate_entry_files(entry, missing_files, label_errors, indexed_paths)
+        self.set_status("Validation complete.")
 
         # Display missing files
         if missing_files:
@@ -755,34 +854,34 @@ class MainApplication(tk.Tk):
             logging.info("Validation complete: All files and labels are valid.")
             tk.messagebox.showinfo("Validation Complete", "All files and labels are valid.")
 
-    def _validate_entry_files(self, entry, missing_files, label_errors):
+    def _validate_entry_files(self, entry, missing_files, label_errors, indexed_paths=frozenset()):
         """
         Recursively checks each entry to ensure files exist and validates labels.
 
         :param entry: DirectoryEntry or FileEntry to validate.
         :param missing_files: List to collect paths of missing files.
         :param label_errors: List to collect validation errors for labels.
+        :param indexed_paths: Relative paths the file catalog found in a refresh just now; only other paths are stat'ed.
         """
         if isinstance(entry, DirectoryEntry):
             for sub_entry in entry.entries:
-                self._validate_entry_files(sub_entry, missing_files, label_errors)
+                self._validate_entry_files(sub_entry, missing_files, label_errors, indexed_paths)
 
         elif isinstance(entry, FileEntry):
             # Use ProjectService to get the full path of the file
             file_path = self.project_service.get_file_path(entry)
-            if not os.path.isfile(file_path):
+            if entry.path.replace("\\", "/") not in indexed_paths and not os.path.isfile(file_path):
                 missing_files.append(f"{file_path} (ID: {entry.id})")
                 logging.warning(f"Missing file: {file_path}")
 
-            # Validate labels
-            for label_data in entry.labels:
-                if isinstance(label_data, dict):  # Only attempt validation if it's a dictionary
-                    try:
-                        Label.from_dict(label_data)  # Validate via Label class
-                    except ValueError as e:
-                        error_msg = f"Error in file {entry.path} - {str(e)}"
-                        label_errors.append(error_msg)
-                        logging.warning(error_msg)
+            # Validate labels (as stored, so lazily loaded invalid labels are reported rather than raised)
+            for label_data in entry.label_dicts():
+                try:
+                    Label.from_dict(label_data)  # Validate via Label class
+                except ValueError as e:
+                    error_msg = f"Error in file {entry.path} - {str(e)}"
+                    label_errors.append(error_msg)
+                    logging.warning(error_msg)
 
     def start_output_generation(self, output_settings, output_directory):
         # Check if output directory already has content
@@ -810,7 +909,7 @@ class MainApplication(tk.Tk):
     def _run_output_generation(self, output_settings, output_directory, progress_dialog):
         """Run BEBE output generation in a background thread."""
         try:
-            bebe = BEBEOutput()
+            bebe = BEBEOutput(data_cache=self.data_cache)
 
             def progress_callback(current, total, file_path):
                 if progress_dialog.cancelled:
@@ -853,5 +952,6 @@ class MainApplication(tk.Tk):
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # output generation uses a spawn process pool
     app = MainApplication()
     app.mainloop()
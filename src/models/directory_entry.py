@@ -16,11 +16,11 @@ class DirectoryEntry:
 		}
 
 	@staticmethod
-	def from_dict(data):
+	def from_dict(data, lazy_labels=False):
 		entries = []
 		for entry in data.get("entries", []):
 			if "path" in entry:
-				entries.append(FileEntry.from_dict(entry))
+				entries.append(FileEntry.from_dict(entry, lazy_labels))
 			else:
-				entries.append(DirectoryEntry.from_dict(entry))
+				entries.append(DirectoryEntry.from_dict(entry, lazy_labels))
 		return DirectoryEntry(data["name"], entries)
@@ -1,4 +1,6 @@
-from models.label import Label
+import numpy as np
+
+from models.label import Label, label_arrays
 
 
 class FileEntry:
@@ -16,22 +18,85 @@ class FileEntry:
 		"""
 		self.path = path
 		self.id = id
-		self.labels = labels or []
+		self._labels = labels or []
+		self._raw_labels = None  # Label dicts not yet parsed (lazy from_dict), replaced by _labels on first access
 		self.verified_by = verified_by if verified_by is not None else []
 		self.comments = comments if comments is not None else {}
 
+	@property
+	def labels(self):
+		"""The file's Label objects, parsed from the stored dicts on first access when loaded lazily."""
+		if self._raw_labels is not None:
+			self._labels = [Label.from_dict(label) for label in self._raw_labels]
+			self._raw_labels = None
+		return self._labels
+
+	@labels.setter
+	def labels(self, labels):
+		self._labels = labels
+		self._raw_labels = None
+
+	@property
+	def label_count(self):
+		"""Number of labels, without parsing lazily loaded ones."""
+		if self._raw_labels is not None:
+			return len(self._raw_labels)
+		return len(self._labels)
+
+	def label_dicts(self):
+		"""The labels as serialized dicts, without parsing lazily loaded ones."""
+		if self._raw_labels is not None:
+			return [dict(label) for label in self._raw_labels]
+		return [label.to_dict() for label in self._labels]
+
+	def label_arrays(self):
+		"""(start_us, end_us, behaviors) arrays for vectorized statistics; see models.label.label_arrays."""
+		return label_arrays(self._raw_labels if self._raw_labels is not None else self._labels)
+
+	@staticmethod
+	def concat_label_arrays(file_entries):
+		"""
+		label_arrays over the labels of many files, converted in one batch per storage form (stored
+		dicts and Label objects) instead of file by file, which for small files is mostly numpy overhead.
+
+		:return: (start_us, end_us, behaviors, file_index), file_index being each label's position in file_entries.
+		"""
+		batches = {True: ([], [], []), False: ([], [], [])}  # is_raw -> (labels, file indices, label counts)
+		for index, file_entry in enumerate(file_entries):
+			is_raw = file_entry._raw_labels is not None
+			labels = file_entry._raw_labels if is_raw else file_entry._labels
+			if labels:
+				batch_labels, batch_files, batch_counts = batches[is_raw]
+				batch_labels.extend(labels)
+				batch_files.append(index)
+				batch_counts.append(len(labels))
+
+		columns = [[], [], [], []]
+		for batch_labels, batch_files, batch_counts in batches.values():
+			for column, array in zip(columns, label_arrays(batch_labels)):
+				column.append(array)
+			columns[3].append(np.repeat(np.array(batch_files, dtype=np.int64), batch_counts))
+		return tuple(np.concatenate(column) for column in columns)
+
 	def to_dict(self):
 		return {
 			"path": self.path,
 			"id": self.id,
-			"labels": [label.to_dict() for label in self.labels],
+			"labels": self.label_dicts(),
 			"verified_by": list(self.verified_by),
 			"comments": dict(self.comments)
 		}
 
 	@staticmethod
-	def from_dict(data):
-		labels = [Label.from_dict(label) for label in data.get("labels", [])]
+	def from_dict(data, lazy_labels=False):
+		"""
+		:param data: Dict as produced by to_dict (older formats are migrated).
+		:param lazy_labels: Keep the label dicts and only build Label objects when `labels` is first read.
+		"""
+		if lazy_labels:
+			labels = None
+		else:
+			labels = [Label.from_dict(label) for label in data.get("labels", [])]
 
 		# Support new verified_by list, with migration from old user_verified bool
 		if "verified_by" in data:
@@ -49,12 +114,15 @@ class FileEntry:
 		else:
 			comments = {}
 
-		return FileEntry(path=data["path"],
-		                 id=data["id"],
-		                 labels=labels,
-		                 verified_by=verified_by,
-		                 comments=comments
-		                 )
+		file_entry = FileEntry(path=data["path"],
+		                       id=data["id"],
+		                       labels=labels,
+		                       verified_by=verified_by,
+		                       comments=comments
+		                       )
+		if lazy_labels:
+			file_entry._raw_labels = list(data.get("labels", []))
+		return file_entry
 
 	def set_labels(self, labels):
 		self.labels = labels
@@ -1,21 +1,30 @@
-from datetime import datetime, time
+import sys
+from datetime import datetime, time, timedelta
+
+import numpy as np
 
 
 # Sentinel date used for legacy time-only labels
 _SENTINEL_DATE = datetime.min.date()
 
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+
 
 class Label:
+    # Projects hold hundreds of thousands of labels; slots drop the per-instance __dict__
+    __slots__ = ("start_time", "end_time", "behavior")
+
     def __init__(self, start_time, end_time, behavior):
         """
-        Initialize the label with start/end times and calculate the duration.
+        Initialize the label with start/end times.
         Times are stored as `datetime.datetime`. Accepts datetime, time, or string inputs.
         For backward compatibility, time-only values are combined with datetime.min date.
         """
         self.start_time = self._parse_time(start_time)
         self.end_time = self._parse_time(end_time)
-        self.behavior = behavior
-        self.duration = self.calculate_duration()
+        # Share one string object per behavior name rather than one per label
+        self.behavior = sys.intern(behavior) if isinstance(behavior, str) else behavior
         self.validate()
 
     @staticmethod
@@ -26,6 +35,14 @@ class Label:
         if isinstance(value, time):
             return datetime.combine(_SENTINEL_DATE, value)
         if isinstance(value, str):
+            # Fast path for what _serialize_time writes: "HH:MM:SS[.ffffff]" or a full ISO datetime
+            try:
+                if len(value) in (8, 15) and value[2] == ':':
+                    return datetime.combine(_SENTINEL_DATE, time.fromisoformat(value))
+                if len(value) in (19, 26) and value[10] == 'T':
+                    return datetime.fromisoformat(value)
+            except ValueError:
+                pass
             # Try full ISO datetime first (e.g. "2018-06-08T05:58:42.428860")
             try:
                 return datetime.fromisoformat(value)
@@ -50,6 +67,11 @@ class Label:
         end_time_str = self.end_time.strftime('%H:%M:%S.%f')[:-3]
         return f"{self.behavior} : {start_time_str} - {end_time_str} ({self.duration})"
 
+    @property
+    def duration(self):
+        """End minus start, derived so it always follows edits to the times."""
+        return self.end_time - self.start_time
+
     def calculate_duration(self):
         return self.end_time - self.start_time
 
@@ -75,3 +97,43 @@ class Label:
         if Label.is_legacy_time_only(dt):
             return dt.time().isoformat()
         return dt.isoformat()
+
+
+def _numpy_iso(value):
+    """Prefix time-only strings with the sentinel date so numpy can parse them as datetime64."""
+    if len(value) in (8, 15) and value[2] == ':':
+        return "0001-01-01T" + value
+    return value
+
+
+def _epoch_us(datetimes, count):
+    """Integer microseconds since the Unix epoch; far faster than converting datetime objects via datetime64."""
+    return np.fromiter(((dt - _EPOCH) // _ONE_US for dt in datetimes), dtype=np.int64, count=count)
+
+
+def label_arrays(labels):
+    """
+    Columnar view of labels for vectorized statistics.
+
+    :param labels: Label objects, or label dicts as stored in the project (parsed without building Labels).
+    :return: (start_us, end_us, behaviors): int64 microseconds since the Unix epoch (time-only labels
+        fall on the 0001-01-01 sentinel date) and an object array of behavior names.
+    """
+    count = len(labels)
+    if not count:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
+    if isinstance(labels[0], dict):
+        behaviors = np.array([label["behavior"] for label in labels], dtype=object)
+        try:
+            starts = np.array([_numpy_iso(label["start_time"]) for label in labels], dtype="datetime64[us]")
+            ends = np.array([_numpy_iso(label["end_time"]) for label in labels], dtype="datetime64[us]")
+            return starts.astype(np.int64), ends.astype(np.int64), behaviors
+        except ValueError:
+            # Formats numpy does not accept (e.g. unpadded hours) go through the full parser
+            starts = _epoch_us((Label._parse_time(label["start_time"]) for label in labels), count)
+            ends = _epoch_us((Label._parse_time(label["end_time"]) for label in labels), count)
+            return starts, ends, behaviors
+    behaviors = np.array([label.behavior for label in labels], dtype=object)
+    starts = _epoch_us((label.start_time for label in labels), count)
+    ends = _epoch_us((label.end_time for label in labels), count)
+    return starts, ends, behaviors
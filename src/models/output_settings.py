@@ -26,9 +26,19 @@ class OutputType(Enum):
     BEBE = "bebe"
 
 
+class ClipFormat(Enum):
+    """
+    Enum to define the file formats clips can be written in.
+    """
+    CSV = "csv"     # Headerless text CSV
+    NPY = "npy"     # Structured numpy array (float32 acceleration, small-int individual_id/label)
+    NPZ = "npz"     # Uncompressed numpy archive with one array per column
+
+
 class OutputSettings:
 	def __init__(self, output_type=OutputType.BEBE, downsample_methods=None,
-	             output_period=OutputPeriod.ENTIRE_INPUT, output_frequency=16, buffer_minutes=5, round_to_minutes=1):
+	             output_period=OutputPeriod.ENTIRE_INPUT, output_frequency=16, buffer_minutes=5, round_to_minutes=1,
+	             workers=1, incremental=False, clip_formats=None):
 		"""
 		Initializes the output settings for generating output files.
 
@@ -38,6 +48,12 @@ class OutputSettings:
 		:param output_frequency: Frequency of the output data in Hz (integer).
 		:param buffer_minutes: Buffer to add around labeled periods in minutes (integer).
 		:param round_to_minutes: Round the output data to the nearest multiple of X minutes (integer).
+		:param workers: Number of worker processes used to process files (1 = serial). This depends on
+			the machine generating the output, so it is not saved with the project.
+		:param incremental: Only regenerate clips whose source file, labels or settings changed since the
+			last run into the same output directory (per-run choice, not saved with the project).
+		:param clip_formats: List of ClipFormats to write each clip in (default CSV only). Chosen per run,
+			like `workers` and `incremental`, and recorded in each dataset_metadata.yaml rather than the project.
 		"""
 		self.output_type = output_type
 		self.downsample_methods = downsample_methods or [DownsampleMethod.AVERAGE]
@@ -45,6 +61,9 @@ class OutputSettings:
 		self.output_frequency = output_frequency
 		self.buffer_minutes = buffer_minutes
 		self.round_to_minutes = round_to_minutes
+		self.workers = workers
+		self.incremental = incremental
+		self.clip_formats = clip_formats or [ClipFormat.CSV]
 
 	def to_dict(self):
 		"""Converts the output settings to a dictionary representation."""
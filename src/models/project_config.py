@@ -36,12 +36,16 @@ class ProjectConfig:
         self.plot_title_format = plot_title_format if plot_title_format is not None else DEFAULT_PLOT_TITLE_FORMAT
         self.verification_threshold = verification_threshold if verification_threshold is not None else 1.0
 
-    def to_dict(self):
-        """Convert the project config into a dictionary format."""
+    def to_dict(self, include_entries=True):
+        """
+        Convert the project config into a dictionary format.
+
+        :param include_entries: False leaves out the entry tree (stores that keep files separately).
+        """
         return {
             "proj_name": self.proj_name,
             "users": [u.to_dict() for u in self.users],
-            "entries": [entry.to_dict() for entry in self.entries],
+            "entries": [entry.to_dict() for entry in self.entries] if include_entries else [],
             "label_display": [display.to_dict() for display in self.label_display],
             "output_settings": self.output_settings.to_dict(),
             "input_settings": self.input_settings.to_dict(),
@@ -52,10 +56,14 @@ class ProjectConfig:
         }
 
     @staticmethod
-    def from_dict(data):
-        """Load the project config from a dictionary."""
+    def from_dict(data, lazy_labels=False):
+        """
+        Load the project config from a dictionary.
+
+        :param lazy_labels: Defer parsing each file's labels until they are first accessed.
+        """
         entries = [
-            FileEntry.from_dict(e) if "path" in e else DirectoryEntry.from_dict(e)
+            FileEntry.from_dict(e, lazy_labels) if "path" in e else DirectoryEntry.from_dict(e, lazy_labels)
             for e in data.get("entries", [])
         ]
         label_display = [LabelDisplay.from_dict(display) for display in data.get("label_display", [])]
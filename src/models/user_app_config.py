@@ -6,7 +6,8 @@ class UserAppConfig:
 	def __init__(self, last_opened_project=None, last_opened_file=None, window_geometry="1200x800",
 	             project_browser_width=200, viewer_width=800, info_width=200, zoom_level=None,
 	             axes_display=None, window_state=None, splitter_positions=None,
-	             comment_save_delay=500, info_pane_max_width=300):
+	             comment_save_delay=500, info_pane_max_width=300, data_cache_dir=None,
+	             data_cache_max_mb=2048, project_save_delay=1000):
 		self.last_opened_project = last_opened_project  # Path to last opened project JSON
 		self.last_opened_file = last_opened_file  # File ID of last opened file
 		self.window_geometry = window_geometry  # e.g., "1200x800" (width x height)
@@ -19,6 +20,9 @@ class UserAppConfig:
 		self.splitter_positions = splitter_positions  # Splitter positions (like the divider between viewer & project browser)
 		self.comment_save_delay = comment_save_delay  # Debounce delay for comment auto-save (ms)
 		self.info_pane_max_width = info_pane_max_width  # Max width of the info pane (px)
+		self.data_cache_dir = data_cache_dir  # Parsed-data cache directory (None = default location)
+		self.data_cache_max_mb = data_cache_max_mb  # Disk budget for the parsed-data cache (0 = disabled)
+		self.project_save_delay = project_save_delay  # Quiet period before edits are written to the project (ms, 0 = immediate)
 
 	def to_dict(self):
 		"""Convert UserAppConfig instance to a dictionary."""
@@ -35,6 +39,9 @@ class UserAppConfig:
 			'splitter_positions': self.splitter_positions,
 			'comment_save_delay': self.comment_save_delay,
 			'info_pane_max_width': self.info_pane_max_width,
+			'data_cache_dir': self.data_cache_dir,
+			'data_cache_max_mb': self.data_cache_max_mb,
+			'project_save_delay': self.project_save_delay,
 		}
 
 	@classmethod
@@ -53,4 +60,7 @@ class UserAppConfig:
 			splitter_positions=data.get('splitter_positions'),
 			comment_save_delay=data.get('comment_save_delay', 500),
 			info_pane_max_width=data.get('info_pane_max_width', 300),
+			data_cache_dir=data.get('data_cache_dir'),
+			data_cache_max_mb=data.get('data_cache_max_mb', 2048),
+			project_save_delay=data.get('project_save_delay', 1000),
 		)
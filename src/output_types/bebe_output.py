@@ -1,20 +1,40 @@
+import hashlib
+import heapq
+import json
 import os
 import re
 import logging
+import tempfile
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
 import yaml
 
+from input_types.input_interface import DEFAULT_CHUNK_ROWS
 from input_types.vectronic_motion import VectronicMotionInput
 from models.directory_entry import DirectoryEntry
 from models.file_entry import FileEntry
-from models.output_settings import OutputSettings, DownsampleMethod, OutputPeriod
+from models.output_settings import OutputSettings, DownsampleMethod, OutputPeriod, ClipFormat
 from output_types.output_interface import OutputGeneratorInterface
 from models.project_config import ProjectConfig
 
 
+# BEBE clip column names, and the acceleration columns they are written from
+CLIP_COLUMN_NAMES = ["AccX", "AccY", "AccZ", "individual_id", "label"]
+ACC_COLUMNS = ["Acc X [g]", "Acc Y [g]", "Acc Z [g]"]
+
+# Input files above this size are processed chunk-by-chunk with bounded memory
+DEFAULT_STREAM_THRESHOLD_BYTES = 512 * 1024 * 1024
+
+# Written to the output directory so incremental runs can tell which clips are up to date
+MANIFEST_FILENAME = "bebe_manifest.json"
+MANIFEST_VERSION = 1
+
+
 class BEBEOutput(OutputGeneratorInterface):
 	"""
 	Output targeting the BEBE (Bio-logger Ethogram Benchmark) tool.
@@ -22,8 +42,17 @@ class BEBEOutput(OutputGeneratorInterface):
 	with a dataset_metadata.yaml per method subfolder.
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, data_cache=None, stream_threshold_bytes=DEFAULT_STREAM_THRESHOLD_BYTES,
+	             chunk_rows=DEFAULT_CHUNK_ROWS):
+		"""
+		:param data_cache: Optional DataCache so previously parsed CSVs are not re-parsed.
+		:param stream_threshold_bytes: Input files larger than this are streamed chunk-by-chunk
+			instead of being loaded (and cached) whole.
+		:param chunk_rows: Rows per chunk when streaming.
+		"""
+		self.data_cache = data_cache
+		self.stream_threshold_bytes = stream_threshold_bytes
+		self.chunk_rows = chunk_rows
 
 	def generate_output(self, project_config: ProjectConfig, output_dir: str, settings: OutputSettings, data_root: str, progress_callback=None):
 		"""
@@ -61,11 +90,75 @@ class BEBEOutput(OutputGeneratorInterface):
 			logging.warning("No file entries found in project config.")
 			return []
 
-		# Create input loader
-		loader = VectronicMotionInput(frequency=input_frequency)
-
-		# Track per-method metadata
-		# {method_value: {clip_ids: [], individual_ids: set(), clip_to_individual: {}, clip_to_individual_int: {}}}
+		# Assign integer individual IDs up front, in entry order, so serial and parallel runs agree
+		individual_str_to_int = {}
+		individual_ints = []
+		for file_entry in file_entries:
+			individual_str = self._extract_individual_id(file_entry.path, individual_id_regex)
+			if individual_str not in individual_str_to_int and os.path.isfile(os.path.join(data_root, file_entry.path)):
+				individual_str_to_int[individual_str] = len(individual_str_to_int)
+			individual_ints.append(individual_str_to_int.get(individual_str))
+
+		clip_dtypes = self._clip_dtypes(behavior_to_label_idx, len(individual_str_to_int))
+
+		# Fingerprint every clip's inputs; in incremental mode reuse clips whose inputs are unchanged
+		settings_hash = self._settings_hash(settings, input_frequency, behavior_to_label_idx, clip_dtypes)
+		old_manifest = self._load_manifest(output_dir) if settings.incremental else {}
+		fingerprints = [
+			self._clip_fingerprint(data_root, file_entry, individual_ints[i], settings_hash)
+			for i, file_entry in enumerate(file_entries)
+		]
+		results = [None] * len(file_entries)
+		pending = []
+		for i, file_entry in enumerate(file_entries):
+			previous = old_manifest.get(self._clip_id(file_entry))
+			if (previous is not None and fingerprints[i] is not None and previous["fingerprint"] == fingerprints[i]
+					and all(os.path.isfile(os.path.join(output_dir, f)) for f in previous["files"])):
+				results[i] = self._manifest_result(file_entry, individual_ints[i], previous, output_dir)
+			else:
+				pending.append(i)
+		if settings.incremental:
+			logging.info(f"Incremental output: {len(file_entries) - len(pending)} clips up to date, "
+			             f"{len(pending)} to regenerate")
+
+		job_args = (data_root, settings, downsample_ratio, behavior_to_label_idx, clip_dtypes, output_dir)
+		pending_entries = [file_entries[i] for i in pending]
+		pending_ints = [individual_ints[i] for i in pending]
+		if settings.workers > 1 and len(pending_entries) > 1:
+			pending_results = self._process_files_parallel(pending_entries, pending_ints, input_frequency, job_args,
+			                                               settings.workers, progress_callback)
+		else:
+			pending_results = self._process_files_serial(pending_entries, pending_ints, input_frequency, job_args,
+			                                             progress_callback)
+		retained = set()
+		for i, result in zip(pending, pending_results):
+			if result is None and fingerprints[i] is not None:
+				# Regeneration failed on a source that still exists: keep the previous clip, if it was
+				# written with the current settings, and retry it on the next run
+				previous = old_manifest.get(self._clip_id(file_entries[i]))
+				if (previous is not None and previous["fingerprint"]["settings"] == settings_hash
+						and previous["fingerprint"]["individual"] == individual_ints[i]
+						and all(os.path.isfile(os.path.join(output_dir, f)) for f in previous["files"])):
+					result = self._manifest_result(file_entries[i], individual_ints[i], previous, output_dir)
+					retained.add(i)
+			results[i] = result
+
+		new_manifest = {}
+		for i, result in enumerate(results):
+			if i in retained:
+				# The old fingerprint no longer matches, so the clip is regenerated next run
+				new_manifest[result["clip_id"]] = old_manifest[result["clip_id"]]
+			elif result is not None and fingerprints[i] is not None:
+				new_manifest[result["clip_id"]] = {
+					"fingerprint": fingerprints[i],
+					"files": [os.path.relpath(f, output_dir) for f in result["files"]],
+					"methods": result["methods"],
+				}
+		if settings.incremental:
+			self._remove_stale_files(output_dir, old_manifest, new_manifest)
+		self._write_manifest(output_dir, new_manifest)
+
+		# Accumulate metadata in entry order regardless of completion order
 		method_metadata = {}
 		for method in settings.downsample_methods:
 			method_metadata[method.value] = {
@@ -74,31 +167,19 @@ class BEBEOutput(OutputGeneratorInterface):
 				"clip_id_to_individual_id": {},
 			}
 
-		# Map individual string IDs to integer IDs
-		individual_str_to_int = {}
-		next_individual_int = 0
-
 		output_files = []
-		total = len(file_entries)
-
-		for i, file_entry in enumerate(file_entries):
-			if progress_callback:
-				progress_callback(i, total, file_entry.path)
-			try:
-				result = self._process_file(
-					file_entry, data_root, loader, settings, downsample_ratio,
-					behavior_to_label_idx, individual_str_to_int, next_individual_int,
-					output_dir, method_metadata, individual_id_regex
-				)
-				if result is not None:
-					next_individual_int = result["next_individual_int"]
-					individual_str_to_int = result["individual_str_to_int"]
-					output_files.extend(result["files"])
-			except Exception as e:
-				logging.error(f"Error processing {file_entry.path}: {e}")
+		for result in results:
+			if result is None:
+				continue
+			output_files.extend(result["files"])
+			for method_value in result["methods"]:
+				meta = method_metadata[method_value]
+				meta["clip_ids"].append(result["clip_id"])
+				meta["individual_ids_set"].add(result["individual_int"])
+				meta["clip_id_to_individual_id"][result["clip_id"]] = result["individual_int"]
 
 		if progress_callback:
-			progress_callback(total, total, "")
+			progress_callback(len(pending), len(pending), "")
 
 		# Write dataset_metadata.yaml for each method subfolder
 		for method in settings.downsample_methods:
@@ -106,11 +187,147 @@ class BEBEOutput(OutputGeneratorInterface):
 			self._write_metadata(
 				output_dir, method.value, meta, label_names,
 				output_frequency, project_config.proj_name,
-				individual_str_to_int
+				settings.clip_formats, clip_dtypes
 			)
 
 		return output_files
 
+	def _process_files_serial(self, file_entries, individual_ints, input_frequency, job_args, progress_callback):
+		"""Process file entries one at a time on the calling thread. Returns results in entry order."""
+		loader = VectronicMotionInput(frequency=input_frequency, cache=self.data_cache)
+		results = []
+		total = len(file_entries)
+		for i, file_entry in enumerate(file_entries):
+			if progress_callback:
+				progress_callback(i, total, file_entry.path)
+			try:
+				results.append(self._process_file(file_entry, individual_ints[i], loader, *job_args))
+			except Exception as e:
+				logging.error(f"Error processing {file_entry.path}: {e}")
+				results.append(None)
+		return results
+
+	def _process_files_parallel(self, file_entries, individual_ints, input_frequency, job_args, workers,
+	                            progress_callback):
+		"""
+		Fan file entries out across a process pool. Returns results in entry order.
+
+		progress_callback is called on the calling thread as each file finishes; if it raises
+		(e.g. the user cancelled) queued files are cancelled, running ones are allowed to finish,
+		and the exception propagates.
+		"""
+		total = len(file_entries)
+		results = [None] * total
+		# 'spawn' avoids forking a process that is running a Tk main loop
+		executor = ProcessPoolExecutor(max_workers=min(workers, total), mp_context=multiprocessing.get_context("spawn"))
+		try:
+			futures = {
+				executor.submit(_process_file_job, self, input_frequency, file_entry, individual_ints[i], *job_args): i
+				for i, file_entry in enumerate(file_entries)
+			}
+			if progress_callback:
+				progress_callback(0, total, file_entries[0].path)
+			for done, future in enumerate(as_completed(futures), start=1):
+				i = futures[future]
+				try:
+					results[i] = future.result()
+				except Exception as e:
+					logging.error(f"Error processing {file_entries[i].path}: {e}")
+				if progress_callback:
+					progress_callback(done, total, file_entries[i].path)
+		finally:
+			executor.shutdown(wait=True, cancel_futures=True)
+		return results
+
+	@staticmethod
+	def _clip_id(file_entry):
+		"""Unique clip ID for a file entry: first path component plus the entry id."""
+		clip_id = file_entry.path.replace("\\", "/").split("/")[0]
+		return f"{clip_id}_{file_entry.id}"
+
+	@classmethod
+	def _manifest_result(cls, file_entry, individual_int, record, output_dir):
+		"""The result of `_process_file` for a clip reused as recorded in the manifest."""
+		return {
+			"clip_id": cls._clip_id(file_entry),
+			"individual_int": individual_int,
+			"files": [os.path.join(output_dir, f) for f in record["files"]],
+			"methods": record["methods"],
+		}
+
+	@staticmethod
+	def _settings_hash(settings, input_frequency, behavior_to_label_idx, clip_dtypes):
+		"""Hash of everything besides the source file and its labels that affects clip contents."""
+		dtypes = {name: str(dtype) for name, dtype in clip_dtypes.items()}
+		formats = [f.value for f in settings.clip_formats]
+		raw = json.dumps([settings.to_dict(), formats, input_frequency, behavior_to_label_idx, dtypes], sort_keys=True)
+		return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+	@staticmethod
+	def _clip_fingerprint(data_root, file_entry, individual_int, settings_hash):
+		"""
+		Describe the inputs of one clip, or None if its source file is missing.
+
+		:return: {"source": [size, mtime_ns], "labels": sha1, "individual": int, "settings": sha1}
+		"""
+		try:
+			stat = os.stat(os.path.join(data_root, file_entry.path))
+		except OSError:
+			return None
+		labels = json.dumps(file_entry.label_dicts())
+		return {
+			"source": [stat.st_size, stat.st_mtime_ns],
+			"labels": hashlib.sha1(labels.encode("utf-8")).hexdigest(),
+			"individual": individual_int,
+			"settings": settings_hash,
+		}
+
+	@staticmethod
+	def _load_manifest(output_dir):
+		"""Read the clip manifest from a previous run, or {} if there is none (or it is unreadable)."""
+		path = os.path.join(output_dir, MANIFEST_FILENAME)
+		try:
+			with open(path, "r") as f:
+				data = json.load(f)
+		except FileNotFoundError:
+			return {}
+		except (OSError, ValueError) as e:
+			logging.warning(f"Ignoring unreadable output manifest {path}: {e}")
+			return {}
+		if data.get("version") != MANIFEST_VERSION:
+			return {}
+		return data.get("clips", {})
+
+	@staticmethod
+	def _write_manifest(output_dir, clips):
+		"""Atomically write the clip manifest."""
+		os.makedirs(output_dir, exist_ok=True)
+		fd, temp_path = tempfile.mkstemp(suffix=".json", dir=output_dir, text=True)
+		try:
+			with os.fdopen(fd, "w") as f:
+				json.dump({"version": MANIFEST_VERSION, "clips": clips}, f, indent=1)
+			os.replace(temp_path, os.path.join(output_dir, MANIFEST_FILENAME))
+		except BaseException:
+			try:
+				os.unlink(temp_path)
+			except OSError:
+				pass
+			raise
+
+	@staticmethod
+	def _remove_stale_files(output_dir, old_manifest, new_manifest):
+		"""Delete clip files recorded by the previous run that the current run no longer produces."""
+		current = {f for clip in new_manifest.values() for f in clip["files"]}
+		for clip_id, clip in old_manifest.items():
+			for rel_path in clip["files"]:
+				if rel_path in current:
+					continue
+				try:
+					os.remove(os.path.join(output_dir, rel_path))
+					logging.info(f"Removed stale clip file {rel_path} ({clip_id})")
+				except OSError:
+					pass
+
 	def _collect_file_entries(self, entries, result):
 		"""Recursively collect all FileEntry objects from the project tree."""
 		for entry in entries:
@@ -133,71 +350,172 @@ class BEBEOutput(OutputGeneratorInterface):
 		parts = normalized.split("/")
 		return parts[0] if parts else "unknown"
 
-	def _process_file(self, file_entry, data_root, loader, settings, downsample_ratio,
-	                   behavior_to_label_idx, individual_str_to_int, next_individual_int,
-	                   output_dir, method_metadata, individual_id_regex):
-		"""Process a single file entry and write output CSVs for each selected method."""
+	def _process_file(self, file_entry, individual_int, loader, data_root, settings, downsample_ratio,
+	                  behavior_to_label_idx, clip_dtypes, output_dir):
+		"""
+		Process a single file entry and write its clip in every selected format for each selected method.
+
+		:return: {"clip_id", "individual_int", "files", "methods"} describing what was written, or None if
+			the file was not found.
+		"""
 		file_path = os.path.join(data_root, file_entry.path)
 		if not os.path.isfile(file_path):
 			logging.warning(f"File not found, skipping: {file_path}")
 			return None
 
-		# Extract clip_id and individual_id from the path using config regex
-		path_parts = file_entry.path.replace("\\", "/").split("/")
-		clip_id = path_parts[0]
-		individual_str = self._extract_individual_id(file_entry.path, individual_id_regex)
+		# Generate a unique clip_id per file entry (use file entry id to disambiguate)
+		unique_clip_id = self._clip_id(file_entry)
+		result = {"clip_id": unique_clip_id, "individual_int": individual_int, "files": [], "methods": []}
 
-		# Assign integer individual ID
-		if individual_str not in individual_str_to_int:
-			individual_str_to_int[individual_str] = next_individual_int
-			next_individual_int += 1
-		individual_int = individual_str_to_int[individual_str]
+		if os.path.getsize(file_path) > self.stream_threshold_bytes:
+			return self._process_file_streaming(file_entry, individual_int, loader, file_path, result, settings,
+			                                    downsample_ratio, behavior_to_label_idx, clip_dtypes, output_dir)
 
 		# Load the CSV
-		df = loader.load_data(file_path)
+		df = loader.load_cached(file_path)
 
 		# Apply output period filtering
 		if settings.output_period == OutputPeriod.LABELED_WITH_BUFFER:
 			df = self._filter_labeled_with_buffer(df, file_entry.labels, settings.buffer_minutes, settings.round_to_minutes)
 			if df.empty:
 				logging.info(f"No data after period filtering for {file_entry.path}")
-				return {"next_individual_int": next_individual_int, "individual_str_to_int": individual_str_to_int, "files": []}
+				return result
 
 		# Assign label column
 		df["label"] = self._assign_labels(df, file_entry.labels, behavior_to_label_idx)
 		df["individual_id"] = individual_int
 
-		# Generate a unique clip_id per file entry (use file entry id to disambiguate)
-		unique_clip_id = f"{clip_id}_{file_entry.id}"
+		# Downsample with every selected method in one pass over the frame
+		downsampled_by_method = self._downsample_all(df, settings.downsample_methods, downsample_ratio)
 
-		output_files = []
 		for method in settings.downsample_methods:
-			# Downsample
-			downsampled = self._downsample(df, method, downsample_ratio)
+			downsampled = downsampled_by_method[method]
 
-			# Write the output CSV (headerless)
 			method_dir = os.path.join(output_dir, method.value, "clip_data")
 			os.makedirs(method_dir, exist_ok=True)
 
-			out_path = os.path.join(method_dir, f"{unique_clip_id}.csv")
 			# Columns: AccX, AccY, AccZ, individual_id, label
-			out_df = downsampled[["Acc X [g]", "Acc Y [g]", "Acc Z [g]", "individual_id", "label"]]
-			out_df.to_csv(out_path, header=False, index=False)
-			output_files.append(out_path)
+			out_df = downsampled[ACC_COLUMNS + ["individual_id", "label"]]
+			for clip_format in settings.clip_formats:
+				out_path = os.path.join(method_dir, f"{unique_clip_id}.{clip_format.value}")
+				self._write_clip(out_df, out_path, clip_format, clip_dtypes)
+				result["files"].append(out_path)
+				logging.info(f"Wrote {method.value} output: {out_path}")
+			result["methods"].append(method.value)
+
+		return result
+
+	def _process_file_streaming(self, file_entry, individual_int, loader, file_path, result, settings,
+	                            downsample_ratio, behavior_to_label_idx, clip_dtypes, output_dir):
+		"""
+		Chunked equivalent of `_process_file` for inputs too large to load whole.
 
-			# Update metadata tracking
-			meta = method_metadata[method.value]
-			meta["clip_ids"].append(unique_clip_id)
-			meta["individual_ids_set"].add(individual_int)
-			meta["clip_id_to_individual_id"][unique_clip_id] = individual_int
+		Each chunk is filtered and labeled on its own. Rows left over after the last complete
+		downsample group are carried into the next chunk, so groups that straddle a chunk boundary
+		are reduced exactly as in the in-memory path. CSV clips are appended chunk by chunk; binary
+		clips are collected in their compact output dtypes and written at the end, so memory is
+		bounded by the chunk size plus the (downsampled) binary output.
+		"""
+		methods = settings.downsample_methods
+		ratio = max(downsample_ratio, 1)
+		clip_dir = {method: os.path.join(output_dir, method.value, "clip_data") for method in methods}
+		csv_files = {}
+		binary_pieces = {}
+		carry = None
+		emitted = False
+
+		def emit(downsampled_by_method):
+			for method, downsampled in downsampled_by_method.items():
+				out_df = downsampled[ACC_COLUMNS + ["individual_id", "label"]]
+				for clip_format in settings.clip_formats:
+					if clip_format == ClipFormat.CSV:
+						if method not in csv_files:
+							os.makedirs(clip_dir[method], exist_ok=True)
+							out_path = os.path.join(clip_dir[method], f"{result['clip_id']}.csv")
+							csv_files[method] = open(out_path, "w", newline="")
+						out_df.to_csv(csv_files[method], header=False, index=False)
+					else:
+						binary_pieces.setdefault((method, clip_format), []).append(
+							out_df.astype(dict(zip(out_df.columns, (clip_dtypes[n] for n in CLIP_COLUMN_NAMES)))))
+
+		try:
+			for chunk in loader.iter_chunks(file_path, self.chunk_rows):
+				if settings.output_period == OutputPeriod.LABELED_WITH_BUFFER:
+					chunk = self._filter_labeled_with_buffer(chunk, file_entry.labels, settings.buffer_minutes,
+					                                         settings.round_to_minutes)
+					if chunk.empty:
+						continue
+				chunk["label"] = self._assign_labels(chunk, file_entry.labels, behavior_to_label_idx)
+				chunk["individual_id"] = individual_int
+
+				if carry is not None:
+					chunk = pd.concat([carry, chunk], ignore_index=True)
+				n_full = len(chunk) // ratio * ratio
+				carry = chunk.iloc[n_full:].reset_index(drop=True)
+				if n_full:
+					emit(self._downsample_all(chunk.iloc[:n_full], methods, downsample_ratio))
+					emitted = True
+
+			if carry is not None and not carry.empty:
+				if not emitted:
+					# Shorter than one group overall: same result as downsampling the whole frame
+					emit(self._downsample_all(carry, methods, downsample_ratio))
+					emitted = True
+				elif DownsampleMethod.NTH_VALUE in methods:
+					# Every ratio-th row includes the first row of a trailing partial group
+					emit({DownsampleMethod.NTH_VALUE: carry.iloc[:1]})
+		finally:
+			for f in csv_files.values():
+				f.close()
+
+		if not emitted:
+			logging.info(f"No data after period filtering for {file_entry.path}")
+			return result
+
+		for method in methods:
+			for clip_format in settings.clip_formats:
+				out_path = os.path.join(clip_dir[method], f"{result['clip_id']}.{clip_format.value}")
+				if clip_format != ClipFormat.CSV:
+					os.makedirs(clip_dir[method], exist_ok=True)
+					pieces = binary_pieces.pop((method, clip_format))
+					self._write_clip(pd.concat(pieces, ignore_index=True), out_path, clip_format, clip_dtypes)
+				result["files"].append(out_path)
+				logging.info(f"Wrote {method.value} output (streamed): {out_path}")
+			result["methods"].append(method.value)
+
+		return result
 
-			logging.info(f"Wrote {method.value} output: {out_path}")
+	@staticmethod
+	def _clip_dtypes(behavior_to_label_idx, n_individuals):
+		"""
+		Column dtypes for binary clip formats: float32 acceleration and the smallest unsigned
+		integer types that hold every label index and individual ID, fixed for the whole run.
+		"""
+		max_label = max(behavior_to_label_idx.values(), default=0)
+		dtypes = {name: np.dtype(np.float32) for name in CLIP_COLUMN_NAMES[:3]}
+		dtypes["individual_id"] = np.min_scalar_type(max(n_individuals - 1, 0))
+		dtypes["label"] = np.min_scalar_type(max_label)
+		return dtypes
 
-		return {
-			"next_individual_int": next_individual_int,
-			"individual_str_to_int": individual_str_to_int,
-			"files": output_files
-		}
+	@staticmethod
+	def _write_clip(out_df, out_path, clip_format, clip_dtypes):
+		"""Write one clip (columns AccX, AccY, AccZ, individual_id, label) in the given format."""
+		if clip_format == ClipFormat.CSV:
+			# Headerless, full precision text
+			out_df.to_csv(out_path, header=False, index=False)
+			return
+
+		columns = {name: out_df.iloc[:, i].to_numpy(dtype=clip_dtypes[name])
+		           for i, name in enumerate(CLIP_COLUMN_NAMES)}
+		if clip_format == ClipFormat.NPY:
+			clip = np.empty(len(out_df), dtype=[(name, clip_dtypes[name]) for name in CLIP_COLUMN_NAMES])
+			for name, values in columns.items():
+				clip[name] = values
+			np.save(out_path, clip)
+		elif clip_format == ClipFormat.NPZ:
+			np.savez(out_path, **columns)
+		else:
+			raise ValueError(f"Unsupported clip format: {clip_format}")
 
 	def _filter_labeled_with_buffer(self, df, labels, buffer_minutes, round_to_minutes):
 		"""Filter DataFrame to only include rows within buffered/rounded label periods."""
@@ -234,13 +552,13 @@ class BEBEOutput(OutputGeneratorInterface):
 		# Merge overlapping ranges
 		ranges = self._merge_datetime_ranges(ranges)
 
-		# Filter rows whose Timestamp falls within any range
-		mask = pd.Series(False, index=df.index)
-		row_timestamps = df["Timestamp"]
-		for start_dt, end_dt in ranges:
-			start_ts = pd.Timestamp(start_dt)
-			end_ts = pd.Timestamp(end_dt)
-			mask |= (row_timestamps >= start_ts) & (row_timestamps <= end_ts)
+		# Filter rows whose Timestamp falls within any range. The merged ranges are disjoint and
+		# sorted, so each row only needs to be checked against the last range starting at or before it.
+		starts = np.array([pd.Timestamp(start_dt).value for start_dt, _end_dt in ranges], dtype=np.int64)
+		ends = np.array([pd.Timestamp(end_dt).value for _start_dt, end_dt in ranges], dtype=np.int64)
+		row_ns = self._timestamps_ns(df)
+		range_idx = np.searchsorted(starts, row_ns, side="right") - 1
+		mask = (range_idx >= 0) & (row_ns <= ends[np.maximum(range_idx, 0)])
 
 		return df[mask].reset_index(drop=True)
 
@@ -261,79 +579,138 @@ class BEBEOutput(OutputGeneratorInterface):
 		return merged
 
 	def _assign_labels(self, df, labels, behavior_to_label_idx):
-		"""Assign integer label to each row based on whether its timestamp falls within a label range."""
+		"""
+		Assign integer label to each row based on whether its timestamp falls within a label range.
+
+		Ranges include both endpoints and, where labels overlap, the later label in the list wins.
+		The label boundaries split time into elementary segments whose winning label is resolved
+		once, then every row is placed into its segment with a single binary search.
+		"""
 		label_col = np.zeros(len(df), dtype=int)
 
 		if not labels or "Timestamp" not in df.columns:
 			return label_col
 
-		row_timestamps = df["Timestamp"].values
-
+		# (start, end + 1ns) half-open intervals in list order; unmapped behaviors never overwrite
+		intervals = []
 		for label in labels:
 			idx = behavior_to_label_idx.get(label.behavior, 0)
 			if idx == 0:
 				continue
+			intervals.append((pd.Timestamp(label.start_time).value, pd.Timestamp(label.end_time).value + 1, idx))
+		if not intervals:
+			return label_col
 
-			start_ts = np.datetime64(label.start_time)
-			end_ts = np.datetime64(label.end_time)
+		boundaries = np.unique(np.array([[start, end] for start, end, _idx in intervals], dtype=np.int64))
+		segment_labels = self._segment_labels(boundaries, intervals)
 
-			mask = (row_timestamps >= start_ts) & (row_timestamps <= end_ts)
-			label_col[mask] = idx
+		row_ns = self._timestamps_ns(df)
+		segment = np.searchsorted(boundaries, row_ns, side="right") - 1
+		inside = (segment >= 0) & (segment < len(segment_labels))
+		label_col[inside] = segment_labels[segment[inside]]
 
 		return label_col
 
+	@staticmethod
+	def _segment_labels(boundaries, intervals):
+		"""
+		Winning label of each segment [boundaries[j], boundaries[j + 1]): the label of the last
+		interval in list order that covers it, or 0. Sweeps the segments once with a max-heap of
+		active intervals keyed by list position.
+		"""
+		starts_at = {}
+		for order, (start, end, idx) in enumerate(intervals):
+			first = int(np.searchsorted(boundaries, start))
+			last = int(np.searchsorted(boundaries, end))
+			starts_at.setdefault(first, []).append((-order, last, idx))
+
+		segment_labels = np.zeros(len(boundaries) - 1, dtype=int)
+		active = []
+		for j in range(len(segment_labels)):
+			for item in starts_at.get(j, ()):
+				heapq.heappush(active, item)
+			while active and active[0][1] <= j:
+				heapq.heappop(active)
+			if active:
+				segment_labels[j] = active[0][2]
+		return segment_labels
+
+	@staticmethod
+	def _timestamps_ns(df):
+		"""The 'Timestamp' column as int64 nanoseconds."""
+		return df["Timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+
 	def _downsample(self, df, method, ratio):
 		"""Downsample the DataFrame using the specified method and ratio."""
-		if ratio <= 1:
-			return df.copy()
+		return self._downsample_all(df, [method], ratio)[method]
 
-		acc_cols = ["Acc X [g]", "Acc Y [g]", "Acc Z [g]"]
+	def _downsample_all(self, df, methods, ratio):
+		"""
+		Downsample the DataFrame with every given method in one pass.
+
+		AVERAGE, MIN and MAX reduce each group of `ratio` consecutive rows (a trailing partial
+		group is dropped) over a single (n_groups, ratio) view of the acceleration block, which
+		is built, NaN-checked and shared by all of them together with the per-group label and
+		individual ID columns. The group label is its most frequent value, ties going to the
+		smallest label, and the individual ID is taken from the group's first row.
+
+		:param df: DataFrame with the acceleration, 'label' and 'individual_id' columns.
+		:param methods: DownsampleMethods to compute.
+		:param ratio: Number of input rows per output row.
+		:return: {method: downsampled DataFrame}
+		"""
+		if ratio <= 1:
+			return {method: df.copy() for method in methods}
 
-		if method == DownsampleMethod.NTH_VALUE:
-			return df.iloc[::ratio].reset_index(drop=True)
+		acc_cols = ACC_COLUMNS
+		results = {}
+		grouped = [m for m in methods if m != DownsampleMethod.NTH_VALUE]
+		if DownsampleMethod.NTH_VALUE in methods:
+			results[DownsampleMethod.NTH_VALUE] = df.iloc[::ratio].reset_index(drop=True)
+		if not grouped:
+			return results
 
 		# For AVERAGE, MIN, MAX: group every `ratio` rows
 		n_groups = len(df) // ratio
 		if n_groups == 0:
-			return df.copy()
-
-		# Trim to exact multiple of ratio
-		trimmed = df.iloc[:n_groups * ratio].copy()
-		group_ids = np.arange(len(trimmed)) // ratio
-
-		result_rows = []
-		for g in range(n_groups):
-			group_mask = group_ids == g
-			group = trimmed[group_mask]
-
-			if method == DownsampleMethod.AVERAGE:
-				acc_values = group[acc_cols].mean()
-			elif method == DownsampleMethod.MIN:
-				acc_values = group[acc_cols].min()
+			results.update({method: df.copy() for method in grouped})
+			return {method: results[method] for method in methods}
+
+		n_rows = n_groups * ratio
+		acc = df[acc_cols].to_numpy(dtype=np.float64)[:n_rows].reshape(n_groups, ratio, len(acc_cols))
+		individual_ids = df["individual_id"].to_numpy()[:n_rows:ratio]
+		labels = self._group_label_mode(df["label"].to_numpy()[:n_rows], n_groups, ratio)
+
+		# pandas skips NaN in mean/min/max; only pay for the nan-aware reductions when needed
+		has_nan = np.isnan(acc).any()
+		for method in grouped:
+			if method == DownsampleMethod.MIN:
+				reduce = np.nanmin if has_nan else np.min
 			elif method == DownsampleMethod.MAX:
-				acc_values = group[acc_cols].max()
+				reduce = np.nanmax if has_nan else np.max
 			else:
-				acc_values = group[acc_cols].mean()
-
-			# Label: mode (most frequent) within group
-			label_mode = group["label"].mode()
-			label_val = label_mode.iloc[0] if not label_mode.empty else 0
+				reduce = np.nanmean if has_nan else np.mean
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN groups reduce to NaN, as in pandas
+				acc_values = reduce(acc, axis=1)
 
-			individual_id = group["individual_id"].iloc[0]
+			result = pd.DataFrame(acc_values, columns=acc_cols)
+			result["individual_id"] = individual_ids
+			result["label"] = labels
+			results[method] = result
+		return {method: results[method] for method in methods}
 
-			row = {
-				"Acc X [g]": acc_values["Acc X [g]"],
-				"Acc Y [g]": acc_values["Acc Y [g]"],
-				"Acc Z [g]": acc_values["Acc Z [g]"],
-				"individual_id": individual_id,
-				"label": label_val
-			}
-			result_rows.append(row)
-
-		return pd.DataFrame(result_rows)
+	@staticmethod
+	def _group_label_mode(labels, n_groups, ratio):
+		"""Most frequent label of each group of `ratio` rows, ties resolved to the smallest label."""
+		offset = labels.min()
+		n_labels = int(labels.max() - offset) + 1
+		group_ids = np.arange(len(labels)) // ratio
+		counts = np.bincount(group_ids * n_labels + (labels - offset), minlength=n_groups * n_labels)
+		return counts.reshape(n_groups, n_labels).argmax(axis=1) + offset
 
 	def _write_metadata(self, output_dir, method_value, meta, label_names,
-	                     output_frequency, project_name, individual_str_to_int):
+	                     output_frequency, project_name, clip_formats, clip_dtypes):
 		"""Write dataset_metadata.yaml for a method subfolder."""
 		method_dir = os.path.join(output_dir, method_value)
 		os.makedirs(method_dir, exist_ok=True)
@@ -365,11 +742,14 @@ class BEBEOutput(OutputGeneratorInterface):
 			"individual_ids": individual_ids,
 			"clip_id_to_individual_id": clip_id_to_individual_id,
 			"label_names": label_names,
-			"clip_column_names": ["AccX", "AccY", "AccZ", "individual_id", "label"],
+			"clip_column_names": CLIP_COLUMN_NAMES,
+			"clip_formats": [f.value for f in clip_formats],
 			"n_folds": n_folds,
 			"individuals_per_fold": individuals_per_fold,
 			"clip_ids_per_fold": clip_ids_per_fold
 		}
+		if any(f != ClipFormat.CSV for f in clip_formats):
+			metadata["clip_column_dtypes"] = {name: str(dtype) for name, dtype in clip_dtypes.items()}
 
 		yaml_path = os.path.join(method_dir, "dataset_metadata.yaml")
 		with open(yaml_path, "w") as f:
@@ -385,4 +765,13 @@ class BEBEOutput(OutputGeneratorInterface):
 		if settings.output_frequency <= 0:
 			logging.error("Output frequency must be positive.")
 			return False
+		if settings.workers < 1:
+			logging.error("Worker count must be at least 1.")
+			return False
 		return True
+
+
+def _process_file_job(bebe, input_frequency, file_entry, individual_int, *job_args):
+	"""Process-pool entry point: process one file entry in a worker process."""
+	loader = VectronicMotionInput(frequency=input_frequency, cache=bebe.data_cache)
+	return bebe._process_file(file_entry, individual_int, loader, *job_args)
@@ -0,0 +1,317 @@
+import logging
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional, Set
+
+from models.project_config import DEFAULT_INDIVIDUAL_ID_REGEX
+
+# Kept outside the data cache directory, whose contents are subject to LRU eviction
+DEFAULT_CATALOG_PATH = os.path.join(os.path.expanduser("~"), ".accelscope_catalog.sqlite")
+
+# Threads listing directories during a refresh; directory listing is I/O bound, so this can exceed the CPU count
+DEFAULT_SCAN_WORKERS = 8
+
+# Bump whenever the schema changes; older catalogs are dropped and rebuilt on open
+CATALOG_FORMAT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    root TEXT PRIMARY KEY,
+    individual_id_regex TEXT,
+    refreshed_at REAL
+);
+CREATE TABLE IF NOT EXISTS files (
+    root TEXT NOT NULL,
+    rel_path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    individual_id TEXT,
+    rows INTEGER,
+    start_time TEXT,
+    end_time TEXT,
+    sample_rate_hz REAL,
+    backtracks INTEGER,
+    PRIMARY KEY (root, rel_path)
+);
+CREATE INDEX IF NOT EXISTS files_individual ON files (root, individual_id);
+"""
+
+_ENTRY_COLUMNS = ("rel_path", "size", "mtime_ns", "individual_id", "rows", "start_time", "end_time",
+                  "sample_rate_hz", "backtracks")
+
+
+def extract_individual_id(rel_path: str, individual_id_regex: str) -> Optional[str]:
+    """Return the 'individual' group of `individual_id_regex` in a relative path, or None if it does not match."""
+    match = re.search(individual_id_regex, rel_path.replace("\\", "/"))
+    if not match:
+        return None
+    try:
+        return match.group("individual")
+    except IndexError:
+        return None
+
+
+class CatalogEntry:
+    """One data file in the catalog. Profile fields are None until the file has been profiled."""
+
+    def __init__(self, rel_path, size, mtime_ns, individual_id=None, rows=None, start_time=None, end_time=None,
+                 sample_rate_hz=None, backtracks=None):
+        """
+        :param rel_path: Path relative to the data root, '/'-separated.
+        :param size: File size in bytes.
+        :param mtime_ns: File modification time in nanoseconds.
+        :param individual_id: Individual ID extracted with the root's individual_id_regex.
+        :param rows: Number of samples with a valid timestamp.
+        :param start_time: ISO time of day of the first sample.
+        :param end_time: ISO time of day of the last sample.
+        :param sample_rate_hz: Estimated sample rate.
+        :param backtracks: Number of timestamp backtracks.
+        """
+        self.rel_path = rel_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.individual_id = individual_id
+        self.rows = rows
+        self.start_time = start_time
+        self.end_time = end_time
+        self.sample_rate_hz = sample_rate_hz
+        self.backtracks = backtracks
+
+    @property
+    def is_profiled(self) -> bool:
+        return self.rows is not None
+
+    def __repr__(self):
+        return f"CatalogEntry({self.rel_path!r}, size={self.size}, individual_id={self.individual_id!r}, rows={self.rows})"
+
+
+class FileCatalog:
+    """
+    Persistent SQLite index of the data files under one or more data roots.
+
+    `refresh` walks a root and diffs each file's size and mtime against the index, so only
+    new, changed and deleted files touch the database; file contents are never read. Callers
+    that need per-file statistics (row count, start/end time, sample rate, backtracks) fill
+    them in with `profile_pending`, which again only reads files whose stat changed.
+    Project creation, validation and filtering query the index instead of crawling the root.
+
+    Every method opens its own short-lived connection, so one catalog may be shared across threads.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_CATALOG_PATH):
+        """
+        :param db_path: SQLite database file (created, along with its directory, on first use).
+        """
+        self.db_path = db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != CATALOG_FORMAT_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS roots;")
+            conn.execute(f"PRAGMA user_version = {CATALOG_FORMAT_VERSION}")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    @staticmethod
+    def _root_key(data_root: str) -> str:
+        return os.path.normcase(os.path.abspath(data_root))
+
+    @staticmethod
+    def _scan_directory(directory: str, data_root: str, extensions: Set[str]):
+        """
+        List one directory level.
+
+        :return: ([(rel_path, size, mtime_ns), ...] for matching files, [subdirectory paths])
+        """
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            subdirs.append(item.path)
+                        elif os.path.splitext(item.name)[1].lower() in extensions:
+                            stat = item.stat()
+                            rel = os.path.relpath(item.path, data_root).replace("\\", "/")
+                            files.append((rel, stat.st_size, stat.st_mtime_ns))
+                    except OSError as e:
+                        logging.warning(f"Skipping {item.path}: {e}")
+        except OSError as e:
+            logging.warning(f"Unable to scan {directory}: {e}")
+        return files, subdirs
+
+    @staticmethod
+    def _walk(data_root: str, extensions: Iterable[str], workers: int = DEFAULT_SCAN_WORKERS, progress_callback=None):
+        """
+        List every file under data_root with a matching extension, scanning directories in parallel.
+
+        Each directory is listed by a pool thread and its subdirectories are queued as soon as it
+        finishes, so sibling subtrees (e.g. one per collar) are traversed concurrently. That hides
+        most of the per-request latency of network shares.
+
+        :param progress_callback: Optional callback(new_files, found_count), called on the calling
+                                  thread after each directory with its matching files. If it raises,
+                                  the walk stops and the exception propagates.
+        :return: List of (rel_path, size, mtime_ns).
+        """
+        extensions = {ext.lower() for ext in extensions}
+        found = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            pending = {executor.submit(FileCatalog._scan_directory, data_root, data_root, extensions)}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        files, subdirs = future.result()
+                        pending |= {executor.submit(FileCatalog._scan_directory, subdir, data_root, extensions)
+                                    for subdir in subdirs}
+                        found.extend(files)
+                        if progress_callback is not None and files:
+                            progress_callback([rel for rel, _size, _mtime in files], len(found))
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        return found
+
+    def refresh(self, data_root: str, extensions: Iterable[str] = (".csv",),
+                individual_id_regex: str = DEFAULT_INDIVIDUAL_ID_REGEX, workers: int = DEFAULT_SCAN_WORKERS,
+                progress_callback=None) -> Dict[str, int]:
+        """
+        Bring the index for data_root up to date with the filesystem.
+
+        Only files with one of `extensions` are considered; indexed files with other extensions
+        are left alone. New and changed files lose any profile statistics. Individual IDs are
+        recomputed for every file when `individual_id_regex` differs from the last refresh.
+
+        :param data_root: Root directory of the data files.
+        :param extensions: File extensions to index, with leading dots.
+        :param individual_id_regex: Regex with an 'individual' group, searched in each relative path.
+        :param workers: Threads used to list directories.
+        :param progress_callback: Optional callback(new_rel_paths, found_count), called as directories
+                                  are listed. Raising from it cancels the refresh before the index is touched.
+        :return: Dict with the number of 'added', 'changed' and 'removed' files.
+        """
+        root = self._root_key(data_root)
+        extensions = {ext.lower() for ext in extensions}
+        counts = {"added": 0, "changed": 0, "removed": 0}
+        scanned = self._walk(data_root, extensions, workers, progress_callback)
+
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT individual_id_regex FROM roots WHERE root = ?", (root,)).fetchone()
+            if row is not None and row[0] != individual_id_regex:
+                rel_paths = [r[0] for r in conn.execute("SELECT rel_path FROM files WHERE root = ?", (root,))]
+                conn.executemany("UPDATE files SET individual_id = ? WHERE root = ? AND rel_path = ?",
+                                 [(extract_individual_id(rel, individual_id_regex), root, rel) for rel in rel_paths])
+
+            indexed = {rel: (size, mtime_ns) for rel, size, mtime_ns in
+                       conn.execute("SELECT rel_path, size, mtime_ns FROM files WHERE root = ?", (root,))
+                       if os.path.splitext(rel)[1].lower() in extensions}
+
+            upserts = []
+            for rel, size, mtime_ns in scanned:
+                previous = indexed.pop(rel, None)
+                if previous == (size, mtime_ns):
+                    continue
+                counts["added" if previous is None else "changed"] += 1
+                upserts.append((root, rel, size, mtime_ns, extract_individual_id(rel, individual_id_regex)))
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO files (root, rel_path, size, mtime_ns, individual_id) VALUES (?, ?, ?, ?, ?)",
+                upserts)
+            conn.executemany("DELETE FROM files WHERE root = ? AND rel_path = ?", [(root, rel) for rel in indexed])
+            counts["removed"] = len(indexed)
+            conn.execute("INSERT OR REPLACE INTO roots (root, individual_id_regex, refreshed_at) VALUES (?, ?, ?)",
+                         (root, individual_id_regex, time.time()))
+
+        logging.info(f"Catalog refresh of {data_root}: {counts}")
+        return counts
+
+    def is_indexed(self, data_root: str) -> bool:
+        """Whether data_root has been refreshed at least once."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM roots WHERE root = ?", (self._root_key(data_root),)).fetchone() is not None
+
+    def files(self, data_root: str, extensions: Optional[Iterable[str]] = None,
+              individual_id: Optional[str] = None) -> List[CatalogEntry]:
+        """
+        List indexed files under data_root, sorted by relative path.
+
+        :param extensions: Only return files with one of these extensions.
+        :param individual_id: Only return files of this individual.
+        """
+        query = f"SELECT {', '.join(_ENTRY_COLUMNS)} FROM files WHERE root = ?"
+        params = [self._root_key(data_root)]
+        if individual_id is not None:
+            query += " AND individual_id = ?"
+            params.append(individual_id)
+        query += " ORDER BY rel_path"
+        with closing(self._connect()) as conn:
+            entries = [CatalogEntry(*row) for row in conn.execute(query, params)]
+        if extensions is not None:
+            extensions = {ext.lower() for ext in extensions}
+            entries = [e for e in entries if os.path.splitext(e.rel_path)[1].lower() in extensions]
+        return entries
+
+    def lookup(self, data_root: str, rel_paths: Iterable[str]) -> Dict[str, CatalogEntry]:
+        """
+        Find indexed files by relative path.
+
+        :return: Dict of relative path -> CatalogEntry for the paths present in the index.
+        """
+        wanted = {rel.replace("\\", "/"): rel for rel in rel_paths}
+        found = {}
+        with closing(self._connect()) as conn:
+            query = f"SELECT {', '.join(_ENTRY_COLUMNS)} FROM files WHERE root = ?"
+            for row in conn.execute(query, (self._root_key(data_root),)):
+                if row[0] in wanted:
+                    found[wanted[row[0]]] = CatalogEntry(*row)
+        return found
+
+    def individual_ids(self, data_root: str) -> List[str]:
+        """Distinct individual IDs under data_root, sorted."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT DISTINCT individual_id FROM files WHERE root = ? AND individual_id IS NOT NULL "
+                                "ORDER BY individual_id", (self._root_key(data_root),))
+            return [row[0] for row in rows]
+
+    def store_profile(self, data_root: str, rel_path: str, profile: dict):
+        """
+        Record profile statistics for an indexed file.
+
+        :param profile: Dict as returned by data_processing.file_profile.profile_csv.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE files SET rows = ?, start_time = ?, end_time = ?, sample_rate_hz = ?, backtracks = ? "
+                "WHERE root = ? AND rel_path = ?",
+                (profile["rows"], profile["start_time"], profile["end_time"], profile["sample_rate_hz"],
+                 profile["backtracks"], self._root_key(data_root), rel_path.replace("\\", "/")))
+
+    def profile_pending(self, data_root: str, progress=None) -> int:
+        """
+        Profile every indexed file under data_root that has no statistics yet.
+
+        Files that fail to profile are logged and stay pending.
+
+        :param progress: Optional callback(done, total) called after each file.
+        :return: Number of files profiled successfully.
+        """
+        # Imported here so the catalog itself does not pull in pandas
+        from data_processing.file_profile import profile_csv
+
+        pending = [entry for entry in self.files(data_root) if not entry.is_profiled]
+        profiled = 0
+        for i, entry in enumerate(pending):
+            try:
+                self.store_profile(data_root, entry.rel_path, profile_csv(os.path.join(data_root, entry.rel_path)))
+                profiled += 1
+            except Exception as e:
+                logging.warning(f"Unable to profile {entry.rel_path}: {e}")
+            if progress is not None:
+                progress(i + 1, len(pending))
+        return profiled
@@ -1,10 +1,9 @@
 import getpass
-import json
 import logging
 import math
 import os
-import tempfile
 import re
+import sqlite3
 import uuid
 from models.directory_entry import DirectoryEntry
 from models.file_entry import FileEntry
@@ -12,6 +11,10 @@ from models.input_settings import InputSettings
 from models.label_display import LabelDisplay
 from models.project_config import ProjectConfig
 from models.user_config import UserConfig
+from services.project_statistics import ProjectStatistics
+from services.project_store import open_project_store
+
+DEFAULT_SAVE_DELAY_MS = 1000  # Quiet period before a deferred project save is written
 
 
 class ProjectService:
@@ -21,27 +24,51 @@ class ProjectService:
         self.current_project_path = project_path
         self.current_project_config = None
         self._active_data_root = None
+        # id -> (FileEntry, parent DirectoryEntry or None for root level files), built for _indexed_config
+        self._file_index = {}
+        self._path_index = {}
+        self._indexed_config = None
+        self._index_fresh = False  # True until the service next edits the index incrementally
+        # Deferred saves: (schedule, cancel) pair such as Tk's after/after_cancel, None = save immediately
+        self._save_scheduler = None
+        self._save_delay_ms = DEFAULT_SAVE_DELAY_MS
+        self._pending_save = None
+        self._dirty = False
+        self._dirty_listeners = []
+        self._change_listeners = []
+        # Files whose records changed since the last save; None = anything may have changed
+        self._changed_file_ids = set()
+        self._store = None  # JsonProjectStore or SqliteProjectStore for current_project_path
+        # Labeling totals, refreshed per changed file (see request_save) for _statistics_config
+        self._statistics = ProjectStatistics()
+        self._statistics_config = None
         if project_path:
             self.load_project(project_path)
 
     def load_project(self, project_path):
         """Load the project configuration from the specified file path."""
+        # Write out pending edits to the project being replaced
+        self.flush()
         try:
             if os.path.exists(project_path):
-                with open(project_path, 'r') as file:
-                    project_data = json.load(file)
-                    self.current_project_config = ProjectConfig.from_dict(project_data)
-                    self.current_project_path = project_path
-                    logging.info(f"Loaded project from {project_path}")
+                store = open_project_store(project_path)
+                # Labels are parsed per file on first access, keeping large projects quick to open
+                self.current_project_config = store.load(lazy_labels=True)
+                self.current_project_path = project_path
+                self._store = store
+                self._changed_file_ids = set()
+                self._rebuild_file_index()
+                logging.info(f"Loaded project from {project_path}")
             else:
                 logging.error(f"Project file '{project_path}' does not exist.")
-        except json.JSONDecodeError as e:
+        except (ValueError, KeyError, sqlite3.DatabaseError) as e:
             logging.error(f"Error loading project configuration from {project_path}: {e}")
             self.current_project_config = None
 
         # Validate and resolve the user-specific data root directory
         if self.current_project_config:
             self.resolve_data_root_directory()
+        self._notify_change(None)
 
     def resolve_data_root_directory(self):
         """Resolve the correct data root directory based on the current user."""
@@ -79,36 +106,129 @@ class ProjectService:
         self.resolve_data_root_directory()
         self.save_project()
 
+    def set_save_scheduler(self, schedule, cancel, delay_ms=DEFAULT_SAVE_DELAY_MS):
+        """
+        Defer request_save() writes until edits have been quiet for delay_ms.
+
+        :param schedule: schedule(delay_ms, callback) -> handle, e.g. a Tk widget's after.
+        :param cancel: cancel(handle), e.g. after_cancel.
+        :param delay_ms: Quiet period before the write; 0 saves immediately.
+        """
+        self._save_scheduler = (schedule, cancel)
+        self.set_save_delay(delay_ms)
+
+    def set_save_delay(self, delay_ms):
+        """Change the quiet period used by request_save (0 = save immediately)."""
+        self._save_delay_ms = max(0, int(delay_ms))
+
+    def add_dirty_listener(self, callback):
+        """Register callback(has_unsaved_changes) to be called when the pending-save state changes."""
+        self._dirty_listeners.append(callback)
+
+    def add_change_listener(self, callback):
+        """
+        Register callback(file_id) to be called after every project edit (see request_save) and
+        after a project is loaded; file_id is None when anything may have changed.
+        """
+        self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback):
+        """Unregister a callback added with add_change_listener."""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _notify_change(self, file_id):
+        for callback in list(self._change_listeners):
+            callback(file_id)
+
+    def has_unsaved_changes(self):
+        """Return True if a deferred save has not been written yet."""
+        return self._dirty
+
+    def _set_dirty(self, dirty):
+        """Update the pending-save state and notify listeners when it changes."""
+        if dirty != self._dirty:
+            self._dirty = dirty
+            for callback in self._dirty_listeners:
+                callback(dirty)
+
+    def request_save(self, file_id=None):
+        """
+        Mark the project as changed and save it once edits go quiet.
+
+        Bursts of edits (label drags, comment keystrokes, verification toggles) are coalesced
+        into a single write. Without a scheduler, or with a zero delay, this saves immediately.
+
+        :param file_id: The one file whose labels, comments or verification changed, letting
+            per-file stores write just that record; None when anything else changed.
+        """
+        if file_id is None:
+            self._changed_file_ids = None
+        elif self._changed_file_ids is not None:
+            self._changed_file_ids.add(file_id)
+        self._statistics.invalidate(file_id)
+        self._notify_change(file_id)
+
+        if not self._save_scheduler or self._save_delay_ms <= 0:
+            self._write_project()
+            return
+
+        schedule, cancel = self._save_scheduler
+        self._set_dirty(True)
+        if self._pending_save is not None:
+            cancel(self._pending_save)
+        self._pending_save = schedule(self._save_delay_ms, self._on_save_timer)
+
+    def _on_save_timer(self):
+        """Write the deferred save once the quiet period has elapsed."""
+        self._pending_save = None
+        self._write_project()
+
+    def flush(self):
+        """
+        Write any deferred save now (call before exit or switching projects).
+
+        :return: False if there were unsaved changes and the write failed.
+        """
+        if not self._dirty:
+            return True
+        return self._write_project()
+
     def save_project(self):
         """Save the current project configuration to the specified file path.
 
-        Uses atomic write (temp file + rename) to prevent corruption if the
-        process crashes mid-write.
+        JSON projects are rewritten atomically (temp file + rename) and SQLite projects in one
+        transaction, so a crash mid-write cannot corrupt them. Cancels any deferred save it supersedes.
+
+        :return: True if the project was written.
         """
+        self._changed_file_ids = None
+        return self._write_project()
+
+    def _write_project(self):
+        """Write the project through its store, passing along which file records changed."""
+        if self._pending_save is not None:
+            self._save_scheduler[1](self._pending_save)
+            self._pending_save = None
+
         if not self.current_project_path:
             logging.error("Unable to save project config, no current_project_path set")
-            return
+            return False
 
         if self.current_project_config:
             try:
-                dir_name = os.path.dirname(os.path.abspath(self.current_project_path))
-                fd, temp_path = tempfile.mkstemp(suffix='.json', dir=dir_name, text=True)
-                try:
-                    with os.fdopen(fd, 'w') as f:
-                        json.dump(self.current_project_config.to_dict(), f, indent=4)
-                    os.replace(temp_path, self.current_project_path)
-                    logging.info(f"Saved project configuration to {self.current_project_path}")
-                except BaseException:
-                    # Clean up temp file on any failure
-                    try:
-                        os.unlink(temp_path)
-                    except OSError:
-                        pass
-                    raise
+                if self._store is None or self._store.path != self.current_project_path:
+                    self._store = open_project_store(self.current_project_path)
+                self._store.save(self.current_project_config, self._changed_file_ids)
+                logging.info(f"Saved project configuration to {self.current_project_path}")
+                self._changed_file_ids = set()
+                self._set_dirty(False)
+                return True
             except Exception as e:
                 logging.error(f"Failed to save project configuration: {e}")
         else:
             logging.error("No active project configuration to save.")
+        return False
 
     def get_output_settings(self):
         """Return the current output settings from the project configuration."""
@@ -121,7 +241,7 @@ class ProjectService:
         """Update and save the output settings."""
         if self.current_project_config:
             self.current_project_config.output_settings = new_output_settings
-            self.save_project()
+            self.request_save()
         else:
             logging.warning("No active project configuration loaded.")
 
@@ -138,12 +258,30 @@ class ProjectService:
             file_entry = self.find_file_by_id(id)
             if file_entry:
                 file_entry.set_labels(labels)
-                self.save_project()
+                self.request_save(file_id=id)
             else:
                 logging.error(f"File with ID {id} not found.")
         else:
             logging.warning(f"No active project configuration loaded.")
 
+    def get_statistics(self):
+        """
+        Return the project's ProjectStatistics, brought up to date.
+
+        Only files passed to request_save since the last call are rescanned; any other change
+        (request_save() without a file, a different project) rescans every file once.
+        :return: ProjectStatistics, or None if no project is loaded.
+        """
+        if not self.current_project_config:
+            return None
+        if self._statistics_config is not self.current_project_config:
+            self._statistics_config = self.current_project_config
+            self._statistics.invalidate()
+        if self._statistics.needs_rebuild:
+            self._rebuild_file_index()  # Count the tree as it is now, including edits made outside the service
+        self._statistics.refresh({file_id: record[0] for file_id, record in self._get_file_index().items()})
+        return self._statistics
+
     def get_file_path(self, file_entry):
         """Get the full file path for the given file entry."""
         if self.current_project_config:
@@ -220,7 +358,7 @@ class ProjectService:
             logging.info(f"Added new directory '{new_dir_name}' under '{parent_full_path}'.")
 
             # Save the project configuration to persist changes
-            self.save_project()
+            self.request_save()
         else:
             raise ValueError(f"Parent directory '{parent_full_path}' not found.")
 
@@ -240,12 +378,14 @@ class ProjectService:
         if parent_dir is not None:
             if is_root:
                 self.current_project_config.entries.append(file_entry)
+                self._index_file(file_entry, None)
             else:
                 parent_dir.entries.append(file_entry)
+                self._index_file(file_entry, parent_dir)
             logging.info(f"Added new file '{file_entry.path}' under '{parent_full_path}' with ID '{unique_id}'.")
 
             # Save the project configuration to persist changes
-            self.save_project()
+            self.request_save(file_id=unique_id)
         else:
             raise ValueError(f"Parent directory '{parent_full_path}' not found.")
 
@@ -269,6 +409,9 @@ class ProjectService:
         if os.path.exists(location):
             raise FileExistsError(f"The file {location} already exists.")
 
+        # Write out pending edits to the project being replaced
+        self.flush()
+
         username = getpass.getuser()
 
         default_label_display = [
@@ -315,6 +458,7 @@ class ProjectService:
         if entries:
             self.current_project_config = project_config
             self.current_project_path = location
+            self._rebuild_file_index()
             self._assign_ids_recursive(project_config.entries)
 
         # Save the project configuration as a JSON file
@@ -326,21 +470,21 @@ class ProjectService:
         Internal method to save the project configuration to the specified location.
         """
         try:
-            with open(location, 'w') as json_file:
-                json.dump(project_config.to_dict(), json_file, indent=4)
+            open_project_store(location).save(project_config)
             logging.info(f"Project created and saved to {location}")
         except Exception as e:
             logging.error(f"Failed to save project config to {location}: {e}")
             raise
 
-    def _assign_ids_recursive(self, entries):
+    def _assign_ids_recursive(self, entries, parent=None):
         """Recursively assign unique IDs to all FileEntry objects that lack one."""
         for entry in entries:
             if isinstance(entry, FileEntry):
                 if not entry.id:
                     entry.id = self._generate_unique_id()
+                    self._index_file(entry, parent)
             elif isinstance(entry, DirectoryEntry):
-                self._assign_ids_recursive(entry.entries)
+                self._assign_ids_recursive(entry.entries, entry)
 
     def _generate_unique_id(self):
         """Generate a unique file ID that does not already exist in the project configuration."""
@@ -357,7 +501,7 @@ class ProjectService:
         if not self.current_project_config:
             return False
 
-        return self.find_file_by_id(id) is not None
+        return id in self._get_file_index()
 
     def find_file_by_id(self, id):
         """Retrieve a file entry by file ID from the current project configuration."""
@@ -365,18 +509,67 @@ class ProjectService:
             logging.warning("No active project configuration loaded.")
             return None
 
-        return self._search_file_by_id(self.current_project_config.entries, id)
+        record = self._lookup_file(id)
+        return record[0] if record else None
+
+    def find_file_by_path(self, path):
+        """Retrieve a file entry by its path relative to the data root."""
+        if not self.current_project_config:
+            logging.warning("No active project configuration loaded.")
+            return None
 
-    def _search_file_by_id(self, entries, id):
-        """Recursively searches the directory structure to find a file by its id."""
+        self._get_file_index()
+        return self._path_index.get(path)
+
+    def _get_file_index(self):
+        """Return the id -> (FileEntry, parent) index, rebuilding it if the project config was replaced."""
+        if self._indexed_config is not self.current_project_config:
+            self._rebuild_file_index()
+        return self._file_index
+
+    def _lookup_file(self, id):
+        """
+        Return the (FileEntry, parent) index record for a file ID, or None.
+
+        A stale record, or a miss since the last incremental edit, rebuilds the index so
+        entries edited outside the service are still found; repeated misses stay O(1).
+        """
+        record = self._get_file_index().get(id)
+        if (record is None and not self._index_fresh) or (record is not None and record[0].id != id):
+            self._rebuild_file_index()
+            record = self._file_index.get(id)
+        return record
+
+    def _rebuild_file_index(self):
+        """Walk the entry tree once and index every FileEntry by ID and path."""
+        self._file_index = {}
+        self._path_index = {}
+        self._indexed_config = self.current_project_config
+        if self.current_project_config:
+            self._index_entries(self.current_project_config.entries, None)
+        self._index_fresh = True
+
+    def _index_entries(self, entries, parent):
+        """Recursively index the files in entries, whose containing directory is parent."""
         for entry in entries:
-            if isinstance(entry, FileEntry) and entry.id == id:
-                return entry
+            if isinstance(entry, FileEntry):
+                self._index_file(entry, parent)
             elif isinstance(entry, DirectoryEntry):
-                found = self._search_file_by_id(entry.entries, id)
-                if found:
-                    return found
-        return None
+                self._index_entries(entry.entries, entry)
+
+    def _index_file(self, file_entry, parent):
+        """Record file_entry (under parent, None for root level) in the indexes."""
+        self._index_fresh = False
+        if file_entry.id:
+            self._file_index[file_entry.id] = (file_entry, parent)
+        self._path_index.setdefault(file_entry.path, file_entry)
+
+    def _unindex_file(self, file_entry):
+        """Drop file_entry from the indexes."""
+        self._index_fresh = False
+        self._file_index.pop(file_entry.id, None)
+        if self._path_index.get(file_entry.path) is file_entry:
+            del self._path_index[file_entry.path]
 
     def get_project_name(self):
         """Return current project name (alert if not found/empty)"""
@@ -454,40 +647,46 @@ class ProjectService:
         return math.ceil(1000 / freq)
 
     def move_file(self, file_id, target_dir_path):
-        """Move a file entry to a different directory within the project."""
+        """
+        Move a file entry to a different directory within the project.
+
+        :return: True if the file was moved; False (and the project is unchanged) if the file or target was not found.
+        """
         if not self.current_project_config:
             logging.warning("No active project configuration loaded.")
-            return
+            return False
 
-        file_entry = self.find_file_by_id(file_id)
-        if not file_entry:
+        record = self._lookup_file(file_id)
+        if not record:
             logging.error(f"File with ID '{file_id}' not found.")
-            return
+            return False
+        file_entry, parent = record
+
+        # Resolve the target before detaching the file so a bad path does not drop it
+        target, is_root = self.find_directory_by_path(target_dir_path)
+        if target is None:
+            logging.error(f"Target directory '{target_dir_path}' not found.")
+            return False
 
         # Remove from current location
-        parent = self.find_parent_directory_of_file(file_id, self.current_project_config.entries)
-        if parent:
-            parent.entries.remove(file_entry)
-        else:
-            # File is at root level
-            try:
-                self.current_project_config.entries.remove(file_entry)
-            except ValueError:
-                logging.error(f"File '{file_id}' not found at root level.")
-                return
+        siblings = parent.entries if parent else self.current_project_config.entries
+        try:
+            siblings.remove(file_entry)
+        except ValueError:
+            logging.error(f"File '{file_id}' not found in its parent directory.")
+            return False
 
         # Add to target location
-        target, is_root = self.find_directory_by_path(target_dir_path)
         if is_root:
             self.current_project_config.entries.append(file_entry)
-        elif target is not None:
-            target.entries.append(file_entry)
+            self._index_file(file_entry, None)
         else:
-            logging.error(f"Target directory '{target_dir_path}' not found.")
-            return
+            target.entries.append(file_entry)
+            self._index_file(file_entry, target)
 
-        self.save_project()
+        self.request_save(file_id=file_id)
         logging.info(f"Moved file '{file_id}' to '{target_dir_path}'.")
+        return True
 
     def delete_file_by_id(self, id):
         """Delete a file entry from the project configuration by file ID."""
@@ -495,25 +694,35 @@ class ProjectService:
             logging.warning("No active project configuration loaded.")
             return
 
-        # Find the file entry by its ID
-        file_entry = self.find_file_by_id(id)
-
-        if file_entry:
-            # Find the parent directory of the file entry
-            parent_entry = self.find_parent_directory_of_file(id, self.current_project_config.entries)
+        # Find the file entry and its parent directory by ID
+        record = self._lookup_file(id)
 
-            if parent_entry and isinstance(parent_entry, DirectoryEntry):
-                # Remove the file entry from the parent directory
-                parent_entry.entries.remove(file_entry)
-                self.save_project()  # Persist the changes
-                logging.info(f"Deleted file with ID '{id}' from project configuration.")
-            else:
-                logging.warning(f"Parent directory for file with ID '{id}' not found.")
+        if record:
+            file_entry, parent_entry = record
+            siblings = parent_entry.entries if parent_entry else self.current_project_config.entries
+            try:
+                siblings.remove(file_entry)
+            except ValueError:
+                logging.warning(f"File with ID '{id}' not found in its parent directory.")
+                return
+            self._unindex_file(file_entry)
+            self.request_save(file_id=id)  # Persist the changes
+            logging.info(f"Deleted file with ID '{id}' from project configuration.")
         else:
             logging.warning(f"File with ID '{id}' not found.")
 
-    def find_parent_directory_of_file(self, id, entries):
-        """Recursively find the parent directory of a file entry by file ID."""
+    def find_parent_directory_of_file(self, id, entries=None):
+        """
+        Find the parent directory of a file entry by file ID.
+
+        :param id: File ID.
+        :param entries: Subtree to search; defaults to the project entries, which are served from the index.
+        :return: The parent DirectoryEntry, or None for root level or unknown files.
+        """
+        if entries is None or (self.current_project_config and entries is self.current_project_config.entries):
+            record = self._lookup_file(id)
+            return record[1] if record else None
+
         for entry in entries:
             if isinstance(entry, FileEntry) and entry.id == id:
                 return None  # If this is the file entry, return None (it has no parent)
@@ -533,7 +742,7 @@ class ProjectService:
             file_entry = self.find_file_by_id(id)
             if file_entry:
                 file_entry.set_comment(username, comment)
-                self.save_project()
+                self.request_save(file_id=id)
             else:
                 logging.error(f"File with ID {id} not found.")
         else:
@@ -0,0 +1,138 @@
+import math
+from collections import Counter
+
+import numpy as np
+
+from models.file_entry import FileEntry
+
+
+class ProjectStatistics:
+    """
+    Project-wide labeling totals kept up to date file by file.
+
+    Each file contributes its label count, per-behavior label counts and durations, and the
+    reviewers who verified it. Totals are the sum of those contributions, so after an edit only the
+    changed file's contribution is subtracted and re-added. Everything that depends on project
+    settings (which behaviors are shown, reviewers, verification threshold) is applied when the
+    totals are read, so changing a setting never requires a rescan.
+    """
+
+    def __init__(self):
+        self._stale_ids = set()
+        self._all_stale = True
+        self._reset()
+
+    def _reset(self):
+        """Drop every contribution."""
+        self._contributions = {}  # file id -> (label_count, {behavior: (labels, duration_us)}, verified_by)
+        self.total_files = 0
+        self.files_with_labels = 0
+        self.total_labels = 0
+        self._behavior_labels = Counter()
+        self._behavior_files = Counter()
+        self._behavior_duration_us = Counter()
+        self._reviewer_counts = Counter()
+        self._verified_histogram = Counter()  # number of reviewers who verified -> files
+
+    def invalidate(self, file_id=None):
+        """
+        Mark a file's contribution as out of date; it is recomputed on the next refresh.
+
+        :param file_id: The changed (added, edited, moved or deleted) file, or None to recompute everything.
+        """
+        if file_id is None:
+            self._all_stale = True
+            self._stale_ids.clear()
+        elif not self._all_stale:
+            self._stale_ids.add(file_id)
+
+    @property
+    def needs_rebuild(self):
+        """True if the next refresh rescans every file."""
+        return self._all_stale
+
+    def refresh(self, file_index):
+        """
+        Bring the totals up to date.
+
+        :param file_index: {id: FileEntry} of every file in the project; stale IDs missing from it are dropped.
+        """
+        if self._all_stale:
+            self._rebuild(file_index)
+            return
+        stale_ids, self._stale_ids = self._stale_ids, set()
+        file_entries = [file_index[file_id] for file_id in stale_ids if file_id in file_index]
+        for file_id in stale_ids:
+            self._remove(file_id)
+        for file_entry, behaviors in zip(file_entries, self._behavior_contributions(file_entries)):
+            self._add(file_entry, behaviors)
+
+    def _rebuild(self, file_index):
+        self._reset()
+        self._stale_ids.clear()
+        self._all_stale = False
+        file_entries = list(file_index.values())
+        for file_entry, behaviors in zip(file_entries, self._behavior_contributions(file_entries)):
+            self._add(file_entry, behaviors)
+
+    @staticmethod
+    def _behavior_contributions(file_entries):
+        """
+        {behavior: (labels, duration_us)} for each of file_entries, grouped on the concatenated
+        label arrays of all of them so a full rebuild never builds Label objects.
+        """
+        contributions = [{} for _ in file_entries]
+        starts, ends, behaviors, file_index = FileEntry.concat_label_arrays(file_entries)
+        if not len(starts):
+            return contributions
+
+        names, codes = np.unique(behaviors.astype(str), return_inverse=True)
+        keys = file_index * len(names) + codes.reshape(-1)
+        groups, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        durations = np.bincount(inverse.reshape(-1), weights=ends - starts)
+        for key, count, duration in zip(groups.tolist(), counts.tolist(), durations.tolist()):
+            index, code = divmod(key, len(names))
+            contributions[index][str(names[code])] = (count, int(duration))
+        return contributions
+
+    def _add(self, file_entry, behaviors):
+        verified_by = tuple(file_entry.verified_by)
+        label_count = file_entry.label_count
+        self._contributions[file_entry.id] = (label_count, behaviors, verified_by)
+        self._apply(label_count, behaviors, verified_by, 1)
+
+    def _remove(self, file_id):
+        contribution = self._contributions.pop(file_id, None)
+        if contribution is not None:
+            self._apply(*contribution, -1)
+
+    def _apply(self, label_count, behaviors, verified_by, sign):
+        """Add (sign=1) or subtract (sign=-1) one file's contribution."""
+        self.total_files += sign
+        self.files_with_labels += sign if label_count else 0
+        self.total_labels += sign * label_count
+        for behavior, (labels, duration_us) in behaviors.items():
+            self._behavior_labels[behavior] += sign * labels
+            self._behavior_files[behavior] += sign
+            self._behavior_duration_us[behavior] += sign * duration_us
+        for username in set(verified_by):
+            self._reviewer_counts[username] += sign
+        self._verified_histogram[len(verified_by)] += sign
+
+    def behavior_stats(self, behavior_names):
+        """{name: {"labels": int, "files": int, "duration_sec": float}} for each behavior name."""
+        return {name: {"labels": self._behavior_labels[name], "files": self._behavior_files[name],
+                       "duration_sec": self._behavior_duration_us[name] / 1e6}
+                for name in behavior_names}
+
+    def verified_count(self, username):
+        """Number of files username has verified."""
+        return self._reviewer_counts[username]
+
+    def files_fully_verified(self, num_reviewers, threshold):
+        """
+        Number of files verified by enough reviewers to show green
+        (see ProjectService.get_verification_color).
+        """
+        required = max(1, math.ceil(threshold * num_reviewers)) if num_reviewers else 1
+        return sum(files for num_verified, files in self._verified_histogram.items() if num_verified >= required)
@@ -0,0 +1,232 @@
+import json
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from typing import Iterable, Optional
+
+from models.directory_entry import DirectoryEntry
+from models.file_entry import FileEntry
+from models.project_config import ProjectConfig
+
+# Projects saved with this extension use SqliteProjectStore; anything else is the single-file JSON format
+SQLITE_PROJECT_EXTENSION = ".sqlite"
+
+# Bump whenever the SQLite project schema changes (stored as PRAGMA user_version)
+PROJECT_DB_FORMAT_VERSION = 1
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS project (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+"""
+
+
+class JsonProjectStore:
+    """The original project format: the whole ProjectConfig in one indented JSON file."""
+
+    def __init__(self, path):
+        """
+        :param path: Project JSON file.
+        """
+        self.path = path
+
+    def load(self, lazy_labels=False) -> ProjectConfig:
+        """
+        :param lazy_labels: Defer parsing each file's labels until they are first accessed.
+        """
+        with open(self.path, 'r') as file:
+            return ProjectConfig.from_dict(json.load(file), lazy_labels)
+
+    def save(self, project_config: ProjectConfig, changed_file_ids: Optional[Iterable[str]] = None):
+        """
+        Rewrite the whole file atomically (temp file + rename) so a crash mid-write cannot corrupt it.
+
+        :param project_config: Project to write.
+        :param changed_file_ids: Ignored; every save rewrites the full tree.
+        """
+        dir_name = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(suffix='.json', dir=dir_name, text=True)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(project_config.to_dict(), f, indent=4)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            # Clean up temp file on any failure
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+class SqliteProjectStore:
+    """
+    Project stored in SQLite with one row per FileEntry.
+
+    The `project` table holds the project settings and the directory tree as JSON, where each
+    file is a reference to its row in `files`. A save compares each part with what this store last
+    read or wrote and only writes what differs, inside one transaction, so changing one file's
+    labels rewrites that file's row and nothing else. `changed_file_ids` narrows which file rows
+    are even serialized; the tree and settings are always compared.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: SQLite project file (created on first save).
+        """
+        self.path = path
+        self._settings = None  # Serialized settings / tree / {id: record} as last read or written
+        self._tree = None
+        self._records = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > PROJECT_DB_FORMAT_VERSION:
+            conn.close()
+            raise ValueError(f"{self.path} uses project format {version}, newer than this version of AccelScope supports.")
+        if version < PROJECT_DB_FORMAT_VERSION:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {PROJECT_DB_FORMAT_VERSION}")
+        return conn
+
+    def load(self, lazy_labels=False) -> ProjectConfig:
+        """
+        :param lazy_labels: Defer parsing each file's labels until they are first accessed.
+        """
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(self.path)
+        with closing(self._connect()) as conn:
+            values = dict(conn.execute("SELECT key, value FROM project"))
+            records = dict(conn.execute("SELECT id, record FROM files"))
+        if "settings" not in values:
+            raise ValueError(f"{self.path} is not an AccelScope project.")
+
+        data = json.loads(values["settings"])
+        data["entries"] = self._expand_tree(json.loads(values.get("tree", "[]")), records)
+        project_config = ProjectConfig.from_dict(data, lazy_labels)
+
+        self._settings = values["settings"]
+        self._tree = values.get("tree")
+        self._records = records
+        return project_config
+
+    @classmethod
+    def _expand_tree(cls, nodes, records):
+        """Rebuild the entry dicts of ProjectConfig.to_dict from the stored tree and file rows."""
+        entries = []
+        for node in nodes:
+            if "file" in node:
+                entries.append(json.loads(records[node["file"]]))
+            elif "entries" in node:
+                entries.append({"name": node["name"], "entries": cls._expand_tree(node["entries"], records)})
+            else:
+                entries.append(node)  # Inline file without an ID
+        return entries
+
+    def save(self, project_config: ProjectConfig, changed_file_ids: Optional[Iterable[str]] = None):
+        """
+        Write the parts of the project that differ from the stored copy.
+
+        :param project_config: Project to write.
+        :param changed_file_ids: IDs of the files whose labels, comments or verification may have
+            changed since the last save, or None to compare every file.
+        """
+        if self._records is None:
+            changed_file_ids = None  # Nothing to diff against yet
+        elif changed_file_ids is not None:
+            changed_file_ids = set(changed_file_ids)
+
+        records = {}
+        dirty_records = {}
+        tree = self._build_tree(project_config.entries, changed_file_ids, records, dirty_records)
+        tree_json = json.dumps(tree)
+        settings_json = json.dumps(project_config.to_dict(include_entries=False))
+
+        with closing(self._connect()) as conn, conn:
+            if self._records is None:
+                stored_ids = {row[0] for row in conn.execute("SELECT id FROM files")}
+            else:
+                stored_ids = set(self._records)
+            removed = stored_ids - set(records)
+            if removed:
+                conn.executemany("DELETE FROM files WHERE id = ?", [(file_id,) for file_id in removed])
+            if dirty_records:
+                conn.executemany("INSERT OR REPLACE INTO files (id, path, record) VALUES (?, ?, ?)",
+                                 [(file_id, path, record) for file_id, (path, record) in dirty_records.items()])
+            if tree_json != self._tree:
+                conn.execute("INSERT OR REPLACE INTO project (key, value) VALUES ('tree', ?)", (tree_json,))
+            if settings_json != self._settings:
+                conn.execute("INSERT OR REPLACE INTO project (key, value) VALUES ('settings', ?)", (settings_json,))
+
+        self._records = {file_id: record for file_id, record in records.items()}
+        self._tree = tree_json
+        self._settings = settings_json
+
+    def _build_tree(self, entries, changed_file_ids, records, dirty_records):
+        """
+        Build the stored tree for entries, collecting file rows as it goes.
+
+        :param changed_file_ids: Files to serialize and compare (None = all); others keep their stored record.
+        :param records: Filled with {id: record} for every file in the tree.
+        :param dirty_records: Filled with {id: (path, record)} for rows that need writing.
+        """
+        nodes = []
+        for entry in entries:
+            if isinstance(entry, DirectoryEntry):
+                nodes.append({"name": entry.name,
+                              "entries": self._build_tree(entry.entries, changed_file_ids, records, dirty_records)})
+            elif isinstance(entry, FileEntry):
+                if not entry.id or entry.id in records:
+                    nodes.append(entry.to_dict())  # No usable row key, keep it inline
+                    continue
+                previous = self._records.get(entry.id) if self._records is not None else None
+                if previous is not None and changed_file_ids is not None and entry.id not in changed_file_ids:
+                    records[entry.id] = previous
+                else:
+                    record = json.dumps(entry.to_dict())
+                    records[entry.id] = record
+                    if record != previous:
+                        dirty_records[entry.id] = (entry.path, record)
+                nodes.append({"file": entry.id})
+        return nodes
+
+
+def is_sqlite_project(path) -> bool:
+    """Return True if path is (or, for a new file, will be) a SQLite project."""
+    if os.path.isfile(path):
+        with open(path, 'rb') as f:
+            return f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+    return os.path.splitext(path)[1].lower() == SQLITE_PROJECT_EXTENSION
+
+
+def open_project_store(path):
+    """Return the store matching the project file's format."""
+    if is_sqlite_project(path):
+        return SqliteProjectStore(path)
+    return JsonProjectStore(path)
+
+
+def convert_project(source_path, dest_path):
+    """
+    Copy a project into another storage format, e.g. migrate a JSON project to SQLite or
+    export a SQLite project back to a single JSON file. The format follows each path.
+
+    :return: The converted ProjectConfig.
+    """
+    if os.path.abspath(source_path) == os.path.abspath(dest_path):
+        raise ValueError("Source and destination project files must differ.")
+    project_config = open_project_store(source_path).load()
+    if os.path.exists(dest_path):
+        os.remove(dest_path)
+    open_project_store(dest_path).save(project_config)
+    return project_config
@@ -1,8 +1,8 @@
 import json
 import logging
 import os
-from models.project_config import ProjectConfig
 from models.user_app_config import UserAppConfig
+from services.project_store import open_project_store
 
 
 class UserAppConfigService:
@@ -53,7 +53,7 @@ class UserAppConfigService:
 
         if self.config.last_opened_project and os.path.exists(self.config.last_opened_project):
             try:
-                self.current_project_config = ProjectConfig.from_file(self.config.last_opened_project)
+                self.current_project_config = open_project_store(self.config.last_opened_project).load()
                 return self.current_project_config
             except Exception as e:
                 logging.error(f"Failed to load project config from {self.config.last_opened_project}: {e}")
@@ -74,12 +74,17 @@ class UserAppConfigService:
         self.current_project_config = None
         self.get_project_config()
 
-    def update_preferences(self, comment_save_delay=None, info_pane_max_width=None):
+    def update_preferences(self, comment_save_delay=None, info_pane_max_width=None, data_cache_max_mb=None,
+                           project_save_delay=None):
         """Update user-facing preference settings."""
         if comment_save_delay is not None:
             self.config.comment_save_delay = comment_save_delay
         if info_pane_max_width is not None:
             self.config.info_pane_max_width = info_pane_max_width
+        if data_cache_max_mb is not None:
+            self.config.data_cache_max_mb = data_cache_max_mb
+        if project_save_delay is not None:
+            self.config.project_save_delay = project_save_delay
         self.save_to_file()
 
     def set_last_opened_file(self, last_opened_file):
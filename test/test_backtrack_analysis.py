@@ -0,0 +1,162 @@
+"""
+Tests for the resumable archive scan in backtrack_analysis.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_processing import backtrack_analysis
+from data_processing.backtrack_analysis import (RESULTS_FILE, analyze_backtracks, find_files, load_results,
+                                                process_csv, profile_csv)
+from test_bebe_output import create_synthetic_csv
+
+
+class TestArchiveScan(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.temp_dir, "archive")
+        self.output_dir = os.path.join(self.temp_dir, "out")
+        self.files = [
+            os.path.join(self.root, "MotionData_101", "2018", "06_June", "08.csv"),
+            os.path.join(self.root, "MotionData_101", "2018", "06_June", "09.csv"),
+            os.path.join(self.root, "MotionData_202", "2019", "01_January", "15.csv"),
+        ]
+        for file_path in self.files:
+            create_synthetic_csv(file_path, num_rows=64)
+        # Does not match the default layout
+        create_synthetic_csv(os.path.join(self.root, "Other", "notes.csv"), num_rows=16)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def scan(self, **kwargs):
+        return analyze_backtracks(self.root, workers=1, output_dir=self.output_dir, plots=False, **kwargs)
+
+    def test_find_files_uses_pattern(self):
+        self.assertEqual(sorted(find_files(self.root)), sorted(self.files))
+        self.assertEqual(len(find_files(self.root, r".*notes\.csv$")), 1)
+
+    def test_records_written(self):
+        results = self.scan()
+        self.assertEqual(list(results), find_files(self.root))
+        record = results[self.files[0]]
+        self.assertEqual(record['backtracks'], 0)
+        self.assertEqual(record['start_time'], "05:50:00")
+        self.assertEqual(record['rows'], 64)
+        self.assertEqual(load_results(os.path.join(self.output_dir, RESULTS_FILE)), results)
+        for report in ("backtrack_report.txt", "error_report.txt", "incomplete_days.txt"):
+            self.assertTrue(os.path.exists(os.path.join(self.output_dir, report)))
+
+    def test_rerun_skips_unchanged_files(self):
+        self.scan()
+        with patch.object(backtrack_analysis, "analyze_file", wraps=backtrack_analysis.analyze_file) as spy:
+            self.scan()
+            spy.assert_not_called()
+
+            stat = os.stat(self.files[1])
+            os.utime(self.files[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.scan()
+            self.assertEqual([c.args[0] for c in spy.call_args_list], [self.files[1]])
+
+    def test_results_are_appended(self):
+        self.scan()
+        results_file = os.path.join(self.output_dir, RESULTS_FILE)
+        os.utime(self.files[0])
+        self.scan()
+        with open(results_file) as f:
+            self.assertEqual(len(f.readlines()), len(self.files) + 1)
+
+    def test_truncated_last_record_is_ignored(self):
+        self.scan()
+        results_file = os.path.join(self.output_dir, RESULTS_FILE)
+        with open(results_file, "a") as f:
+            f.write('{"file": "partial.csv", "mtime')
+        self.assertEqual(set(load_results(results_file)), set(self.files))
+
+    def test_error_files_recorded(self):
+        bad = os.path.join(self.root, "MotionData_303", "2018", "06_June", "10.csv")
+        os.makedirs(os.path.dirname(bad))
+        with open(bad, "w") as f:
+            f.write("header\nno,timestamps,here\n1,2,3\n")
+        results = self.scan()
+        self.assertTrue(results[bad]['error'])
+        with open(os.path.join(self.output_dir, "error_report.txt")) as f:
+            self.assertIn(bad, f.read())
+
+    def test_file_removed_before_analysis_is_recorded_as_error(self):
+        missing = os.path.join(self.root, "MotionData_303", "2018", "06_June", "10.csv")
+        record = backtrack_analysis.analyze_file(missing)
+        self.assertTrue(record['error'])
+        self.assertEqual(record['file'], missing)
+        self.assertIsNone(record['size'])
+
+    def test_pool_matches_serial(self):
+        serial = self.scan()
+        os.remove(os.path.join(self.output_dir, RESULTS_FILE))
+        pooled = analyze_backtracks(self.root, workers=2, output_dir=self.output_dir, plots=False)
+        self.assertEqual(pooled, serial)
+
+
+class TestProfileCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "08.csv")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_rows(self, rows):
+        with open(self.file_path, "w") as f:
+            f.write("DeviceID: 99999,Firmware: 2.9.17\n")
+            f.write("UTC DateTime,Milliseconds,Acc X [g],Acc Y [g],Acc Z [g]\n")
+            for utc, ms in rows:
+                f.write(f"{utc},{ms},0.1,0.2,-0.9\n")
+
+    def assert_matches_process_csv(self, chunk_rows):
+        df, backtracks, start_time, end_time = process_csv(self.file_path)
+        profile = profile_csv(self.file_path, chunk_rows=chunk_rows)
+        self.assertEqual(profile['rows'], len(df))
+        self.assertEqual(profile['backtracks'], len(backtracks))
+        self.assertEqual(profile['start_time'], start_time.isoformat())
+        self.assertEqual(profile['end_time'], end_time.isoformat())
+        self.assertEqual(sum(profile['gap_histogram']), len(df) - 1)
+        return profile
+
+    def test_regular_file(self):
+        create_synthetic_csv(self.file_path, num_rows=320)
+        for chunk_rows in (7, 64, 1000):
+            profile = self.assert_matches_process_csv(chunk_rows)
+            self.assertEqual(profile['backtracks'], 0)
+            self.assertAlmostEqual(profile['sample_rate_hz'], 16.0, places=1)
+            self.assertEqual(profile['gap_histogram'], [0, 0, 319, 0, 0, 0])
+
+    def test_backtracks_and_rollover_across_chunks(self):
+        rows = [("23:59:58", 0), ("23:59:59", 500), ("00:00:00", 0), ("00:00:00", 500),
+                ("00:00:02", 0), ("00:00:01", 0), ("bad", 0), ("00:05:00", 0), ("00:04:00", 0)]
+        self.write_rows(rows)
+        for chunk_rows in (1, 2, 3, 100):
+            profile = self.assert_matches_process_csv(chunk_rows)
+            self.assertEqual(profile['rows'], 8)
+            self.assertEqual(profile['gap_histogram'][0], 3)  # rollover + two backtracks
+
+    def test_first_row_just_after_midnight(self):
+        self.write_rows([("00:05:00", 0), ("00:05:00", 500)])
+        self.assert_matches_process_csv(1)
+
+    def test_no_valid_rows_raises(self):
+        self.write_rows([("bad", 0)])
+        with self.assertRaises(ValueError):
+            profile_csv(self.file_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for vectorized timestamp backtrack detection.
+Verifies backtrack_analysis.detect_backtracks returns the same list as the
+original iterrows scan, and the input-layer helpers used by the viewer.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_processing.backtrack_analysis import detect_backtracks
+from input_types.backtracks import find_backtracks, find_midnight_rollovers
+from input_types.mapped_data import MappedData
+
+
+def legacy_backtracks(df):
+    """Reference implementation: the original row-by-row scan from process_csv."""
+    max_time = pd.Timestamp.min
+    backtracks = []
+    for idx, row in df.iterrows():
+        current_time = row['Timestamp'].time()
+        if current_time < max_time.time() and current_time.hour == 0:
+            backtracks.append((row['Timestamp'], max_time))
+        if row['Timestamp'] < max_time:
+            backtracks.append((row['Timestamp'], max_time))
+        max_time = row['Timestamp']
+    return backtracks
+
+
+def time_only_frame(times):
+    """Timestamps parsed the way process_csv does (time of day on pandas' default date)."""
+    utc, ms = zip(*times)
+    ts = pd.to_datetime(pd.Series(utc), format='%H:%M:%S') + pd.to_timedelta(pd.Series(ms, dtype=float), unit='ms')
+    return pd.DataFrame({'Timestamp': ts})
+
+
+class TestDetectBacktracks(unittest.TestCase):
+
+    def assert_matches_legacy(self, df):
+        self.assertEqual(detect_backtracks(df['Timestamp']), legacy_backtracks(df))
+
+    def test_monotonic_has_no_backtracks(self):
+        df = time_only_frame([('08:00:00', 0), ('08:00:00', 62), ('08:00:01', 0)])
+        self.assertEqual(detect_backtracks(df['Timestamp']), [])
+        self.assert_matches_legacy(df)
+
+    def test_simple_backtrack(self):
+        df = time_only_frame([('08:00:01', 0), ('08:00:00', 500), ('08:00:02', 0)])
+        result = detect_backtracks(df['Timestamp'])
+        self.assertEqual(len(result), 1)
+        self.assert_matches_legacy(df)
+
+    def test_midnight_rollover_recorded_twice(self):
+        df = time_only_frame([('23:59:59', 937), ('00:00:00', 0), ('00:00:00', 62)])
+        result = detect_backtracks(df['Timestamp'])
+        self.assertEqual(len(result), 2)
+        self.assert_matches_legacy(df)
+
+    def test_first_row_just_after_midnight(self):
+        """The first row is compared against pd.Timestamp.min, whose time of day is 00:12:43."""
+        df = time_only_frame([('00:05:00', 0), ('00:05:00', 62), ('00:04:00', 0)])
+        self.assert_matches_legacy(df)
+
+    def test_random_matches_legacy(self):
+        rng = np.random.default_rng(0)
+        seconds = np.sort(rng.integers(0, 86400, 2000))
+        seconds[rng.integers(0, 2000, 30)] = rng.integers(0, 3600, 30)  # scattered jumps into hour 0 / backwards
+        times = [(f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}", int(rng.integers(0, 1000))) for s in seconds]
+        self.assert_matches_legacy(time_only_frame(times))
+
+    def test_empty(self):
+        df = pd.DataFrame({'Timestamp': pd.Series([], dtype='datetime64[ns]')})
+        self.assertEqual(detect_backtracks(df['Timestamp']), [])
+
+
+class TestInputBacktrackHelpers(unittest.TestCase):
+
+    def test_find_backtracks(self):
+        ts = np.array([0, 10, 5, 20, 20, 19], dtype=np.int64)
+        np.testing.assert_array_equal(find_backtracks(ts), [2, 5])
+
+    def test_short_arrays(self):
+        self.assertEqual(len(find_backtracks(np.array([], dtype=np.int64))), 0)
+        self.assertEqual(len(find_midnight_rollovers(np.array([5], dtype=np.int64))), 0)
+
+    def test_find_midnight_rollovers(self):
+        day = 86_400_000
+        base = 1_528_416_000_000  # 2018-06-08 00:00 UTC
+        ts = np.array([base + day - 100, base + 50,            # wraps into hour 0
+                       base + 2 * 3_600_000, base + 3_600_000],  # backtrack, but into hour 1
+                      dtype=np.int64)
+        np.testing.assert_array_equal(find_midnight_rollovers(ts), [1])
+        np.testing.assert_array_equal(find_backtracks(ts), [1, 3])
+
+    def test_mapped_data_methods(self):
+        ts = np.array([3, 1, 2], dtype=np.int64) + 1_528_434_000_000  # 05:00 UTC
+        data = MappedData(ts, {"x": np.zeros(3, dtype=np.float32)})
+        np.testing.assert_array_equal(data.find_backtracks(), [1])
+        self.assertEqual(len(data.find_midnight_rollovers()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
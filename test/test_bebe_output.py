@@ -10,15 +10,19 @@ Creates synthetic Vectronic Motion CSV data and verifies:
 - Labeled-with-buffer period filtering
 """
 import csv
+import json
 import math
 import os
 import shutil
 import sys
 import tempfile
 import unittest
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import yaml
 
 # Add src to path
@@ -29,8 +33,9 @@ from models.file_entry import FileEntry
 from models.label import Label
 from models.label_display import LabelDisplay
 from models.input_settings import InputSettings, InputType
-from models.output_settings import OutputSettings, DownsampleMethod, OutputPeriod, OutputType
+from models.output_settings import OutputSettings, DownsampleMethod, OutputPeriod, OutputType, ClipFormat
 from models.project_config import ProjectConfig
+from input_types.vectronic_motion import VectronicMotionInput
 from output_types.bebe_output import BEBEOutput
 
 
@@ -323,6 +328,172 @@ class TestBEBEDownsampling(unittest.TestCase):
         self.assertEqual(count, 200)
 
 
+def legacy_downsample(df, method, ratio):
+    """Reference implementation: the original per-group pandas loop of BEBEOutput._downsample."""
+    acc_cols = ["Acc X [g]", "Acc Y [g]", "Acc Z [g]"]
+    n_groups = len(df) // ratio
+    trimmed = df.iloc[:n_groups * ratio].copy()
+    group_ids = np.arange(len(trimmed)) // ratio
+    result_rows = []
+    for g in range(n_groups):
+        group = trimmed[group_ids == g]
+        if method == DownsampleMethod.MIN:
+            acc_values = group[acc_cols].min()
+        elif method == DownsampleMethod.MAX:
+            acc_values = group[acc_cols].max()
+        else:
+            acc_values = group[acc_cols].mean()
+        label_mode = group["label"].mode()
+        result_rows.append({
+            "Acc X [g]": acc_values["Acc X [g]"],
+            "Acc Y [g]": acc_values["Acc Y [g]"],
+            "Acc Z [g]": acc_values["Acc Z [g]"],
+            "individual_id": group["individual_id"].iloc[0],
+            "label": label_mode.iloc[0] if not label_mode.empty else 0,
+        })
+    return pd.DataFrame(result_rows)
+
+
+class TestBEBEDownsampleRegression(unittest.TestCase):
+    """The vectorized _downsample must match the original per-group implementation."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 16 * 60 + 5  # trailing partial group is dropped
+        self.df = pd.DataFrame({
+            "Timestamp": pd.date_range("2018-06-08 06:00", periods=n, freq="62500us"),
+            "Acc X [g]": rng.normal(0, 0.5, n).round(3),
+            "Acc Y [g]": rng.normal(0, 0.5, n).round(3),
+            "Acc Z [g]": rng.normal(-1, 0.5, n).round(3),
+            # Short runs of labels so groups contain mixtures and ties
+            "label": np.repeat(rng.integers(0, 4, n // 3 + 1), 3)[:n],
+            "individual_id": 7,
+        })
+        self.bebe = BEBEOutput()
+
+    def _assert_matches_legacy(self, df, ratio):
+        for method in (DownsampleMethod.AVERAGE, DownsampleMethod.MIN, DownsampleMethod.MAX):
+            with self.subTest(method=method, ratio=ratio):
+                expected = legacy_downsample(df, method, ratio)
+                actual = self.bebe._downsample(df, method, ratio)
+                pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_matches_legacy_for_all_ratios(self):
+        for ratio in (2, 4, 8, 16):
+            self._assert_matches_legacy(self.df, ratio)
+
+    def test_nan_values_are_skipped_like_pandas(self):
+        df = self.df.copy()
+        df.loc[[0, 5, 6, 7], "Acc X [g]"] = np.nan  # group 1 at ratio 4 is all-NaN in X
+        self._assert_matches_legacy(df, 4)
+
+    def test_label_ties_go_to_smallest_label(self):
+        df = self.df.iloc[:4].copy()
+        df["label"] = [3, 1, 3, 1]
+        self.assertEqual(self.bebe._downsample(df, DownsampleMethod.AVERAGE, 4)["label"].tolist(), [1])
+
+    def test_all_methods_in_one_pass_match_single_method(self):
+        methods = [DownsampleMethod.AVERAGE, DownsampleMethod.NTH_VALUE, DownsampleMethod.MIN, DownsampleMethod.MAX]
+        for ratio in (1, 4):
+            results = self.bebe._downsample_all(self.df, methods, ratio)
+            self.assertEqual(list(results), methods)
+            for method in methods:
+                with self.subTest(method=method, ratio=ratio):
+                    pd.testing.assert_frame_equal(results[method], self.bebe._downsample(self.df, method, ratio))
+                    if ratio > 1 and method != DownsampleMethod.NTH_VALUE:
+                        pd.testing.assert_frame_equal(results[method], legacy_downsample(self.df, method, ratio))
+
+    def test_nth_value_unchanged(self):
+        result = self.bebe._downsample(self.df, DownsampleMethod.NTH_VALUE, 4)
+        pd.testing.assert_frame_equal(result, self.df.iloc[::4].reset_index(drop=True))
+
+
+def legacy_assign_labels(df, labels, behavior_to_label_idx):
+    """Reference implementation: the original per-label mask loop of BEBEOutput._assign_labels."""
+    label_col = np.zeros(len(df), dtype=int)
+    row_timestamps = df["Timestamp"].values
+    for label in labels:
+        idx = behavior_to_label_idx.get(label.behavior, 0)
+        if idx == 0:
+            continue
+        mask = ((row_timestamps >= np.datetime64(label.start_time)) &
+                (row_timestamps <= np.datetime64(label.end_time)))
+        label_col[mask] = idx
+    return label_col
+
+
+def legacy_filter_rows(df, ranges):
+    """Reference implementation: the original per-range mask loop of BEBEOutput._filter_labeled_with_buffer."""
+    mask = pd.Series(False, index=df.index)
+    for start_dt, end_dt in ranges:
+        mask |= (df["Timestamp"] >= pd.Timestamp(start_dt)) & (df["Timestamp"] <= pd.Timestamp(end_dt))
+    return df[mask].reset_index(drop=True)
+
+
+class TestBEBELabelAssignmentRegression(unittest.TestCase):
+    """The searchsorted label assignment and buffer filter must match the original mask loops."""
+
+    def setUp(self):
+        n = 16 * 60 * 20
+        timestamps = pd.date_range("2018-06-08 06:00", periods=n, freq="62500us")
+        # A clock backtrack: the second half repeats the last five minutes of the first half
+        timestamps = timestamps[:n // 2].append(timestamps[n // 2 - 16 * 60 * 5:n - 16 * 60 * 5])
+        self.df = pd.DataFrame({"Timestamp": timestamps, "Acc X [g]": np.arange(n, dtype=float)})
+        self.behavior_to_label_idx = {"Walk": 1, "Run": 2, "Eat": 3}
+        self.bebe = BEBEOutput()
+
+        rng = np.random.default_rng(0)
+        base = datetime(2018, 6, 8, 6, 0)
+        self.labels = []
+        for _ in range(60):
+            start = base + timedelta(milliseconds=int(rng.integers(0, 15 * 60 * 1000)))
+            end = start + timedelta(milliseconds=int(rng.integers(1, 90 * 1000)))
+            behavior = rng.choice(["Walk", "Run", "Eat", "Unmapped"])
+            self.labels.append(Label(start, end, str(behavior)))
+
+    def test_assign_labels_matches_legacy(self):
+        np.testing.assert_array_equal(self.bebe._assign_labels(self.df, self.labels, self.behavior_to_label_idx),
+                                      legacy_assign_labels(self.df, self.labels, self.behavior_to_label_idx))
+
+    def test_boundaries_are_inclusive_and_later_labels_win(self):
+        labels = [
+            Label("2018-06-08T06:00:01.000000", "2018-06-08T06:00:02.000000", "Walk"),
+            Label("2018-06-08T06:00:02.000000", "2018-06-08T06:00:03.000000", "Run"),
+            Label("2018-06-08T06:00:01.500000", "2018-06-08T06:00:01.750000", "Unmapped"),
+            Label("2018-06-08T06:00:00.000000", "2018-06-08T06:00:05.000000", "Eat"),
+            Label("2018-06-08T06:00:04.000000", "2018-06-08T06:00:04.062500", "Walk"),
+        ]
+        df = self.df.iloc[:16 * 6]
+        actual = self.bebe._assign_labels(df, labels, self.behavior_to_label_idx)
+        np.testing.assert_array_equal(actual, legacy_assign_labels(df, labels, self.behavior_to_label_idx))
+        self.assertEqual(actual[16 * 4], 1)
+        self.assertEqual(actual[16 * 4 + 1], 1)
+        self.assertEqual(actual[16 * 4 + 2], 3)
+        self.assertEqual(actual[16 * 5], 3)
+        self.assertEqual(actual[16 * 5 + 1], 0)
+
+    def test_filter_labeled_with_buffer_matches_legacy(self):
+        captured = []
+        merge = self.bebe._merge_datetime_ranges
+
+        def capture_ranges(ranges):
+            captured.append(merge(ranges))
+            return captured[-1]
+
+        labels = [
+            Label("2018-06-08T06:02:10.000000", "2018-06-08T06:02:20.000000", "Walk"),
+            Label("2018-06-08T06:02:15.000000", "2018-06-08T06:02:40.000000", "Run"),
+            Label("2018-06-08T06:08:00.000000", "2018-06-08T06:08:05.000000", "Eat"),
+        ]
+        for buffer_minutes, round_to_minutes in ((0, 0), (1, 0), (1, 2)):
+            with self.subTest(buffer_minutes=buffer_minutes, round_to_minutes=round_to_minutes):
+                with patch.object(self.bebe, "_merge_datetime_ranges", side_effect=capture_ranges):
+                    actual = self.bebe._filter_labeled_with_buffer(self.df, labels, buffer_minutes,
+                                                                   round_to_minutes)
+                pd.testing.assert_frame_equal(actual, legacy_filter_rows(self.df, captured[-1]))
+                self.assertTrue(0 < len(actual) < len(self.df))
+
+
 class TestBEBEMetadata(unittest.TestCase):
     """Test dataset_metadata.yaml content."""
 
@@ -456,6 +627,304 @@ class TestBEBEMetadata(unittest.TestCase):
         self.assertEqual(len(meta["individuals_per_fold"]), 5)
 
 
+class TestBEBEParallelOutput(unittest.TestCase):
+    """A process-pool run must write exactly what a serial run writes."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="bebe_test_data_")
+        self.serial_dir = tempfile.mkdtemp(prefix="bebe_test_serial_")
+        self.parallel_dir = tempfile.mkdtemp(prefix="bebe_test_parallel_")
+
+        # Interleave individuals (and a missing file) so ID assignment order matters
+        self.file_entries = []
+        for i, individual in enumerate(["M201_88888", "F202_99999", "M201_88888", "F203_77777", "F202_99999"]):
+            rel = f"{individual}_TEST/MotionData/2018/06 Jun/0{i + 1}/2018-06-0{i + 1}.csv"
+            create_synthetic_csv(os.path.join(self.data_dir, rel), num_rows=320)
+            labels = [Label(datetime(2018, 6, i + 1, 5, 50, 5), datetime(2018, 6, i + 1, 5, 50, 12), "Walk")]
+            self.file_entries.append(FileEntry(rel, id=f"file_{i:03d}", labels=labels))
+        self.file_entries.insert(1, FileEntry("X999_00000_TEST/missing.csv", id="missing"))
+
+    def tearDown(self):
+        for d in (self.data_dir, self.serial_dir, self.parallel_dir):
+            shutil.rmtree(d, ignore_errors=True)
+
+    def _generate(self, output_dir, workers, progress_callback=None):
+        config, data_root = build_test_project(self.data_dir, self.file_entries)
+        settings = OutputSettings(downsample_methods=[DownsampleMethod.AVERAGE, DownsampleMethod.MAX],
+                                  output_frequency=4, workers=workers)
+        return BEBEOutput().generate_output(config, output_dir, settings, data_root=data_root,
+                                            progress_callback=progress_callback)
+
+    def test_parallel_matches_serial(self):
+        serial_files = self._generate(self.serial_dir, workers=1)
+        progress = []
+        parallel_files = self._generate(self.parallel_dir, workers=3,
+                                        progress_callback=lambda c, t, f: progress.append((c, t)))
+
+        self.assertEqual([os.path.relpath(f, self.serial_dir) for f in serial_files],
+                         [os.path.relpath(f, self.parallel_dir) for f in parallel_files])
+        for rel in [os.path.relpath(f, self.serial_dir) for f in serial_files]:
+            with open(os.path.join(self.serial_dir, rel)) as a, open(os.path.join(self.parallel_dir, rel)) as b:
+                self.assertEqual(a.read(), b.read(), rel)
+        for method in ("average", "max"):
+            with open(os.path.join(self.serial_dir, method, "dataset_metadata.yaml")) as a, \
+                    open(os.path.join(self.parallel_dir, method, "dataset_metadata.yaml")) as b:
+                self.assertEqual(a.read(), b.read())
+
+        self.assertEqual(progress[-1], (6, 6))
+        self.assertEqual([c for c, _t in progress], sorted(c for c, _t in progress))
+
+    def test_cancel_from_progress_callback_propagates(self):
+        class Cancelled(Exception):
+            pass
+
+        def cancel(current, total, file_path):
+            if current > 0:
+                raise Cancelled()
+
+        with self.assertRaises(Cancelled):
+            self._generate(self.parallel_dir, workers=2, progress_callback=cancel)
+        self.assertFalse(os.path.exists(os.path.join(self.parallel_dir, "average", "dataset_metadata.yaml")))
+
+
+class TestBEBEIncrementalOutput(unittest.TestCase):
+    """Incremental runs regenerate only clips whose inputs changed."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="bebe_test_data_")
+        self.output_dir = tempfile.mkdtemp(prefix="bebe_test_output_")
+        self.file_entries = []
+        for i, individual in enumerate(["F202_99999", "M201_88888", "F202_99999"]):
+            rel = f"{individual}_TEST/MotionData/2018/06 Jun/0{i + 1}/2018-06-0{i + 1}.csv"
+            create_synthetic_csv(os.path.join(self.data_dir, rel), num_rows=320)
+            self.file_entries.append(FileEntry(rel, id=f"file_{i:03d}", labels=[]))
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _generate(self, methods=(DownsampleMethod.AVERAGE, DownsampleMethod.MAX)):
+        """Run an incremental generation and return (output files, paths of the entries processed)."""
+        config, data_root = build_test_project(self.data_dir, self.file_entries)
+        settings = OutputSettings(downsample_methods=list(methods), output_frequency=4, incremental=True)
+        bebe = BEBEOutput()
+        processed = []
+        original = bebe._process_file
+
+        def tracking_process_file(file_entry, *args):
+            processed.append(file_entry.path)
+            return original(file_entry, *args)
+
+        with patch.object(bebe, "_process_file", side_effect=tracking_process_file):
+            files = bebe.generate_output(config, self.output_dir, settings, data_root=data_root)
+        return files, processed
+
+    def _clip_ids(self, method="average"):
+        with open(os.path.join(self.output_dir, method, "dataset_metadata.yaml")) as f:
+            return yaml.safe_load(f)["clip_ids"]
+
+    def test_unchanged_run_regenerates_nothing(self):
+        first_files, processed = self._generate()
+        self.assertEqual(len(processed), 3)
+        self.assertTrue(os.path.isfile(os.path.join(self.output_dir, "bebe_manifest.json")))
+
+        second_files, processed = self._generate()
+        self.assertEqual(processed, [])
+        self.assertEqual(second_files, first_files)
+        self.assertEqual(len(self._clip_ids()), 3)
+
+    def test_only_changed_clips_are_regenerated(self):
+        self._generate()
+        self.file_entries[1].labels = [Label(datetime(2018, 6, 2, 5, 50, 1), datetime(2018, 6, 2, 5, 50, 9), "Walk")]
+        stat = os.stat(os.path.join(self.data_dir, self.file_entries[2].path))
+        os.utime(os.path.join(self.data_dir, self.file_entries[2].path),
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        _files, processed = self._generate()
+        self.assertEqual(processed, [self.file_entries[1].path, self.file_entries[2].path])
+
+    def test_orphaned_clips_are_deleted(self):
+        files, _processed = self._generate()
+        removed = self.file_entries.pop()  # dropping the last entry leaves individual IDs unchanged
+        orphaned = [f for f in files if f"_{removed.id}.csv" in f]
+        self.assertEqual(len(orphaned), 2)
+
+        _files, processed = self._generate()
+        self.assertEqual(processed, [])
+        for path in orphaned:
+            self.assertFalse(os.path.exists(path))
+        self.assertEqual(len(self._clip_ids()), 2)
+
+    def test_failed_regeneration_keeps_previous_clip(self):
+        files, _processed = self._generate()
+        kept = [f for f in files if f"_{self.file_entries[1].id}." in f]
+        self.file_entries[1].labels = [Label(datetime(2018, 6, 2, 5, 50, 1), datetime(2018, 6, 2, 5, 50, 9), "Walk")]
+
+        with patch.object(BEBEOutput, "_write_clip", side_effect=OSError("disk full")):
+            files, _processed = self._generate()
+        for path in kept:
+            self.assertTrue(os.path.exists(path))
+            self.assertIn(path, files)
+        # The kept clip is still listed, so the metadata matches clip_data/
+        self.assertEqual(len(self._clip_ids()), 3)
+        self.assertIn(f"M201_88888_TEST_{self.file_entries[1].id}", self._clip_ids("max"))
+
+        # The clip's fingerprint is still the old one, so the next run retries it
+        _files, processed = self._generate()
+        self.assertEqual(processed, [self.file_entries[1].path])
+
+    def test_clips_of_deleted_sources_are_deleted(self):
+        files, _processed = self._generate()
+        deleted = [f for f in files if f"_{self.file_entries[1].id}." in f]
+        os.remove(os.path.join(self.data_dir, self.file_entries[1].path))
+
+        for _run in range(2):
+            self._generate()
+            for path in deleted:
+                self.assertFalse(os.path.exists(path))
+            self.assertEqual(len(self._clip_ids()), 2)
+        with open(os.path.join(self.output_dir, "bebe_manifest.json")) as f:
+            self.assertNotIn(f"M201_88888_TEST_{self.file_entries[1].id}", json.load(f)["clips"])
+
+    def test_lazy_labels_are_fingerprinted_without_parsing(self):
+        labels = [Label(datetime(2018, 6, 1, 5, 50, 1), datetime(2018, 6, 1, 5, 50, 9), "Walk")]
+        eager = FileEntry(self.file_entries[0].path, id="eager", labels=labels)
+        lazy = FileEntry.from_dict(eager.to_dict(), lazy_labels=True)
+        fingerprint = BEBEOutput._clip_fingerprint(self.data_dir, eager, 1, "settings")
+        self.assertEqual(BEBEOutput._clip_fingerprint(self.data_dir, lazy, 1, "settings"), fingerprint)
+        self.assertEqual(lazy.label_count, 1)
+        self.assertIsNotNone(lazy._raw_labels)
+
+    def test_settings_change_regenerates_and_drops_old_method(self):
+        files, _processed = self._generate()
+        _files, processed = self._generate(methods=[DownsampleMethod.AVERAGE])
+        self.assertEqual(len(processed), 3)
+        for path in files:
+            self.assertEqual(os.path.exists(path), os.sep + "max" + os.sep not in path)
+
+
+class TestBEBEClipFormats(unittest.TestCase):
+    """Binary clip formats hold the same data as the CSV clips."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="bebe_test_data_")
+        self.output_dir = tempfile.mkdtemp(prefix="bebe_test_output_")
+        self.csv_rel = "F202_99999_TEST/MotionData_99999/2018/06 Jun/08/2018-06-08.csv"
+        create_synthetic_csv(os.path.join(self.data_dir, self.csv_rel), start_hour=5, start_min=50, num_rows=960)
+        labels = [Label(datetime(2018, 6, 8, 5, 50, 10), datetime(2018, 6, 8, 5, 50, 20), "Feed")]
+        self.file_entry = FileEntry(self.csv_rel, id="fmt00001", labels=labels)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_npy_and_npz_match_csv(self):
+        config, data_root = build_test_project(self.data_dir, [self.file_entry])
+        settings = OutputSettings(downsample_methods=[DownsampleMethod.AVERAGE], output_frequency=4,
+                                  clip_formats=[ClipFormat.CSV, ClipFormat.NPY, ClipFormat.NPZ])
+        files = BEBEOutput().generate_output(config, self.output_dir, settings, data_root=data_root)
+        self.assertEqual(sorted(os.path.splitext(f)[1] for f in files), [".csv", ".npy", ".npz"])
+
+        clip_base = os.path.join(self.output_dir, "average", "clip_data", "F202_99999_TEST_fmt00001")
+        expected = np.loadtxt(clip_base + ".csv", delimiter=",")
+        self.assertIn(4, expected[:, 4])  # FEED
+
+        npy = np.load(clip_base + ".npy")
+        with np.load(clip_base + ".npz") as npz:
+            npz_columns = {name: npz[name] for name in npz.files}
+        for i, name in enumerate(["AccX", "AccY", "AccZ", "individual_id", "label"]):
+            for values in (npy[name], npz_columns[name]):
+                np.testing.assert_allclose(values, expected[:, i], rtol=1e-6)
+        self.assertEqual(npy.dtype["AccX"], np.float32)
+        self.assertEqual(npy.dtype["label"], np.uint8)
+        self.assertEqual(npz_columns["individual_id"].dtype, np.uint8)
+
+        with open(os.path.join(self.output_dir, "average", "dataset_metadata.yaml")) as f:
+            meta = yaml.safe_load(f)
+        self.assertEqual(meta["clip_formats"], ["csv", "npy", "npz"])
+        self.assertEqual(meta["clip_column_dtypes"]["label"], "uint8")
+
+    def test_every_written_clip_is_logged(self):
+        config, data_root = build_test_project(self.data_dir, [self.file_entry])
+        settings = OutputSettings(downsample_methods=[DownsampleMethod.AVERAGE, DownsampleMethod.MAX],
+                                  output_frequency=4, clip_formats=[ClipFormat.CSV, ClipFormat.NPY])
+        bebe = BEBEOutput()
+        for stream_threshold_bytes in (bebe.stream_threshold_bytes, 0):
+            with self.subTest(streamed=stream_threshold_bytes == 0):
+                bebe.stream_threshold_bytes = stream_threshold_bytes
+                with self.assertLogs(level="INFO") as logs:
+                    files = bebe.generate_output(config, self.output_dir, settings, data_root=data_root)
+                self.assertEqual(len(files), 4)
+                for path in files:
+                    self.assertTrue(any(path in line for line in logs.output), path)
+
+    def test_csv_only_has_no_dtypes(self):
+        config, data_root = build_test_project(self.data_dir, [self.file_entry])
+        BEBEOutput().generate_output(config, self.output_dir, OutputSettings(), data_root=data_root)
+        with open(os.path.join(self.output_dir, "average", "dataset_metadata.yaml")) as f:
+            meta = yaml.safe_load(f)
+        self.assertEqual(meta["clip_formats"], ["csv"])
+        self.assertNotIn("clip_column_dtypes", meta)
+
+
+class TestBEBEStreamingOutput(unittest.TestCase):
+    """Chunked processing of large inputs must write exactly what the in-memory path writes."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="bebe_test_data_")
+        self.memory_dir = tempfile.mkdtemp(prefix="bebe_test_memory_")
+        self.stream_dir = tempfile.mkdtemp(prefix="bebe_test_stream_")
+        self.csv_rel = "F202_99999_TEST/MotionData_99999/2018/06 Jun/08/2018-06-08.csv"
+        create_synthetic_csv(os.path.join(self.data_dir, self.csv_rel), start_hour=5, start_min=50, num_rows=2005)
+        labels = [
+            Label(datetime(2018, 6, 8, 5, 50, 10), datetime(2018, 6, 8, 5, 50, 20, 500000), "Feed"),
+            Label(datetime(2018, 6, 8, 5, 51, 40), datetime(2018, 6, 8, 5, 51, 45), "Walk"),
+        ]
+        self.file_entry = FileEntry(self.csv_rel, id="stream01", labels=labels)
+
+    def tearDown(self):
+        for d in (self.data_dir, self.memory_dir, self.stream_dir):
+            shutil.rmtree(d, ignore_errors=True)
+
+    def _assert_streaming_matches(self, output_frequency, output_period, chunk_rows=37):
+        config, data_root = build_test_project(self.data_dir, [self.file_entry])
+        settings = OutputSettings(downsample_methods=list(DownsampleMethod), output_frequency=output_frequency,
+                                  output_period=output_period, buffer_minutes=0, round_to_minutes=0,
+                                  clip_formats=[ClipFormat.CSV, ClipFormat.NPY])
+        memory_files = BEBEOutput().generate_output(config, self.memory_dir, settings, data_root=data_root)
+        streaming = BEBEOutput(stream_threshold_bytes=0, chunk_rows=chunk_rows)
+        stream_files = streaming.generate_output(config, self.stream_dir, settings, data_root=data_root)
+
+        rel_paths = [os.path.relpath(f, self.memory_dir) for f in memory_files]
+        self.assertEqual(rel_paths, [os.path.relpath(f, self.stream_dir) for f in stream_files])
+        self.assertEqual(len(rel_paths), 8)
+        for rel in rel_paths:
+            with open(os.path.join(self.memory_dir, rel), "rb") as a, open(os.path.join(self.stream_dir, rel), "rb") as b:
+                self.assertEqual(a.read(), b.read(), rel)
+
+    def test_entire_input_matches_in_memory(self):
+        for output_frequency in (16, 4, 1):
+            with self.subTest(output_frequency=output_frequency):
+                self._assert_streaming_matches(output_frequency, OutputPeriod.ENTIRE_INPUT)
+
+    def test_labeled_with_buffer_matches_in_memory(self):
+        for output_frequency in (16, 2):
+            with self.subTest(output_frequency=output_frequency):
+                self._assert_streaming_matches(output_frequency, OutputPeriod.LABELED_WITH_BUFFER)
+
+    def test_input_shorter_than_one_group(self):
+        self.file_entry.labels = [Label(datetime(2018, 6, 8, 5, 50, 10), datetime(2018, 6, 8, 5, 50, 10, 200000),
+                                        "Feed")]
+        self._assert_streaming_matches(1, OutputPeriod.LABELED_WITH_BUFFER, chunk_rows=2)
+
+    def test_iter_chunks_matches_load_cached(self):
+        loader = VectronicMotionInput(frequency=16)
+        path = os.path.join(self.data_dir, self.csv_rel)
+        chunks = list(loader.iter_chunks(path, chunk_rows=500))
+        self.assertEqual([len(c) for c in chunks], [500, 500, 500, 500, 5])
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), loader.load_cached(path))
+
+
 class TestBEBELabeledWithBuffer(unittest.TestCase):
     """Test output period filtering with labeled_with_buffer."""
 
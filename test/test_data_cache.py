@@ -0,0 +1,188 @@
+"""
+Tests for the parsed-data DataCache and InputInterface.load_cached.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from input_types.data_cache import DataCache
+from input_types.vectronic_motion import VectronicMotionInput
+from test_bebe_output import create_synthetic_csv
+
+
+class TestDataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="cache_test_data_")
+        self.cache_dir = tempfile.mkdtemp(prefix="cache_test_cache_")
+        self.csv_path = os.path.join(self.data_dir, "2018-06-08.csv")
+        create_synthetic_csv(self.csv_path, num_rows=320)
+        self.cache = DataCache(self.cache_dir, max_bytes=10 * 1024 * 1024)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_cached_load_matches_parsed_load(self):
+        """A cache hit should return the same Timestamp and axis columns as parsing the CSV."""
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        expected = VectronicMotionInput(frequency=16).load_data(self.csv_path)
+
+        first = loader.load_cached(self.csv_path)
+        second = loader.load_cached(self.csv_path)
+
+        for df in (first, second):
+            for col in ["Timestamp", "Acc X [g]", "Acc Y [g]", "Acc Z [g]"]:
+                pd.testing.assert_series_equal(df[col], expected[col], check_names=False)
+
+    def test_cache_hit_equals_parsed_frame(self):
+        """A hit should restore the parser's column order and dtypes, not the cache's layout."""
+        df = pd.read_csv(self.csv_path, skiprows=1)
+        df["Acc Y [g]"] = np.arange(len(df))  # an integer axis column
+        with open(self.csv_path) as f:
+            header = f.readline()
+        with open(self.csv_path, "w", newline="") as f:
+            f.write(header)
+            df[["Acc Z [g]", "UTC DateTime", "Acc Y [g]", "Milliseconds", "Acc X [g]"]].to_csv(f, index=False)
+
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        miss = loader.load_cached(self.csv_path)
+        hit = loader.load_cached(self.csv_path)
+        self.assertEqual(list(miss.columns), ["Acc Z [g]", "Acc Y [g]", "Acc X [g]", "Timestamp"])
+        pd.testing.assert_frame_equal(hit, miss)
+
+    def test_second_load_skips_parsing(self):
+        """Once cached, load_cached should not call load_data again."""
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        loader.load_cached(self.csv_path)
+        with patch.object(VectronicMotionInput, "load_data", side_effect=AssertionError("re-parsed")):
+            loader.load_cached(self.csv_path)
+
+    def test_key_changes_with_file_and_settings(self):
+        """Modifying the file or the input settings should produce a different key."""
+        key = self.cache.make_key(self.csv_path, "VectronicMotionInput:16")
+        self.assertNotEqual(key, self.cache.make_key(self.csv_path, "VectronicMotionInput:32"))
+
+        stat = os.stat(self.csv_path)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertNotEqual(key, self.cache.make_key(self.csv_path, "VectronicMotionInput:16"))
+
+    def test_missing_file_is_a_miss(self):
+        self.assertIsNone(self.cache.get(os.path.join(self.data_dir, "nope.csv"), "x"))
+
+    def test_eviction_respects_budget(self):
+        """Least recently used entries should be evicted once the budget is exceeded."""
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        loader.load_cached(self.csv_path)
+        entry_size = self.cache.total_bytes()
+        self.assertGreater(entry_size, 0)
+
+        # Age the first entry so it is the least recently used
+        first_entry = self.cache._entry_path(self.cache.make_key(self.csv_path, loader.get_cache_key()))
+        os.utime(first_entry, (1000, 1000))
+
+        # Room for two entries; the third load must evict the oldest
+        self.cache.max_bytes = entry_size * 2
+        paths = []
+        for i in range(2):
+            path = os.path.join(self.data_dir, f"2018-06-0{i + 1}.csv")
+            create_synthetic_csv(path, num_rows=320)
+            loader.load_cached(path)
+            paths.append(path)
+
+        self.assertLessEqual(self.cache.total_bytes(), self.cache.max_bytes)
+        self.assertIsNone(self.cache.get(self.csv_path, loader.get_cache_key()))
+        self.assertIsNotNone(self.cache.get(paths[-1], loader.get_cache_key()))
+
+    def test_zero_budget_disables_writes(self):
+        self.cache.max_bytes = 0
+        VectronicMotionInput(frequency=16, cache=self.cache).load_cached(self.csv_path)
+        self.assertEqual(self.cache.total_bytes(), 0)
+
+    def test_corrupt_entry_is_discarded(self):
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        loader.load_cached(self.csv_path)
+        entry = self.cache._entry_path(self.cache.make_key(self.csv_path, loader.get_cache_key()))
+        with open(entry, "wb") as f:
+            f.write(b"not an npz")
+
+        self.assertIsNone(self.cache.get(self.csv_path, loader.get_cache_key()))
+        self.assertFalse(os.path.exists(entry))
+
+
+class TestMappedData(unittest.TestCase):
+    """Test the memory-mapped display sidecar used by the viewer."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="mapped_test_data_")
+        self.cache_dir = tempfile.mkdtemp(prefix="mapped_test_cache_")
+        self.csv_path = os.path.join(self.data_dir, "2018-06-08.csv")
+        create_synthetic_csv(self.csv_path, num_rows=320)
+        self.cache = DataCache(self.cache_dir, max_bytes=10 * 1024 * 1024)
+        self.expected = VectronicMotionInput(frequency=16).load_data(self.csv_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _assert_matches_expected(self, mapped):
+        expected_ms = self.expected["Timestamp"].to_numpy().astype("datetime64[ms]").astype(np.int64)
+        np.testing.assert_array_equal(mapped.timestamps_ms, expected_ms)
+        self.assertEqual(mapped.timestamps_ms.dtype, np.int64)
+        for col in ["Acc X [g]", "Acc Y [g]", "Acc Z [g]"]:
+            self.assertEqual(mapped[col].dtype, np.float32)
+            np.testing.assert_allclose(mapped[col], self.expected[col], rtol=1e-6)
+
+    def test_sidecar_is_memory_mapped(self):
+        """With a cache, load_mapped should return memmaps backed by the sidecar files."""
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        first = loader.load_mapped(self.csv_path)
+        with patch.object(VectronicMotionInput, "load_data", side_effect=AssertionError("re-parsed")):
+            second = loader.load_mapped(self.csv_path)
+
+        for mapped in (first, second):
+            self._assert_matches_expected(mapped)
+            self.assertIsInstance(mapped.timestamps_ms, np.memmap)
+            self.assertIsInstance(mapped["Acc X [g]"].base, np.memmap)
+
+    def test_without_cache_builds_in_memory(self):
+        mapped = VectronicMotionInput(frequency=16).load_mapped(self.csv_path)
+        self._assert_matches_expected(mapped)
+        self.assertNotIsInstance(mapped.timestamps_ms, np.memmap)
+
+    def test_close_drops_arrays(self):
+        mapped = VectronicMotionInput(frequency=16, cache=self.cache).load_mapped(self.csv_path)
+        mapped.close()
+        self.assertEqual(len(mapped), 0)
+        self.assertNotIn("Acc X [g]", mapped)
+
+    def test_load_mapped_writes_only_the_sidecar(self):
+        """The viewer path should not also store the parsed frame as an .npz entry."""
+        VectronicMotionInput(frequency=16, cache=self.cache).load_mapped(self.csv_path)
+        self.assertEqual(sorted(name.split(".", 1)[1] for name in os.listdir(self.cache_dir)),
+                         ["axes.npy", "ts.npy"])
+
+    def test_sidecar_and_frame_evicted_together(self):
+        """Every file for a source should count toward, and be removed by, eviction."""
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        loader.load_mapped(self.csv_path)
+        loader.load_cached(self.csv_path)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 3)
+
+        self.cache.max_bytes = 1
+        self.cache.evict()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
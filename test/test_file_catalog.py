@@ -0,0 +1,171 @@
+"""
+Tests for the SQLite FileCatalog of data files under a data root.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_processing.backtrack_analysis import analyze_backtracks
+from services.file_catalog import FileCatalog, extract_individual_id
+from test_bebe_output import create_synthetic_csv
+
+
+class TestFileCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="catalog_test_")
+        self.root = os.path.join(self.temp_dir, "data")
+        self.catalog = FileCatalog(os.path.join(self.temp_dir, "catalog.sqlite"))
+        self.rel_paths = ["F202_motion/2018-06-08.csv", "F202_motion/2018-06-09.csv", "M101_motion/2019-01-15.csv"]
+        for rel in self.rel_paths:
+            create_synthetic_csv(os.path.join(self.root, rel), num_rows=32)
+        with open(os.path.join(self.root, "notes.txt"), "w") as f:
+            f.write("not data\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def path(self, rel):
+        return os.path.join(self.root, rel)
+
+    def test_first_refresh_indexes_matching_files(self):
+        self.assertFalse(self.catalog.is_indexed(self.root))
+        counts = self.catalog.refresh(self.root)
+        self.assertEqual(counts, {"added": 3, "changed": 0, "removed": 0})
+        self.assertTrue(self.catalog.is_indexed(self.root))
+
+        entries = self.catalog.files(self.root)
+        self.assertEqual([e.rel_path for e in entries], self.rel_paths)
+        self.assertEqual(entries[0].size, os.path.getsize(self.path(self.rel_paths[0])))
+        self.assertEqual([e.individual_id for e in entries], ["F202", "F202", "M101"])
+        self.assertFalse(entries[0].is_profiled)
+
+    def test_refresh_diffs_by_stat(self):
+        self.catalog.refresh(self.root)
+        self.assertEqual(self.catalog.refresh(self.root), {"added": 0, "changed": 0, "removed": 0})
+
+        stat = os.stat(self.path(self.rel_paths[0]))
+        os.utime(self.path(self.rel_paths[0]), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        os.remove(self.path(self.rel_paths[2]))
+        create_synthetic_csv(self.path("M303_motion/2020-02-02.csv"), num_rows=16)
+
+        counts = self.catalog.refresh(self.root)
+        self.assertEqual(counts, {"added": 1, "changed": 1, "removed": 1})
+        self.assertEqual([e.rel_path for e in self.catalog.files(self.root)],
+                         self.rel_paths[:2] + ["M303_motion/2020-02-02.csv"])
+
+    def test_refresh_keeps_other_extensions(self):
+        self.catalog.refresh(self.root, extensions={".csv", ".txt"})
+        self.assertEqual(len(self.catalog.files(self.root)), 4)
+
+        # A .csv-only refresh must not drop the indexed .txt file
+        self.catalog.refresh(self.root)
+        self.assertEqual(len(self.catalog.files(self.root)), 4)
+        self.assertEqual([e.rel_path for e in self.catalog.files(self.root, extensions={".txt"})], ["notes.txt"])
+
+    def test_filter_by_individual(self):
+        self.catalog.refresh(self.root)
+        self.assertEqual(self.catalog.individual_ids(self.root), ["F202", "M101"])
+        self.assertEqual(len(self.catalog.files(self.root, individual_id="F202")), 2)
+
+    def test_regex_change_recomputes_individual_ids(self):
+        self.catalog.refresh(self.root)
+        self.catalog.refresh(self.root, individual_id_regex=r"(?P<individual>\d{4})-")
+        self.assertEqual(self.catalog.individual_ids(self.root), ["2018", "2019"])
+
+    def test_lookup(self):
+        self.catalog.refresh(self.root)
+        found = self.catalog.lookup(self.root, [self.rel_paths[1], "F202_motion\\2018-06-08.csv", "missing.csv"])
+        self.assertEqual(set(found), {self.rel_paths[1], "F202_motion\\2018-06-08.csv"})
+
+    def test_profile_pending_only_reads_new_files(self):
+        self.catalog.refresh(self.root)
+        self.assertEqual(self.catalog.profile_pending(self.root), 3)
+        entry = self.catalog.files(self.root)[0]
+        self.assertTrue(entry.is_profiled)
+        self.assertEqual(entry.rows, 32)
+        self.assertEqual(entry.start_time, "05:50:00")
+        self.assertAlmostEqual(entry.sample_rate_hz, 16.0, places=1)
+        self.assertEqual(entry.backtracks, 0)
+
+        self.assertEqual(self.catalog.profile_pending(self.root), 0)
+
+        # A changed file loses its profile and is read again
+        os.utime(self.path(self.rel_paths[1]), ns=(0, 0))
+        self.catalog.refresh(self.root)
+        self.assertFalse(self.catalog.lookup(self.root, [self.rel_paths[1]])[self.rel_paths[1]].is_profiled)
+        self.assertEqual(self.catalog.profile_pending(self.root), 1)
+
+    def test_roots_are_separate(self):
+        other_root = os.path.join(self.temp_dir, "other")
+        create_synthetic_csv(os.path.join(other_root, "X1_a/2018-06-08.csv"), num_rows=16)
+        self.catalog.refresh(self.root)
+        self.catalog.refresh(other_root)
+        self.assertEqual(len(self.catalog.files(self.root)), 3)
+        self.assertEqual(len(self.catalog.files(other_root)), 1)
+
+    def test_refresh_streams_progress(self):
+        batches = []
+        self.catalog.refresh(self.root, workers=4, progress_callback=lambda new, count: batches.append((new, count)))
+        self.assertEqual(sorted(rel for new, _count in batches for rel in new), self.rel_paths)
+        self.assertEqual(batches[-1][1], 3)
+
+    def test_single_worker_matches_parallel(self):
+        for i in range(20):
+            create_synthetic_csv(self.path(f"F{i}_motion/deep/er/2018-06-08.csv"), num_rows=1)
+        self.catalog.refresh(self.root, workers=8)
+        parallel = [(e.rel_path, e.size, e.mtime_ns) for e in self.catalog.files(self.root)]
+        other = FileCatalog(os.path.join(self.temp_dir, "serial.sqlite"))
+        other.refresh(self.root, workers=1)
+        self.assertEqual([(e.rel_path, e.size, e.mtime_ns) for e in other.files(self.root)], parallel)
+        self.assertEqual(len(parallel), 23)
+
+    def test_cancelled_refresh_leaves_index_untouched(self):
+        self.catalog.refresh(self.root)
+        os.remove(self.path(self.rel_paths[0]))
+
+        def cancel(new, count):
+            raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.catalog.refresh(self.root, progress_callback=cancel)
+        self.assertEqual(len(self.catalog.files(self.root)), 3)
+
+    def test_extract_individual_id(self):
+        self.assertEqual(extract_individual_id("F202_motion/x.csv", r"(?P<individual>[^_]+)_"), "F202")
+        self.assertIsNone(extract_individual_id("nounderscore.csv", r"(?P<individual>[^_]+)_"))
+        self.assertIsNone(extract_individual_id("F202_motion/x.csv", r"F\d+"))
+
+
+class TestBacktrackScanWithCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="catalog_scan_test_")
+        self.root = os.path.join(self.temp_dir, "archive")
+        self.rel_path = "MotionData_101/2018/06_June/08.csv"
+        create_synthetic_csv(os.path.join(self.root, self.rel_path), num_rows=64)
+        self.catalog = FileCatalog(os.path.join(self.temp_dir, "catalog.sqlite"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_scan_lists_files_from_catalog_and_stores_profiles(self):
+        output_dir = os.path.join(self.temp_dir, "out")
+        with patch("data_processing.backtrack_analysis.find_files") as find_files:
+            results = analyze_backtracks(self.root, workers=1, output_dir=output_dir, plots=False,
+                                         catalog=self.catalog)
+            find_files.assert_not_called()
+        self.assertEqual(list(results), [os.path.join(self.root, *self.rel_path.split("/"))])
+        entry = self.catalog.files(self.root)[0]
+        self.assertEqual(entry.rows, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import sys
+from datetime import datetime, time
 from pathlib import Path
 
 import unittest
@@ -172,6 +173,50 @@ class TestFileEntry(unittest.TestCase):
         file_entry.set_comment("mpace", "")
         self.assertEqual(file_entry.comments, {})
 
+    def test_lazy_labels_parsed_on_first_access(self):
+        """Lazy from_dict keeps label dicts until labels is read."""
+        data = {"path": "test.csv", "id": "1", "labels": [
+            {"start_time": "05:07:10.825020", "end_time": "06:18:21", "behavior": "Stalk"},
+            {"start_time": "2018-06-08T07:08:55", "end_time": "2018-06-08T08:35:05.321800", "behavior": "Feed"},
+        ]}
+        file_entry = FileEntry.from_dict(data, lazy_labels=True)
+        self.assertEqual(file_entry.label_count, 2)
+        self.assertEqual(file_entry.to_dict()["labels"], data["labels"])
+        self.assertIsNotNone(file_entry._raw_labels)
+
+        self.assertEqual([label.behavior for label in file_entry.labels], ["Stalk", "Feed"])
+        self.assertEqual(file_entry.to_dict(), FileEntry.from_dict(data).to_dict())
+
+    def test_lazy_labels_replaced_by_setter(self):
+        data = {"path": "test.csv", "id": "1", "labels": [
+            {"start_time": "05:00:00", "end_time": "05:00:01", "behavior": "Stalk"}]}
+        file_entry = FileEntry.from_dict(data, lazy_labels=True)
+        file_entry.set_labels([])
+        self.assertEqual(file_entry.label_count, 0)
+        self.assertEqual(file_entry.to_dict()["labels"], [])
+
+
+class TestLabelTimeParsing(unittest.TestCase):
+
+    def test_fast_path_matches_fallbacks(self):
+        """The fast ISO path gives the same datetimes as the fromisoformat/strptime chain."""
+        sentinel = datetime.min.date()
+        cases = {
+            "05:58:42.428860": datetime.combine(sentinel, time(5, 58, 42, 428860)),
+            "05:58:42": datetime.combine(sentinel, time(5, 58, 42)),
+            "5:58:42.4": datetime.combine(sentinel, time(5, 58, 42, 400000)),
+            "2018-06-08T05:58:42.428860": datetime(2018, 6, 8, 5, 58, 42, 428860),
+            "2018-06-08T05:58:42": datetime(2018, 6, 8, 5, 58, 42),
+            "2018-06-08 05:58:42": datetime(2018, 6, 8, 5, 58, 42),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(Label._parse_time(text), expected)
+
+    def test_invalid_time_still_raises(self):
+        with self.assertRaises(ValueError):
+            Label._parse_time("25:61:00")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for the widget-free FileSelectionModel behind the New Project file tree.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gui_components.new_project_dialog import FileSelectionModel
+
+
+class TestFileSelectionModel(unittest.TestCase):
+
+    def setUp(self):
+        self.paths = ["F1_a/2018/01.csv", "F1_a/2018/02.csv", "F1_a/notes.csv", "M2_b/01.csv", "top.csv"]
+        self.model = FileSelectionModel(self.paths)
+
+    def test_all_checked_by_default(self):
+        self.assertEqual(self.model.total, 5)
+        self.assertEqual(self.model.selected, 5)
+        self.assertEqual(self.model.checked_paths(), sorted(self.paths))
+        self.assertEqual(self.model.dir_state("F1_a"), "checked")
+
+    def test_children(self):
+        self.assertEqual(self.model.children(""), (["F1_a", "M2_b"], ["top.csv"]))
+        self.assertEqual(self.model.children("F1_a"), (["F1_a/2018"], ["F1_a/notes.csv"]))
+        self.assertEqual(self.model.children("F1_a/2018"), ([], ["F1_a/2018/01.csv", "F1_a/2018/02.csv"]))
+
+    def test_file_toggle_updates_directory_states(self):
+        self.model.set_checked("F1_a/2018/01.csv", False)
+        self.assertEqual(self.model.selected, 4)
+        self.assertEqual(self.model.dir_state("F1_a/2018"), "partial")
+        self.assertEqual(self.model.dir_state("F1_a"), "partial")
+        self.assertEqual(self.model.dir_state("M2_b"), "checked")
+
+        self.model.set_checked("F1_a/2018/02.csv", False)
+        self.assertEqual(self.model.dir_state("F1_a/2018"), "unchecked")
+
+        # Setting the current state again is a no-op
+        self.model.set_checked("F1_a/2018/02.csv", False)
+        self.assertEqual(self.model.selected, 3)
+
+    def test_directory_toggle(self):
+        self.model.set_dir_checked("F1_a", False)
+        self.assertEqual(self.model.selected, 2)
+        self.assertEqual(self.model.dir_state("F1_a/2018"), "unchecked")
+        self.assertEqual(self.model.unchecked_paths(), {"F1_a/2018/01.csv", "F1_a/2018/02.csv", "F1_a/notes.csv"})
+        self.model.set_dir_checked("F1_a", True)
+        self.assertEqual(self.model.selected, 5)
+
+    def test_select_and_deselect_all(self):
+        self.model.set_all(False)
+        self.assertEqual(self.model.selected, 0)
+        self.assertEqual(self.model.dir_state(""), "unchecked")
+        self.model.set_checked("top.csv", True)
+        self.assertEqual(self.model.dir_state(""), "partial")
+        self.model.set_all(True)
+        self.assertEqual(self.model.checked_paths(), sorted(self.paths))
+
+    def test_unchecked_carry_over(self):
+        model = FileSelectionModel(self.paths + ["new.csv"], unchecked={"top.csv", "gone.csv"})
+        self.assertEqual(model.total, 6)
+        self.assertEqual(model.selected, 5)
+        self.assertFalse(model.is_checked("top.csv"))
+
+    def test_large_tree(self):
+        paths = [f"ind{i % 50}/2018/{i:05d}.csv" for i in range(20_000)]
+        model = FileSelectionModel(paths)
+        self.assertEqual(len(model.children("")[0]), 50)
+        model.set_dir_checked("ind7", False)
+        self.assertEqual(model.selected, 20_000 - 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
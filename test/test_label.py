@@ -0,0 +1,73 @@
+"""
+Tests for the compact Label record and the columnar label arrays used for
+vectorized statistics.
+"""
+import sys
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.file_entry import FileEntry
+from models.label import Label, label_arrays
+
+
+class TestLabelRecord(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        label = Label("05:00:00", "05:00:10", "Walk")
+        self.assertFalse(hasattr(label, "__dict__"))
+        with self.assertRaises(AttributeError):
+            label.extra = 1
+
+    def test_duration_follows_edits(self):
+        label = Label("05:00:00", "05:00:10", "Walk")
+        self.assertEqual(label.duration, timedelta(seconds=10))
+        label.end_time = label.end_time + timedelta(seconds=5)
+        self.assertEqual(label.duration, timedelta(seconds=15))
+        self.assertEqual(label.calculate_duration(), label.duration)
+
+    def test_behavior_names_are_shared(self):
+        a = Label("05:00:00", "05:00:10", "".join(["Wa", "lk"]))
+        b = Label("06:00:00", "06:00:10", "".join(["Wa", "lk"]))
+        self.assertIs(a.behavior, b.behavior)
+
+
+class TestLabelArrays(unittest.TestCase):
+
+    DICTS = [
+        {"start_time": "05:00:00", "end_time": "05:00:10.500000", "behavior": "Walk"},
+        {"start_time": "2018-06-08T07:00:00.250000", "end_time": "2018-06-08T07:01:00", "behavior": "Feed"},
+    ]
+
+    def test_dicts_and_labels_agree(self):
+        from_dicts = label_arrays(self.DICTS)
+        from_labels = label_arrays([Label.from_dict(d) for d in self.DICTS])
+        for a, b in zip(from_dicts, from_labels):
+            np.testing.assert_array_equal(a, b)
+        starts, ends, behaviors = from_dicts
+        np.testing.assert_array_equal(ends - starts, [10_500_000, 59_750_000])
+        self.assertEqual(list(behaviors), ["Walk", "Feed"])
+        self.assertEqual(starts[1], (datetime(2018, 6, 8, 7, 0, 0, 250000) - datetime(1970, 1, 1)) // timedelta(microseconds=1))
+
+    def test_unpadded_times_fall_back(self):
+        starts, ends, _ = label_arrays([{"start_time": "5:00:00", "end_time": "5:00:01", "behavior": "Walk"}])
+        np.testing.assert_array_equal(ends - starts, [1_000_000])
+
+    def test_empty(self):
+        starts, ends, behaviors = label_arrays([])
+        self.assertEqual((len(starts), len(ends), len(behaviors)), (0, 0, 0))
+
+    def test_file_entry_arrays_do_not_materialize(self):
+        file_entry = FileEntry.from_dict({"path": "a.csv", "id": "1", "labels": self.DICTS}, lazy_labels=True)
+        starts, _ends, _behaviors = file_entry.label_arrays()
+        self.assertEqual(len(starts), 2)
+        self.assertIsNotNone(file_entry._raw_labels)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests for the LODPyramid used by the viewer for display downsampling.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from input_types.data_cache import DataCache
+from input_types.lod_pyramid import BASE_BUCKET_SIZE, LODPyramid
+from input_types.mapped_data import MappedData
+from input_types.vectronic_motion import VectronicMotionInput
+from test_bebe_output import create_synthetic_csv
+
+
+def make_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    timestamps_ms = np.arange(n, dtype=np.int64) * 62 + 1_528_416_000_000
+    axes = {"x": rng.normal(0, 1, n).astype(np.float32),
+            "y": np.round(rng.normal(0, 1, n), 1).astype(np.float32)}  # rounded => many ties
+    return MappedData(timestamps_ms, axes)
+
+
+class TestLODPyramid(unittest.TestCase):
+
+    def setUp(self):
+        self.n = 100_003  # not a multiple of any bucket size
+        self.data = make_data(self.n)
+        self.pyramid = LODPyramid.build(self.data)
+
+    def test_levels_match_brute_force(self):
+        """Every stored bucket should hold the index of its true first min and first max."""
+        for col in ("x", "y"):
+            values = self.data[col]
+            for level, (min_idx, max_idx) in enumerate(self.pyramid._levels[col]):
+                bucket = BASE_BUCKET_SIZE << level
+                for b in {0, len(min_idx) // 2, len(min_idx) - 1}:
+                    chunk = values[b * bucket:(b + 1) * bucket]
+                    self.assertEqual(min_idx[b], b * bucket + chunk.argmin())
+                    self.assertEqual(max_idx[b], b * bucket + chunk.argmax())
+
+    def test_downsample_preserves_envelope(self):
+        """Any visible range keeps its extremes, stays in range, and is bounded in size."""
+        for start, end in [(0, self.n), (12_345, 98_765), (50_000, 60_000), (7, 5_000), (100, 3_000)]:
+            for col in ("x", "y"):
+                values = self.data[col]
+                idx = self.pyramid.downsample_indices(values, col, start, end, max_points=4000)
+                self.assertTrue(np.all(np.diff(idx) > 0))
+                self.assertGreaterEqual(idx[0], start)
+                self.assertLess(idx[-1], end)
+                self.assertLessEqual(len(idx), 4000 + 4)
+                self.assertEqual(values[idx].min(), values[start:end].min())
+                self.assertEqual(values[idx].max(), values[start:end].max())
+
+    def test_small_range_is_not_downsampled(self):
+        ts, vals = self.pyramid.downsample(self.data, "x", 10, 1010)
+        np.testing.assert_array_equal(ts, self.data.timestamps_ms[10:1010])
+        np.testing.assert_array_equal(vals, self.data["x"][10:1010])
+
+    def test_tiny_input_has_no_levels(self):
+        data = make_data(10)
+        pyramid = LODPyramid.build(data)
+        ts, vals = pyramid.downsample(data, "x", 0, 10)
+        self.assertEqual(len(ts), 10)
+
+    def test_save_load_round_trip(self):
+        tmp = tempfile.mkdtemp(prefix="lod_test_")
+        try:
+            path = os.path.join(tmp, "p.npz")
+            self.pyramid.save(path)
+            loaded = LODPyramid.load(path, self.n)
+            idx = loaded.downsample_indices(self.data["x"], "x", 0, self.n)
+            np.testing.assert_array_equal(idx, self.pyramid.downsample_indices(self.data["x"], "x", 0, self.n))
+            with self.assertRaises(ValueError):
+                LODPyramid.load(path, self.n + 1)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+class TestPyramidCache(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="lod_test_data_")
+        self.cache_dir = tempfile.mkdtemp(prefix="lod_test_cache_")
+        self.csv_path = os.path.join(self.data_dir, "2018-06-08.csv")
+        create_synthetic_csv(self.csv_path, num_rows=3200)
+        self.cache = DataCache(self.cache_dir, max_bytes=10 * 1024 * 1024)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_pyramid_is_persisted(self):
+        """The second load_pyramid call should read the persisted pyramid instead of rebuilding."""
+        loader = VectronicMotionInput(frequency=16, cache=self.cache)
+        data = loader.load_mapped(self.csv_path)
+        first = loader.load_pyramid(self.csv_path, data)
+        with patch.object(LODPyramid, "build", side_effect=AssertionError("rebuilt")):
+            second = loader.load_pyramid(self.csv_path, data)
+
+        col = "Acc X [g]"
+        np.testing.assert_array_equal(first.downsample_indices(data[col], col, 0, len(data), max_points=200),
+                                      second.downsample_indices(data[col], col, 0, len(data), max_points=200))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import tempfile
 import os
 import shutil
 from services.project_service import ProjectService
+from services.project_store import JsonProjectStore
 from models.directory_entry import DirectoryEntry
 from models.file_entry import FileEntry
 from models.project_config import ProjectConfig
@@ -182,5 +183,192 @@ class TestProjectService(unittest.TestCase):
         self.assertEqual(self.project_service.get_verification_color(["someone"]), "green")
         self.assertEqual(self.project_service.get_verification_color([]), "red")
 
+class TestProjectServiceFileIndex(unittest.TestCase):
+    """The id -> (FileEntry, parent) index stays consistent with the entry tree."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = os.path.join(self.test_dir, "project_config.json")
+        self.root_file = FileEntry(path="root.csv", id="root0001")
+        self.nested_file = FileEntry(path="F202/2018-06-09.csv", id="nest0001")
+        self.sub_dir = DirectoryEntry("Sub")
+        self.dir_entry = DirectoryEntry("F202", entries=[self.nested_file, self.sub_dir])
+        project_config = ProjectConfig(
+            proj_name="IndexProject",
+            users=[UserConfig(username="default_user", data_root=self.test_dir)],
+            entries=[self.dir_entry, self.root_file],
+            label_display=[],
+        )
+        self.project_service = ProjectService()
+        self.project_service.current_project_config = project_config
+        self.project_service.current_project_path = self.project_path
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_lookups(self):
+        service = self.project_service
+        self.assertIs(service.find_file_by_id("nest0001"), self.nested_file)
+        self.assertIs(service.find_parent_directory_of_file("nest0001"), self.dir_entry)
+        self.assertIsNone(service.find_parent_directory_of_file("root0001"))
+        self.assertIs(service.find_file_by_path("root.csv"), self.root_file)
+        self.assertIsNone(service.find_file_by_id("missing"))
+        self.assertTrue(service._does_id_exist("root0001"))
+        self.assertFalse(service._does_id_exist("missing"))
+
+    def test_load_project_builds_index(self):
+        self.project_service.save_project()
+        service = ProjectService(self.project_path)
+        self.assertEqual(set(service._file_index), {"root0001", "nest0001"})
+        self.assertEqual(service.find_parent_directory_of_file("nest0001").name, "F202")
+
+    def test_move_file_updates_parent(self):
+        service = self.project_service
+        self.assertTrue(service.move_file("nest0001", "F202/Sub"))
+        self.assertEqual(self.dir_entry.entries, [self.sub_dir])
+        self.assertEqual(self.sub_dir.entries, [self.nested_file])
+        self.assertIs(service.find_parent_directory_of_file("nest0001"), self.sub_dir)
+
+        service.move_file("nest0001", "IndexProject")
+        self.assertIsNone(service.find_parent_directory_of_file("nest0001"))
+        self.assertIn(self.nested_file, service.get_entries())
+
+    def test_move_file_to_missing_directory_keeps_file(self):
+        self.assertFalse(self.project_service.move_file("nest0001", "F202/Nope"))
+        self.assertFalse(self.project_service.move_file("missing", "F202/Sub"))
+        self.assertIn(self.nested_file, self.dir_entry.entries)
+        self.assertIs(self.project_service.find_parent_directory_of_file("nest0001"), self.dir_entry)
+
+    def test_delete_file(self):
+        service = self.project_service
+        service.delete_file_by_id("nest0001")
+        self.assertEqual(self.dir_entry.entries, [self.sub_dir])
+        self.assertIsNone(service.find_file_by_id("nest0001"))
+        self.assertIs(service.find_file_by_id("root0001"), self.root_file)
+
+    def test_delete_root_level_file(self):
+        """Files outside any directory are deleted too (they used to be left in the project)."""
+        service = self.project_service
+        service.delete_file_by_id("root0001")
+        self.assertEqual(service.get_entries(), [self.dir_entry])
+        self.assertIsNone(service.find_file_by_id("root0001"))
+        self.assertIsNone(service.find_file_by_path("root.csv"))
+
+        reloaded = ProjectService(self.project_path)
+        self.assertIsNone(reloaded.find_file_by_id("root0001"))
+        self.assertIsNotNone(reloaded.find_file_by_id("nest0001"))
+
+    def test_add_file_is_indexed(self):
+        file_entry = FileEntry(path="F202/Sub/new.csv")
+        self.project_service.add_file("F202/Sub", file_entry)
+        self.assertIs(self.project_service.find_file_by_id(file_entry.id), file_entry)
+        self.assertIs(self.project_service.find_parent_directory_of_file(file_entry.id), self.sub_dir)
+
+    def test_replaced_config_is_reindexed(self):
+        self.assertIsNotNone(self.project_service.find_file_by_id("root0001"))
+        self.project_service.current_project_config = ProjectConfig(proj_name="Other", entries=[])
+        self.assertIsNone(self.project_service.find_file_by_id("root0001"))
+
+    def test_create_project_assigns_unique_ids(self):
+        location = os.path.join(self.test_dir, "created.json")
+        files = [FileEntry(path=f"ind/{i}.csv") for i in range(500)]
+        existing = FileEntry(path="ind/existing.csv", id="keep0001")
+        service = ProjectService()
+        service.create_project("Created", location, self.test_dir,
+                               entries=[DirectoryEntry("ind", entries=files + [existing])])
+        ids = {f.id for f in files}
+        self.assertEqual(len(ids), 500)
+        self.assertNotIn("keep0001", ids)
+        self.assertEqual(len(service._file_index), 501)
+        self.assertEqual(service.find_parent_directory_of_file(files[0].id).name, "ind")
+
+
+class FakeScheduler:
+    """Stands in for Tk's after/after_cancel; run() fires the pending callbacks."""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_handle = 0
+
+    def schedule(self, delay_ms, callback):
+        self.next_handle += 1
+        self.pending[self.next_handle] = callback
+        return self.next_handle
+
+    def cancel(self, handle):
+        self.pending.pop(handle, None)
+
+    def run(self):
+        callbacks, self.pending = list(self.pending.values()), {}
+        for callback in callbacks:
+            callback()
+
+
+class TestProjectServiceDeferredSave(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.project_path = os.path.join(self.test_dir, "project_config.json")
+        self.file_entry = FileEntry(path="a.csv", id="file0001")
+        self.project_service = ProjectService()
+        self.project_service.current_project_config = ProjectConfig(
+            proj_name="SaveProject",
+            users=[UserConfig(username="default_user", data_root=self.test_dir)],
+            entries=[DirectoryEntry("Dir", entries=[self.file_entry])],
+            label_display=[],
+        )
+        self.project_service.current_project_path = self.project_path
+        self.scheduler = FakeScheduler()
+        self.project_service.set_save_scheduler(self.scheduler.schedule, self.scheduler.cancel, delay_ms=500)
+        self.dirty_events = []
+        self.project_service.add_dirty_listener(self.dirty_events.append)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_burst_of_edits_is_one_write(self):
+        service = self.project_service
+        with patch.object(JsonProjectStore, "save", autospec=True, side_effect=JsonProjectStore.save) as save:
+            for i in range(10):
+                service.update_file_comment("file0001", "default_user", f"comment {i}")
+            self.assertFalse(os.path.exists(self.project_path))
+            self.assertTrue(service.has_unsaved_changes())
+            self.assertEqual(len(self.scheduler.pending), 1)
+
+            self.scheduler.run()
+            self.assertEqual(save.call_count, 1)
+        self.assertTrue(os.path.exists(self.project_path))
+        self.assertFalse(service.has_unsaved_changes())
+        self.assertEqual(self.dirty_events, [True, False])
+
+    def test_flush_writes_pending_changes(self):
+        self.project_service.update_labels("file0001", [])
+        self.assertTrue(self.project_service.flush())
+        self.assertTrue(os.path.exists(self.project_path))
+        self.assertEqual(self.scheduler.pending, {})
+        self.assertTrue(self.project_service.flush())  # nothing pending
+
+    def test_failed_save_stays_dirty(self):
+        self.project_service.request_save()
+        self.project_service.current_project_path = os.path.join(self.test_dir, "missing_dir", "p.json")
+        self.assertFalse(self.project_service.flush())
+        self.assertTrue(self.project_service.has_unsaved_changes())
+
+    def test_zero_delay_saves_immediately(self):
+        self.project_service.set_save_delay(0)
+        self.project_service.request_save()
+        self.assertTrue(os.path.exists(self.project_path))
+        self.assertEqual(self.scheduler.pending, {})
+
+    def test_load_project_flushes_pending_save(self):
+        self.project_service.request_save()
+        other_path = os.path.join(self.test_dir, "other.json")
+        with open(other_path, "w") as f:
+            f.write('{"proj_name": "Other", "entries": []}')
+        self.project_service.load_project(other_path)
+        self.assertTrue(os.path.exists(self.project_path))
+        self.assertFalse(self.project_service.has_unsaved_changes())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,196 @@
+"""
+Tests for the incrementally maintained ProjectStatistics behind the Labeling Dashboard.
+"""
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.directory_entry import DirectoryEntry
+from models.file_entry import FileEntry
+from models.label import Label
+from models.project_config import ProjectConfig
+from models.user_config import UserConfig
+from services.project_service import ProjectService
+from services.project_statistics import ProjectStatistics
+
+BEHAVIORS = ["Walk", "Feed", "Stalk", "Unknown"]
+
+
+def random_file_entries(count, seed=0):
+    """Files with random labels and verifications; every other file keeps its labels lazily loaded."""
+    rng = np.random.default_rng(seed)
+    file_entries = []
+    for i in range(count):
+        labels = []
+        for _ in range(int(rng.integers(0, 8))):
+            start = datetime(2018, 6, 8) + timedelta(seconds=int(rng.integers(0, 80000)))
+            labels.append(Label(start, start + timedelta(milliseconds=int(rng.integers(1, 600000))),
+                                BEHAVIORS[int(rng.integers(0, len(BEHAVIORS)))]))
+        verified_by = ["alice", "bob"][:int(rng.integers(0, 3))]
+        if i % 2:
+            file_entries.append(FileEntry(path=f"{i}.csv", id=str(i), labels=labels, verified_by=verified_by))
+        else:
+            data = {"path": f"{i}.csv", "id": str(i), "labels": [label.to_dict() for label in labels],
+                    "verified_by": verified_by}
+            file_entries.append(FileEntry.from_dict(data, lazy_labels=True))
+    return file_entries
+
+
+def assert_matches_scan(test, stats, file_entries, names=("Walk", "Feed", "Stalk", "Kill")):
+    """Compare stats with a label-by-label scan of file_entries."""
+    behavior_stats = stats.behavior_stats(names)
+    for name in names:
+        matching = [(fe.id, label) for fe in file_entries for label in fe.labels if label.behavior == name]
+        test.assertEqual(behavior_stats[name]["labels"], len(matching))
+        test.assertEqual(behavior_stats[name]["files"], len({file_id for file_id, _ in matching}))
+        test.assertAlmostEqual(behavior_stats[name]["duration_sec"],
+                               sum(label.duration.total_seconds() for _, label in matching), places=6)
+    test.assertEqual(stats.total_files, len(file_entries))
+    test.assertEqual(stats.total_labels, sum(len(fe.labels) for fe in file_entries))
+    test.assertEqual(stats.files_with_labels, sum(1 for fe in file_entries if fe.labels))
+    test.assertEqual(stats.verified_count("bob"), sum(1 for fe in file_entries if "bob" in fe.verified_by))
+
+
+class TestProjectStatistics(unittest.TestCase):
+
+    def test_rebuild_matches_per_label_scan(self):
+        file_entries = random_file_entries(30)
+        stats = ProjectStatistics()
+        stats.refresh({fe.id: fe for fe in file_entries})
+        assert_matches_scan(self, stats, file_entries)
+
+    def test_incremental_refresh_matches_rebuild(self):
+        file_entries = random_file_entries(30)
+        index = {fe.id: fe for fe in file_entries}
+        stats = ProjectStatistics()
+        stats.refresh(index)
+
+        file_entries[3].labels = [Label("05:00:00", "05:01:00", "Kill")]
+        file_entries[4].set_verified_by("bob", True)
+        del index[file_entries[5].id]
+        for file_id in ("3", "4", "5"):
+            stats.invalidate(file_id)
+        with patch.object(FileEntry, "concat_label_arrays", side_effect=FileEntry.concat_label_arrays) as scan:
+            stats.refresh(index)
+        self.assertEqual(len(scan.call_args.args[0]), 2)  # Only the edited files were rescanned
+        assert_matches_scan(self, stats, list(index.values()))
+
+    def test_fully_verified_follows_reviewers_and_threshold(self):
+        file_entries = [FileEntry(path=f"{i}.csv", id=str(i), verified_by=["alice", "bob", "carol"][:i])
+                        for i in range(4)]
+        stats = ProjectStatistics()
+        stats.refresh({fe.id: fe for fe in file_entries})
+        self.assertEqual(stats.files_fully_verified(num_reviewers=0, threshold=1.0), 3)
+        self.assertEqual(stats.files_fully_verified(num_reviewers=3, threshold=1.0), 1)
+        self.assertEqual(stats.files_fully_verified(num_reviewers=3, threshold=0.5), 2)
+        self.assertEqual(stats.files_fully_verified(num_reviewers=3, threshold=0.0), 3)
+
+    def test_no_labels(self):
+        stats = ProjectStatistics()
+        stats.refresh({"1": FileEntry(path="a.csv", id="1")})
+        self.assertEqual(stats.behavior_stats(["Walk"]), {"Walk": {"labels": 0, "files": 0, "duration_sec": 0.0}})
+
+
+class TestProjectServiceStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="project_stats_test_")
+        self.service = ProjectService()
+        self.service.current_project_path = str(Path(self.temp_dir) / "project.json")
+        self.file_entries = random_file_entries(20, seed=1)
+        self.service.current_project_config = ProjectConfig(
+            proj_name="StatsProject",
+            users=[UserConfig(username="alice", data_root=self.temp_dir)],
+            entries=[DirectoryEntry("F202", entries=self.file_entries[1:]), self.file_entries[0]],
+            label_display=[],
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_edits_through_the_service_update_statistics(self):
+        stats = self.service.get_statistics()
+        labels_before = stats.total_labels
+
+        self.service.update_labels("7", self.file_entries[7].labels + [Label("23:00:00", "23:00:30", "Walk")])
+        self.service.delete_file_by_id("8")
+        with patch.object(FileEntry, "concat_label_arrays", side_effect=FileEntry.concat_label_arrays) as scan:
+            stats = self.service.get_statistics()
+        self.assertEqual(len(scan.call_args.args[0]), 1)
+        remaining = [fe for fe in self.file_entries if fe.id != "8"]
+        self.assertEqual(stats.total_labels, labels_before + 1 - self.file_entries[8].label_count)
+        assert_matches_scan(self, stats, remaining)
+
+    def test_verification_through_the_service_updates_statistics(self):
+        stats = self.service.get_statistics()
+        file_entry = next(fe for fe in self.file_entries if "bob" not in fe.verified_by)
+        bob_before = stats.verified_count("bob")
+        verified_before = stats.files_fully_verified(num_reviewers=2, threshold=1.0)
+
+        # As the info pane does: toggle the checkbox, then report the one changed file
+        file_entry.set_verified_by("bob", True)
+        self.service.request_save(file_id=file_entry.id)
+        stats = self.service.get_statistics()
+        self.assertEqual(stats.verified_count("bob"), bob_before + 1)
+        self.assertEqual(stats.files_fully_verified(num_reviewers=2, threshold=1.0),
+                         verified_before + (1 if "alice" in file_entry.verified_by else 0))
+
+        file_entry.set_verified_by("bob", False)
+        self.service.request_save(file_id=file_entry.id)
+        stats = self.service.get_statistics()
+        self.assertEqual(stats.verified_count("bob"), bob_before)
+        self.assertEqual(stats.files_fully_verified(num_reviewers=2, threshold=1.0), verified_before)
+        assert_matches_scan(self, stats, self.file_entries)
+
+    def test_repeated_label_edits_update_statistics(self):
+        stats = self.service.get_statistics()
+        walk_before = stats.behavior_stats(["Walk"])["Walk"]
+        file_entry = self.file_entries[3]
+        original = list(file_entry.labels)
+
+        self.service.update_labels(file_entry.id, original + [Label("23:00:00", "23:00:30", "Walk")])
+        stats = self.service.get_statistics()
+        walk = stats.behavior_stats(["Walk"])["Walk"]
+        self.assertEqual(walk["labels"], walk_before["labels"] + 1)
+        self.assertAlmostEqual(walk["duration_sec"], walk_before["duration_sec"] + 30, places=6)
+
+        self.service.update_labels(file_entry.id, [])
+        stats = self.service.get_statistics()
+        self.assertEqual(stats.total_labels, sum(fe.label_count for fe in self.file_entries))
+        assert_matches_scan(self, stats, self.file_entries)
+
+        self.service.update_labels(file_entry.id, original)
+        assert_matches_scan(self, self.service.get_statistics(), self.file_entries)
+
+    def test_change_listeners_follow_edits(self):
+        changes = []
+        self.service.add_change_listener(changes.append)
+        self.service.update_labels("7", [])
+        self.service.request_save()
+        self.service.remove_change_listener(changes.append)
+        self.service.update_labels("9", [])
+        self.assertEqual(changes, ["7", None])
+
+    def test_untracked_changes_rescan_everything(self):
+        self.service.get_statistics()
+        self.service.current_project_config.entries.append(FileEntry(path="new.csv", id="new",
+                                                                     labels=[Label("01:00:00", "01:00:01", "Feed")]))
+        self.service.request_save()
+        stats = self.service.get_statistics()
+        assert_matches_scan(self, stats, self.file_entries + [self.service.find_file_by_id("new")])
+
+    def test_no_project(self):
+        self.assertIsNone(ProjectService().get_statistics())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for the project storage backends: the single-file JSON format and the
+SQLite store with one record per file, plus conversion between them.
+"""
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.directory_entry import DirectoryEntry
+from models.file_entry import FileEntry
+from models.label import Label
+from models.project_config import ProjectConfig
+from models.user_config import UserConfig
+from services.project_service import ProjectService
+from services.project_store import (JsonProjectStore, SqliteProjectStore, convert_project, is_sqlite_project,
+                                    open_project_store)
+
+
+def make_project(num_files=3):
+    files = [FileEntry(path=f"F202/{i}.csv", id=f"id{i:04d}",
+                       labels=[Label("05:00:00", "05:00:10", "Walk")],
+                       verified_by=["alice"], comments={"alice": f"note {i}"})
+             for i in range(num_files)]
+    return ProjectConfig(
+        proj_name="StoreProject",
+        users=[UserConfig(username="alice", data_root="/data")],
+        entries=[DirectoryEntry("F202", entries=files[1:]), files[0]],
+        label_display=[],
+    )
+
+
+class TestSqliteProjectStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="project_store_test_")
+        self.db_path = os.path.join(self.temp_dir, "project.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_matches_json(self):
+        config = make_project()
+        SqliteProjectStore(self.db_path).save(config)
+        loaded = SqliteProjectStore(self.db_path).load()
+        self.assertEqual(loaded.to_dict(), config.to_dict())
+
+    def test_one_label_change_writes_one_row(self):
+        config = make_project(num_files=50)
+        store = SqliteProjectStore(self.db_path)
+        store.save(config)
+
+        statements = []
+        original_connect = store._connect
+
+        def traced_connect():
+            conn = original_connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        store._connect = traced_connect
+        changed = config.entries[0].entries[3]
+        changed.labels.append(Label("06:00:00", "06:00:05", "Feed"))
+        store.save(config, changed_file_ids=[changed.id])
+
+        writes = [s for s in statements if s.split()[0] in ("INSERT", "UPDATE", "DELETE")]
+        self.assertEqual(len(writes), 1)
+        self.assertIn(changed.id, writes[0])
+
+        reloaded = SqliteProjectStore(self.db_path).load()
+        self.assertEqual(len(reloaded.entries[0].entries[3].labels), 2)
+
+    def test_full_compare_finds_changed_files(self):
+        config = make_project()
+        store = SqliteProjectStore(self.db_path)
+        store.save(config)
+        config.entries[1].set_comment("alice", "edited")
+        store.save(config)  # changed_file_ids=None compares every file
+        self.assertEqual(SqliteProjectStore(self.db_path).load().entries[1].comments, {"alice": "edited"})
+
+    def test_moves_and_deletes(self):
+        config = make_project()
+        store = SqliteProjectStore(self.db_path)
+        store.save(config)
+
+        moved = config.entries[0].entries.pop(0)
+        config.entries.append(moved)
+        config.entries[0].entries.pop(0)  # delete id0002
+        store.save(config, changed_file_ids=[])
+
+        loaded = SqliteProjectStore(self.db_path).load()
+        self.assertEqual(loaded.to_dict(), config.to_dict())
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            self.assertEqual(sorted(r[0] for r in conn.execute("SELECT id FROM files")), ["id0000", "id0001"])
+
+    def test_files_without_unique_id_are_kept_inline(self):
+        config = make_project()
+        config.entries.append(FileEntry(path="noid.csv"))
+        config.entries.append(FileEntry(path="dup.csv", id="id0000"))
+        SqliteProjectStore(self.db_path).save(config)
+        self.assertEqual(SqliteProjectStore(self.db_path).load().to_dict(), config.to_dict())
+
+    def test_newer_format_is_rejected(self):
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute("PRAGMA user_version = 99")
+        with self.assertRaises(ValueError):
+            SqliteProjectStore(self.db_path).load()
+
+
+class TestProjectConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="project_convert_test_")
+        self.json_path = os.path.join(self.temp_dir, "project.json")
+        self.db_path = os.path.join(self.temp_dir, "project.sqlite")
+        JsonProjectStore(self.json_path).save(make_project())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_format_detection(self):
+        self.assertFalse(is_sqlite_project(self.json_path))
+        self.assertTrue(is_sqlite_project(self.db_path))  # new file, by extension
+        convert_project(self.json_path, self.db_path)
+        renamed = os.path.join(self.temp_dir, "renamed.proj")
+        shutil.copy(self.db_path, renamed)
+        self.assertIsInstance(open_project_store(renamed), SqliteProjectStore)  # existing file, by header
+
+    def test_migrate_and_export(self):
+        convert_project(self.json_path, self.db_path)
+        exported = os.path.join(self.temp_dir, "exported.json")
+        convert_project(self.db_path, exported)
+        with open(self.json_path) as a, open(exported) as b:
+            self.assertEqual(json.load(a), json.load(b))
+
+    def test_project_service_on_sqlite(self):
+        convert_project(self.json_path, self.db_path)
+        service = ProjectService(self.db_path)
+        service.update_labels("id0001", [Label("07:00:00", "07:00:01", "Stalk")])
+        service.move_file("id0002", "StoreProject")
+        reloaded = ProjectService(self.db_path).current_project_config
+        self.assertEqual(reloaded.to_dict(), service.current_project_config.to_dict())
+        self.assertEqual(reloaded.entries[0].entries[0].labels[0].behavior, "Stalk")
+
+
+if __name__ == '__main__':
+    unittest.main()
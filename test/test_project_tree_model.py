@@ -0,0 +1,127 @@
+"""
+Tests for the widget-free ProjectTreeModel behind the Project Browser (lazy population and filtering).
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gui_components.project_browser import ProjectTreeModel
+
+
+class TestProjectTreeModel(unittest.TestCase):
+
+    def setUp(self):
+        # P
+        # ├── F202 ── 2018 ── walk_01.csv (green), feed_02.csv (red)
+        # │        └── walk_03.csv (yellow)
+        # ├── Empty
+        # └── top_walk.csv (red)
+        self.model = ProjectTreeModel()
+        self.model.add_directory("P", "", "P")
+        self.model.add_directory("F202", "P", "F202")
+        self.model.add_directory("2018", "F202", "2018")
+        self.model.add_file("f1", "2018", "id1", "Walk_01.csv", "green")
+        self.model.add_file("f2", "2018", "id2", "feed_02.csv", "red")
+        self.model.add_file("f3", "F202", "id3", "walk_03.csv", "yellow")
+        self.model.add_directory("Empty", "P", "Empty")
+        self.model.add_file("f4", "P", "id4", "top_walk.csv", "red")
+
+    def test_no_filter_shows_everything(self):
+        self.assertIsNone(self.model.visible_nodes("", "All"))
+        self.assertEqual(self.model.children("P"), ["F202", "Empty", "f4"])
+
+    def test_text_filter_keeps_ancestors(self):
+        visible = self.model.visible_nodes("WALK", "All")
+        self.assertEqual(visible, {"P", "F202", "2018", "f1", "f3", "f4"})
+        self.assertEqual(self.model.children("P", visible), ["F202", "f4"])
+
+    def test_status_filter(self):
+        self.assertEqual(self.model.matching_files("", "Unverified"), {"f2", "f4"})
+        self.assertEqual(self.model.visible_nodes("", "Partial"), {"P", "F202", "f3"})
+        self.assertEqual(self.model.visible_nodes("walk", "Unverified"), {"P", "f4"})
+
+    def test_nothing_matches_keeps_project_root(self):
+        self.assertEqual(self.model.visible_nodes("nomatch", "All"), {"P"})
+
+    def test_color_change_updates_rollups(self):
+        self.assertEqual(self.model.matching_files("", "Verified"), {"f1"})
+        self.model.set_color("f2", "green")
+        self.assertEqual(self.model.matching_files("", "Verified"), {"f1", "f2"})
+        self.assertEqual(self.model.matching_files("", "Unverified"), {"f4"})
+
+    def test_narrowing_matches_full_search(self):
+        self.assertEqual(self.model.matching_files("w", "All"), {"f1", "f3", "f4"})
+        self.assertEqual(self.model.matching_files("wal", "All"), {"f1", "f3", "f4"})
+        self.assertEqual(self.model.matching_files("walk_0", "All"), {"f1", "f3"})
+        self.assertEqual(self.model.matching_files("wa", "All"), {"f1", "f3", "f4"})  # widened again
+
+    def test_remove(self):
+        self.model.remove("F202")
+        self.assertEqual(self.model.children("P"), ["Empty", "f4"])
+        self.assertIsNone(self.model.file_node("id1"))
+        self.assertEqual(self.model.matching_files("", "Unverified"), {"f4"})
+        self.assertEqual(self.model.file_node("id4"), "f4")
+
+    def test_nodes(self):
+        self.assertEqual(self.model.file_node("id3"), "f3")
+        self.assertEqual((self.model.text("f1"), self.model.file_id("f1"), self.model.color("f1")),
+                         ("Walk_01.csv", "id1", "green"))
+        self.assertTrue(self.model.is_file("f1"))
+        self.assertTrue(self.model.has_children("2018"))
+        self.assertFalse(self.model.has_children("Empty"))
+        self.assertEqual(self.model.parent("f1"), "2018")
+
+    def test_windows_paths_match_on_filename(self):
+        self.model.add_file("f5", "P", "id5", "sub\\deep_walk.csv", "red")
+        self.assertIn("f5", self.model.matching_files("deep", "All"))
+        self.assertNotIn("f5", self.model.matching_files("sub", "All"))
+
+    def test_move(self):
+        self.model.move("f2", "Empty")
+        self.assertEqual(self.model.children("Empty"), ["f2"])
+        self.assertEqual(self.model.children("2018"), ["f1"])
+        self.assertEqual(self.model.visible_nodes("", "Unverified"), {"P", "Empty", "f2", "f4"})
+
+    def test_incremental_application_matches_rebuild(self):
+        """Applying only changed parents gives the same tree as rebuilding it for each filter."""
+        rng = random.Random(0)
+        model = ProjectTreeModel()
+        model.add_directory("P", "", "P")
+        directories = ["P"]
+        for i in range(300):
+            parent = rng.choice(directories)
+            if rng.random() < 0.2:
+                model.add_directory(f"d{i}", parent, f"dir{i}")
+                directories.append(f"d{i}")
+            else:
+                model.add_file(f"f{i}", parent, f"id{i}", f"{rng.choice(['walk', 'feed', 'stalk'])}_{i}.csv",
+                               rng.choice(["green", "yellow", "red"]))
+
+        shown = {node: model.children(node) for node in ["", *model._parent]}  # Fake Treeview: node -> children
+        visible = None
+        filters = [("walk", "All"), ("walk_1", "All"), ("walk_1", "Verified"), ("", "Partial"), ("e", "All"),
+                   ("", "All"), ("stalk", "Unverified"), ("zzz", "All"), ("", "All")]
+        for text, status in filters:
+            new_visible = model.visible_nodes(text, status)
+            for parent in model.changed_parents(visible, new_visible):
+                shown[parent] = model.children(parent, new_visible)
+            visible = new_visible
+
+            expected = {node: model.children(node, visible) for node in ["", *model._parent]}
+            reachable = {}
+            stack = [""]
+            while stack:
+                node = stack.pop()
+                reachable[node] = shown[node]
+                stack.extend(shown[node])
+            self.assertEqual(reachable, {node: children for node, children in expected.items()
+                                         if node == "" or visible is None or node in visible},
+                             (text, status))
+
+
+if __name__ == '__main__':
+    unittest.main()
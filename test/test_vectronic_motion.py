@@ -0,0 +1,106 @@
+"""
+Tests for VectronicMotionInput.load_data.
+Verifies the numeric timestamp builder produces the same timestamps as the
+original string-concatenation + pd.to_datetime path.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from input_types.vectronic_motion import VectronicMotionInput
+from test_bebe_output import create_synthetic_csv
+
+
+def legacy_timestamps(raw_df, file_date):
+    """Reference implementation: the original per-row string parse."""
+    ts = pd.to_datetime(
+        raw_df['UTC DateTime'].astype(str) + '.' + raw_df['Milliseconds'].astype(str).str.zfill(3),
+        format='%H:%M:%S.%f'
+    )
+    if file_date is None:
+        return ts
+    return pd.Timestamp(file_date) + (ts - ts.dt.normalize())
+
+
+class TestVectronicMotionTimestamps(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp(prefix="vectronic_test_")
+        self.loader = VectronicMotionInput(frequency=16)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def _write_csv(self, filename, **kwargs):
+        path = os.path.join(self.data_dir, filename)
+        create_synthetic_csv(path, **kwargs)
+        return path
+
+    def test_timestamps_match_legacy_parse(self):
+        """Numeric timestamps should equal the original string-parsed timestamps."""
+        path = self._write_csv("2018-06-08.csv", start_hour=5, start_min=50, num_rows=2000)
+        raw = pd.read_csv(path, skiprows=1)
+
+        df = self.loader.load_data(path)
+
+        expected = legacy_timestamps(raw, date(2018, 6, 8))
+        self.assertEqual(df['Timestamp'].dtype, 'datetime64[ns]')
+        pd.testing.assert_series_equal(df['Timestamp'], expected, check_names=False)
+
+    def test_undated_filename_uses_default_date(self):
+        """A filename without a date should fall back to the time-only default date."""
+        path = self._write_csv("motion.csv", start_hour=23, start_min=59, num_rows=160)
+        raw = pd.read_csv(path, skiprows=1)
+
+        df = self.loader.load_data(path)
+
+        expected = legacy_timestamps(raw, None)
+        pd.testing.assert_series_equal(df['Timestamp'], expected, check_names=False)
+        self.assertEqual(df['Timestamp'].iloc[0].date(), date(1900, 1, 1))
+
+    def test_source_time_columns_are_dropped(self):
+        """'UTC DateTime' and 'Milliseconds' should be replaced by 'Timestamp'."""
+        path = self._write_csv("2018-06-08.csv", num_rows=16)
+        df = self.loader.load_data(path)
+        self.assertNotIn('UTC DateTime', df.columns)
+        self.assertNotIn('Milliseconds', df.columns)
+        self.assertIn('Timestamp', df.columns)
+
+    def test_malformed_time_raises_value_error(self):
+        """A time value that isn't HH:MM:SS should surface as ValueError."""
+        path = os.path.join(self.data_dir, "2018-06-08.csv")
+        with open(path, "w") as f:
+            f.write("DeviceID: 99999\n")
+            f.write("UTC DateTime,Milliseconds,Acc X [g],Acc Y [g],Acc Z [g]\n")
+            f.write("05:50,0,0.1,0.2,0.3\n")
+        with self.assertRaises(ValueError):
+            self.loader.load_data(path)
+
+    def test_out_of_range_time_raises_value_error(self):
+        """Hours past 23 or minutes past 59 are rejected, as by the original %H:%M:%S parse."""
+        for bad_time in ("25:61:00", "24:00:00", "12:60:00", "12:00:62"):
+            with self.subTest(bad_time=bad_time):
+                with self.assertRaises(ValueError):
+                    VectronicMotionInput.build_timestamps(pd.Series(["05:50:00", bad_time]), pd.Series([0, 0]),
+                                                          date(2018, 6, 8))
+
+    def test_edge_times_match_legacy_parse(self):
+        """Unpadded fields and leap seconds are accepted and placed exactly as the original parse did."""
+        raw = pd.DataFrame({'UTC DateTime': ["5:0:7", "23:59:59", "12:00:60", "12:00:61"],
+                            'Milliseconds': [0, 999, 5, 500]})
+        timestamps = VectronicMotionInput.build_timestamps(raw['UTC DateTime'], raw['Milliseconds'], date(2018, 6, 8))
+        pd.testing.assert_series_equal(pd.Series(timestamps), legacy_timestamps(raw, date(2018, 6, 8)),
+                                       check_names=False)
+
+
+if __name__ == "__main__":
+    unittest.main()